@@ -0,0 +1,14 @@
+"""
+ASGI config for adhocracy+.
+
+Only serves the live question event streams (see installation_prod.md), the
+rest of the platform is served by the WSGI application.
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "adhocracy-plus.config.settings")
+
+application = get_asgi_application()
@@ -138,6 +138,7 @@ MIDDLEWARE = (
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.organisations.middleware.CurrentOrganisationMiddleware",
     "apps.users.middleware.SetUserLanguageCookieMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
@@ -266,6 +267,7 @@ THUMBNAIL_ALIASES = {
     "": {
         "heroimage": {"size": (1500, 500), "crop": "smart"},
         "heroimage_preview": {"size": (880, 220), "crop": "smart"},
+        "organisation_heroimage": {"size": (1500, 610), "crop": True},
         "project_thumbnail": {"size": (520, 330), "crop": "smart"},
         "idea_image": {"size": (800, 0), "crop": "scale"},
         "idea_thumbnail": {"size": (240, 240), "crop": "smart"},
@@ -589,12 +591,28 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 # Add insights for project if insight model exists
 INSIGHT_MODEL = "a4_candy_projects.ProjectInsight"
 
+# Push the changes of live questions to the viewers with server-sent events.
+# The event streams have to be served by the ASGI application, as they would
+# block the WSGI workers (see installation_prod.md). Otherwise the viewers
+# poll the questions.
+INTERACTIVE_EVENTS_PUSH = False
+
 # Celery configuration
 CELERY_BROKER_URL = "redis://localhost:6379"
 CELERY_RESULT_BACKEND = "redis://localhost:6379"
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_RESULT_EXTENDED = True
 
+# The cached data is invalidated by signals sent in the web and the celery
+# processes, so all of them have to share the cache. Set CACHE_LOCATION in
+# the environment or override CACHES in local.py to use another redis.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_LOCATION", "redis://localhost:6379/1"),
+    }
+}
+
 # CKEditor5 config
 CKEDITOR_5_FILE_STORAGE = "adhocracy4.ckeditor.storage.CustomStorage"
 CKEDITOR_5_PATH_FROM_USERNAME = True
@@ -38,6 +38,8 @@ if os.getenv("DATABASE") == "postgresql":
     }
 
 CELERY_TASK_ALWAYS_EAGER = True
+# the tasks run in the web process, so a local cache is shared with them
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
 # The local.py import happens at the end of this file so that it can overwrite
 # any defaults in dev.py.
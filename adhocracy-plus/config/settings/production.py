@@ -48,4 +48,8 @@ CELERY_BEAT_SCHEDULE = {
         "task": "send_upcoming_event_notifications",
         "schedule": timedelta(days=3),
     },
+    "resume-newsletters": {
+        "task": "resume_newsletters",
+        "schedule": timedelta(minutes=15),
+    },
 }
@@ -8,6 +8,7 @@ ACCOUNT_EMAIL_VERIFICATION = "optional"
 SITE_ID = 1
 
 CAPTCHA_TEST_ACCEPTED_ANSWER = "testpass"
+CAPTCHA_VERIFY_BACKEND = "apps.captcha.utils.StubVerifier"
 CAPTCHA_URL = "https://captcheck.netsyms.com/api.php"
 WAGTAILADMIN_BASE_URL = "http://localhost:8004"
 
@@ -23,13 +23,16 @@ from adhocracy4.follows.api import FollowViewSet
 from adhocracy4.ratings.api import RatingViewSet
 from adhocracy4.reports.api import ReportViewSet
 from apps.account.api import AccountViewSet
+from apps.budgeting.api import ProposalGeoJSONViewSet
 from apps.contrib import views as contrib_views
 from apps.contrib.sitemaps import static_sitemap_index
 from apps.documents.api import DocumentViewSet
 from apps.ideas.api import IdeaViewSet
 from apps.interactiveevents.api import LikesViewSet
 from apps.interactiveevents.api import LiveQuestionViewSet
+from apps.interactiveevents.api import question_events
 from apps.interactiveevents.routers import LikesDefaultRouter
+from apps.mapideas.api import MapIdeaGeoJSONViewSet
 from apps.moderatorfeedback.api import CommentWithFeedbackViewSet
 from apps.moderatorfeedback.api import ModeratorCommentFeedbackViewSet
 from apps.moderatorremark.api import ModeratorRemarkViewSet
@@ -66,6 +69,12 @@ module_router.register(
     basename="interactiveevents",
 )
 module_router.register(r"ideas", IdeaViewSet, basename="ideas")
+module_router.register(
+    r"mapideas-geojson", MapIdeaGeoJSONViewSet, basename="mapideas-geojson"
+)
+module_router.register(
+    r"proposals-geojson", ProposalGeoJSONViewSet, basename="proposals-geojson"
+)
 
 likes_router = LikesDefaultRouter()
 likes_router.register(r"likes", LikesViewSet, basename="likes")
@@ -105,6 +114,11 @@ urlpatterns = [
     path("i18n/setlang/", set_language_overwrite, name="set_language"),
     path("i18n/", include(i18n)),
     # API urls
+    path(
+        "api/modules/<int:module_pk>/interactiveevents/events/",
+        question_events,
+        name="interactiveevents-events",
+    ),
     path("api/", include(ct_router.urls)),
     path("api/", include(module_router.urls)),
     path("api/", include(orga_router.urls)),
@@ -113,6 +127,7 @@ urlpatterns = [
     path("api/", include(moderation_router.urls)),
     path("api/", include(router.urls)),
     re_path(r"^api/account/", AccountViewSet.as_view(), name="api-account"),
+    path("api/map-presets/", include("apps.maps.urls")),
     # API JWT authentication
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_jwt"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
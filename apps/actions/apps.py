@@ -28,3 +28,5 @@ class Config(AppConfig):
         configure_icon("fas fa-pencil", verb=Verbs.UPDATE)
         configure_icon("fas fa-flag", verb=Verbs.START)
         configure_icon("fas fa-clock", verb=Verbs.SCHEDULE)
+
+        from . import signals  # noqa
@@ -1,7 +1,7 @@
 from django.utils.translation import gettext_lazy as _
 from wagtail import blocks
 
-from adhocracy4.actions.models import Action
+from . import cache
 
 
 class PlatformActivityBlock(blocks.StructBlock):
@@ -11,9 +11,7 @@ class PlatformActivityBlock(blocks.StructBlock):
     def get_context(self, value, parent_context=None):
         context = super().get_context(value, parent_context=parent_context)
         block = context["self"]
-        context["actions"] = Action.objects.filter_public().exclude_updates()[
-            : block["count"]
-        ]
+        context["actions"] = cache.get_public_actions(block["count"])
         return context
 
     class Meta:
@@ -0,0 +1,54 @@
+"""Rolling cache of the latest public actions.
+
+The platform activity block showed the latest public actions, which were
+queried with their projects, actors and objects on every render. The latest
+actions are kept in the cache with these relations loaded. A new public
+action is put in front of the cached list when it is created (see
+signals.py), deleting actions or changing projects drops the list.
+"""
+
+from django.core.cache import cache
+
+from adhocracy4.actions.models import Action
+
+PUBLIC_ACTIONS_KEY = "public_actions"
+PUBLIC_ACTIONS_SIZE = 20
+PUBLIC_ACTIONS_TIMEOUT = 60 * 10
+
+
+def _public_actions():
+    return (
+        Action.objects.filter_public()
+        .exclude_updates()
+        .select_related("actor", "project")
+        .prefetch_related("obj")
+    )
+
+
+def invalidate_public_actions():
+    cache.delete(PUBLIC_ACTIONS_KEY)
+
+
+def get_public_actions(count):
+    """Return the latest count public actions, except updates."""
+    if count > PUBLIC_ACTIONS_SIZE:
+        return list(_public_actions()[:count])
+    actions = cache.get_or_set(
+        PUBLIC_ACTIONS_KEY,
+        lambda: list(_public_actions()[:PUBLIC_ACTIONS_SIZE]),
+        PUBLIC_ACTIONS_TIMEOUT,
+    )
+    return actions[:count]
+
+
+def add_public_action(action_id):
+    """Put a new action in front of the cached actions if it is public."""
+    actions = cache.get(PUBLIC_ACTIONS_KEY)
+    if actions is None:
+        # loaded with the new action on the next render
+        return
+    action = _public_actions().filter(pk=action_id).first()
+    if action is None:
+        return
+    actions = [action] + [other for other in actions if other.pk != action_id]
+    cache.set(PUBLIC_ACTIONS_KEY, actions[:PUBLIC_ACTIONS_SIZE], PUBLIC_ACTIONS_TIMEOUT)
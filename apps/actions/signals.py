@@ -0,0 +1,22 @@
+from django.db.models import signals
+from django.dispatch import receiver
+
+from adhocracy4.actions.models import Action
+from adhocracy4.projects.models import Project
+
+from . import cache
+
+
+@receiver(signals.post_save, sender=Action)
+def add_public_action(sender, instance, created, **kwargs):
+    if created:
+        cache.add_public_action(instance.pk)
+    else:
+        cache.invalidate_public_actions()
+
+
+@receiver(signals.post_delete, sender=Action)
+@receiver(signals.post_save, sender=Project)
+@receiver(signals.post_delete, sender=Project)
+def invalidate_public_actions(sender, instance, **kwargs):
+    cache.invalidate_public_actions()
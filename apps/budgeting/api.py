@@ -0,0 +1,18 @@
+from apps.mapideas.api import AbstractMapIdeaGeoJSONViewSet
+
+from .models import Proposal
+
+
+class ProposalGeoJSONViewSet(AbstractMapIdeaGeoJSONViewSet):
+    model = Proposal
+
+    def get_queryset(self):
+        proposals = super().get_queryset()
+        # like the list filterset, archived proposals are only hidden if the
+        # filter is missing, an empty filter shows all proposals
+        is_archived = self.request.query_params.get("is_archived", "false")
+        if is_archived == "false":
+            proposals = proposals.filter(is_archived=False)
+        elif is_archived == "true":
+            proposals = proposals.filter(is_archived=True)
+        return proposals
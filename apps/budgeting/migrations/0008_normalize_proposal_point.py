@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from apps.maps.geometry import normalize_points
+
+
+def normalize_proposal_points(apps, schema_editor):
+    normalize_points(apps.get_model("a4_candy_budgeting", "Proposal"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("a4_candy_budgeting", "0007_proposal_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_proposal_points, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,4 @@
-import re
-
 import django_filters
-from django.core.paginator import EmptyPage
-from django.core.paginator import Paginator
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -13,6 +9,7 @@ from adhocracy4.filters.widgets import DropdownLinkWidget
 from adhocracy4.projects.mixins import DisplayProjectOrModuleMixin
 from apps.contrib.widgets import AplusOrderingWidget
 from apps.ideas import views as idea_views
+from apps.mapideas import views as mapidea_views
 from apps.organisations.mixins import UserFormViewMixin
 
 from . import forms
@@ -52,32 +49,12 @@ class ProposalFilterSet(a4_filters.DefaultsFilterSet):
         fields = ["category", "is_archived"]
 
 
-class ProposalListView(idea_views.AbstractIdeaListView, DisplayProjectOrModuleMixin):
+class ProposalListView(
+    mapidea_views.AbstractMapIdeaListView, DisplayProjectOrModuleMixin
+):
     model = models.Proposal
     filter_set = ProposalFilterSet
-    paginate_by = 0  # Maps need all ideas, pagination is handled in get_context_data
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        ua = self.request.headers.get("User-Agent", "")
-        is_mobile = bool(re.search(r"Mobi|Android|iPhone|iPod|Windows Phone", ua, re.I))
-        page_size = int(self.request.GET.get("page_size", 15 if is_mobile else 8))
-        self.mode = self.request.GET.get("mode", "map")
-        object_list = context.get("object_list", [])
-
-        if page_size > 0:
-            paginator = Paginator(object_list, page_size)
-            page = int(self.request.GET.get("page", 1))
-            try:
-                paginated_list = paginator.page(page)
-            except EmptyPage:
-                paginated_list = paginator.page(paginator.num_pages)
-        else:
-            paginated_list = object_list
-        context["paginated_list"] = paginated_list
-        context["page_obj"] = paginated_list  # page_obj ist die paginierte Liste selbst
-        context["is_paginated"] = paginator.num_pages > 1 if page_size > 0 else False
-        return context
+    geojson_url_name = "proposals-geojson-list"
 
 
 class ProposalDetailView(idea_views.AbstractIdeaDetailView):
@@ -1,25 +1,96 @@
+import functools
 import logging
+import time
 
 import requests
 from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BACKEND = "apps.captcha.utils.ProsopoVerifier"
+DEFAULT_URL = "https://api.prosopo.io/siteverify"
+# connect and read timeout in seconds
+DEFAULT_TIMEOUT = (2, 5)
+DEFAULT_POOL_SIZE = 10
+# slower verifications are logged as warnings
+SLOW_VERIFICATION = 1
+
+
+class ProsopoVerifier:
+    """Verify tokens with the Prosopo server.
+
+    The connections to the server are reused, a verification fails if the
+    server does not answer within the timeout.
+    """
+
+    def __init__(self):
+        self.url = getattr(settings, "PROSOPO_VERIFY_URL", DEFAULT_URL)
+        self.timeout = getattr(settings, "CAPTCHA_VERIFY_TIMEOUT", DEFAULT_TIMEOUT)
+        pool_size = getattr(settings, "CAPTCHA_VERIFY_POOL_SIZE", DEFAULT_POOL_SIZE)
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        )
+
+    def verify(self, token):
+        secret_key = getattr(settings, "PROSOPO_SECRET_KEY", "")
+        if not secret_key:
+            logger.error("PROSOPO_SECRET_KEY not configured")
+            return False
+
+        data = {"secret": secret_key, "token": token}
+        try:
+            response = self.session.post(self.url, json=data, timeout=self.timeout)
+            response.raise_for_status()
+            return bool(response.json().get("verified", False))
+        except (requests.RequestException, ValueError) as e:
+            logger.warning("Captcha verification failed: %s", e)
+            return False
+
+
+class StubVerifier:
+    """Verify tokens locally, for tests and load tests.
+
+    Accepts tokens starting with CAPTCHA_TEST_ACCEPTED_ANSWER, e.g.
+    "testpass:1".
+    """
+
+    def verify(self, token):
+        accepted = getattr(settings, "CAPTCHA_TEST_ACCEPTED_ANSWER", "")
+        return bool(accepted) and token.split(":")[0] == accepted
+
+
+@functools.lru_cache
+def _get_verifier(backend):
+    return import_string(backend)()
+
+
+def get_verifier():
+    """Return the verifier of the configured backend.
+
+    The verifier and its connection pool are shared in the process.
+    """
+    return _get_verifier(getattr(settings, "CAPTCHA_VERIFY_BACKEND", DEFAULT_BACKEND))
+
 
 def verify_token(token):
-    url = "https://api.prosopo.io/siteverify"
+    """Verify the captcha token.
 
+    Every call asks the verifier, a token is never accepted from a cache.
+    """
     if not token:
         logger.warning("Empty token provided for verification")
         return False
 
-    secret_key = getattr(settings, "PROSOPO_SECRET_KEY", "")
-    if not secret_key:
-        logger.error("PROSOPO_SECRET_KEY not configured")
-        return False
-
-    data = {"secret": secret_key, "token": token}
-    response = requests.post(url, json=data)
-    return response.json().get(
-        "verified", False
-    )  # Return verified field, default to False
+    start = time.perf_counter()
+    verified = get_verifier().verify(token)
+    duration = time.perf_counter() - start
+    logger.log(
+        logging.WARNING if duration > SLOW_VERIFICATION else logging.INFO,
+        "Captcha verification took %.3fs, verified: %s",
+        duration,
+        verified,
+    )
+    return verified
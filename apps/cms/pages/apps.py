@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class Config(AppConfig):
     name = "apps.cms.pages"
     label = "a4_candy_cms_pages"
+
+    def ready(self):
+        from . import signals  # noqa
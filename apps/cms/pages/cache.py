@@ -0,0 +1,39 @@
+"""Fragment cache of the home page streamfield.
+
+The blocks of the home page change rarely but were rendered on every
+request, including the news and use case blocks which look up their pages.
+The rendered streamfield is cached per page and language. Publishing,
+unpublishing or moving any page replaces the shared version, which is part
+of every key, as the blocks show other pages as well.
+"""
+
+import uuid
+
+from django.core.cache import cache
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+HOMEPAGE_VERSION_KEY = "homepage_version"
+HOMEPAGE_FRAGMENT_KEY = "homepage_streamfield_{page_id}_{version}_{language}"
+HOMEPAGE_FRAGMENT_TIMEOUT = 60 * 60
+
+
+def invalidate_homepage():
+    cache.set(HOMEPAGE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def _get_homepage_version():
+    cache.add(HOMEPAGE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    return cache.get(HOMEPAGE_VERSION_KEY)
+
+
+def get_streamfield_fragment(page):
+    """Return the rendered streamfield of the home page."""
+    key = HOMEPAGE_FRAGMENT_KEY.format(
+        page_id=page.pk, version=_get_homepage_version(), language=get_language()
+    )
+    return mark_safe(
+        cache.get_or_set(
+            key, lambda: str(page.body_streamfield), HOMEPAGE_FRAGMENT_TIMEOUT
+        )
+    )
@@ -19,6 +19,8 @@ from apps.cms.use_cases.blocks import UseCaseBlock
 from apps.contrib.translations import TranslatedField
 from apps.contrib.translations import TranslatedFieldLegal
 
+from . import cache
+
 
 class HomePage(Page):
     image_1 = models.ForeignKey(
@@ -134,6 +136,15 @@ class HomePage(Page):
     def form(self):
         return self.form_page.get_form()
 
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        if getattr(request, "is_preview", False):
+            # previews show the unpublished draft
+            context["body_streamfield"] = self.body_streamfield
+        else:
+            context["body_streamfield"] = cache.get_streamfield_fragment(self)
+        return context
+
     @property
     def random_image(self):
         image_numbers = [i for i in range(1, 6) if getattr(self, "image_{}".format(i))]
@@ -0,0 +1,13 @@
+from django.dispatch import receiver
+from wagtail.signals import page_published
+from wagtail.signals import page_unpublished
+from wagtail.signals import post_page_move
+
+from . import cache
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_homepage(sender, **kwargs):
+    cache.invalidate_homepage()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class Config(AppConfig):
     name = "apps.cms.settings"
     label = "a4_candy_cms_settings"
+
+    def ready(self):
+        from . import signals  # noqa
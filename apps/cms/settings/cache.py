@@ -0,0 +1,94 @@
+"""In-process cache of the important pages of the default site.
+
+The important page urls are used in form help texts, widgets and emails,
+which looked up the default site, its settings and every page each time.
+The urls and live states of the pages are kept in memory per process.
+Publishing, unpublishing, moving or deleting a page and saving the settings
+or a site replace a version in the shared cache, so every process reloads
+the pages on the next lookup. Changes that send none of these signals are
+picked up once the copy is older than IMPORTANT_PAGES_MAX_AGE.
+"""
+
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+from wagtail.models import Page
+from wagtail.models import Site
+
+from .models import ImportantPages
+
+IMPORTANT_PAGES_VERSION_KEY = "important_pages_version"
+# seconds the in-process copy is used at most
+IMPORTANT_PAGES_MAX_AGE = 60
+
+_important_pages = None
+_important_pages_version = None
+_important_pages_loaded = 0
+_important_pages_lock = threading.Lock()
+
+
+def invalidate_important_pages():
+    global _important_pages, _important_pages_version
+    version = uuid.uuid4().hex
+    cache.set(IMPORTANT_PAGES_VERSION_KEY, version, timeout=None)
+    with _important_pages_lock:
+        _important_pages = None
+        _important_pages_version = version
+
+
+def _get_important_pages_version():
+    version = cache.get(IMPORTANT_PAGES_VERSION_KEY)
+    if version is None:
+        cache.add(IMPORTANT_PAGES_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(IMPORTANT_PAGES_VERSION_KEY)
+    return version
+
+
+def _get_important_page_names():
+    # not computed on import, this module is imported while the models of
+    # other apps are loaded and the fields of a model are not ready then
+    return [
+        field.name
+        for field in ImportantPages._meta.get_fields()
+        if field.many_to_one and field.related_model is Page
+    ]
+
+
+def _load_important_pages():
+    site = Site.objects.filter(is_default_site=True).first()
+    if site is None:
+        return {}
+    important_pages = ImportantPages.for_site(site)
+    pages = {}
+    for name in _get_important_page_names():
+        page = getattr(important_pages, name)
+        if page:
+            pages[name] = (page.url, page.live)
+    return pages
+
+
+def _is_current(version):
+    return (
+        _important_pages is not None
+        and version == _important_pages_version
+        and time.monotonic() - _important_pages_loaded < IMPORTANT_PAGES_MAX_AGE
+    )
+
+
+def get_important_pages():
+    """Return a dict of the url and live state of the set important pages."""
+    global _important_pages, _important_pages_version, _important_pages_loaded
+    version = _get_important_pages_version()
+    with _important_pages_lock:
+        if _is_current(version):
+            return _important_pages
+
+    pages = _load_important_pages()
+    with _important_pages_lock:
+        if not _is_current(version):
+            _important_pages = pages
+            _important_pages_version = version
+            _important_pages_loaded = time.monotonic()
+    return pages
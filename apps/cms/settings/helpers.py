@@ -1,22 +1,16 @@
 from django.conf import settings
 from django.utils.html import mark_safe
 from django.utils.translation import gettext_lazy as _
-from wagtail.models import Site
 
-from apps.cms.settings.models import ImportantPages
+from apps.cms.settings.cache import get_important_pages
 
 LINK_TEXT = _("Please look {}here{} for more information.")
 
 
 def add_link_to_helptext(help_text, important_page_name, link_text=None):
-    site = Site.objects.filter(is_default_site=True).first()
-    important_pages = ImportantPages.for_site(site)
-
-    if (
-        getattr(important_pages, important_page_name)
-        and getattr(important_pages, important_page_name).live
-    ):
-        url = getattr(important_pages, important_page_name).url
+    url, live = get_important_pages().get(important_page_name, (None, False))
+
+    if url and live:
         if not link_text:
             link_text = LINK_TEXT
         link_text = link_text.format('<a href="' + url + '" target="_blank">', "</a>")
@@ -37,8 +31,5 @@ def add_email_link_to_helptext(help_text, link_text=None):
 
 
 def get_important_page_url(important_page_name):
-    site = Site.objects.filter(is_default_site=True).first()
-    important_pages = ImportantPages.for_site(site)
-    if getattr(important_pages, important_page_name):
-        return getattr(important_pages, important_page_name).url
-    return None
+    url, live = get_important_pages().get(important_page_name, (None, False))
+    return url
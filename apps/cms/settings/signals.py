@@ -0,0 +1,22 @@
+from django.db.models import signals
+from django.dispatch import receiver
+from wagtail.models import Page
+from wagtail.models import Site
+from wagtail.signals import page_published
+from wagtail.signals import page_unpublished
+from wagtail.signals import post_page_move
+
+from . import cache
+from .models import ImportantPages
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+@receiver(signals.post_delete, sender=Page)
+@receiver(signals.post_delete, sender=ImportantPages)
+@receiver(signals.post_save, sender=ImportantPages)
+@receiver(signals.post_delete, sender=Site)
+@receiver(signals.post_save, sender=Site)
+def invalidate_important_pages(sender, **kwargs):
+    cache.invalidate_important_pages()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class Config(AppConfig):
     name = "apps.contrib"
     label = "a4_candy_contrib"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,219 @@
+"""Comment and rating counters stored on the items.
+
+Counting the comments and ratings of every item in a list needs a GROUP BY
+over the generic relations. Items using CountedItem store the counts in
+columns instead. The columns are updated on every comment and rating change
+(see signals.py), saving an item leaves them out. They can be recalculated
+with the repair_item_counters command.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db import transaction
+from django.db.models import F
+from django.db.models import Value
+from django.db.models.functions import Cast
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Greatest
+
+from adhocracy4.comments.models import Comment
+from adhocracy4.models import query
+
+POSITIVE_RATING = 1
+NEGATIVE_RATING = -1
+
+COUNTER_FIELDS = {
+    "comment_count": "cached_comment_count",
+    "positive_rating_count": "cached_positive_rating_count",
+    "negative_rating_count": "cached_negative_rating_count",
+}
+
+
+class CountedItem(models.Model):
+    cached_comment_count = models.PositiveIntegerField(
+        default=0, editable=False, db_index=True
+    )
+    cached_positive_rating_count = models.PositiveIntegerField(
+        default=0, editable=False, db_index=True
+    )
+    cached_negative_rating_count = models.PositiveIntegerField(
+        default=0, editable=False
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, update_fields=None, *args, **kwargs):
+        if update_fields is None:
+            update_fields = get_update_fields(self, COUNTER_FIELDS.values())
+        super().save(update_fields=update_fields, *args, **kwargs)
+
+
+def get_update_fields(instance, counter_fields):
+    """Return the fields to save for an existing instance without the counters.
+
+    The counters are only changed by atomic updates, saving the values loaded
+    with the instance would overwrite concurrent changes. Returns None for
+    new instances, they are inserted with all fields.
+    """
+    if instance._state.adding or instance.pk is None:
+        return None
+    deferred = instance.get_deferred_fields()
+    return [
+        field.name
+        for field in instance._meta.concrete_fields
+        if not field.primary_key
+        and field.name not in counter_fields
+        and field.attname not in deferred
+    ]
+
+
+class CountedQuerySetMixin:
+    """Annotate the counts from the counter columns.
+
+    The annotations keep the names used by the adhocracy4 querysets, so
+    templates, serializers and ordering filters work unchanged.
+    """
+
+    def annotate_comment_count(self):
+        return self.annotate(comment_count=F("cached_comment_count"))
+
+    def annotate_positive_rating_count(self):
+        return self.annotate(positive_rating_count=F("cached_positive_rating_count"))
+
+    def annotate_negative_rating_count(self):
+        return self.annotate(negative_rating_count=F("cached_negative_rating_count"))
+
+
+def _get_counted_model(content_type_id):
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    if model is not None and issubclass(model, CountedItem):
+        return model
+    return None
+
+
+def update_counters(content_type_id, object_pk, **deltas):
+    """Atomically change the counters of an item by the given deltas.
+
+    Changes to objects which are not counted items are ignored.
+    """
+    model = _get_counted_model(content_type_id)
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if model is None or not deltas:
+        return
+    model.objects.filter(pk=object_pk).update(
+        **{
+            field: Greatest(F(field) + delta, Value(0))
+            for field, delta in deltas.items()
+        }
+    )
+
+
+def get_comment_target(comment):
+    """Return content type id and pk of the item a comment belongs to.
+
+    Replies count for the item of the comment they reply to.
+    """
+    comment_content_type_id = ContentType.objects.get_for_model(Comment).id
+    target = (comment.content_type_id, comment.object_pk)
+    while target[0] == comment_content_type_id:
+        parent = (
+            Comment.objects.filter(pk=target[1])
+            .values_list("content_type_id", "object_pk")
+            .first()
+        )
+        if parent is None:
+            return None
+        target = parent
+    return target
+
+
+def get_rating_deltas(previous_value, value):
+    deltas = {
+        "cached_positive_rating_count": 0,
+        "cached_negative_rating_count": 0,
+    }
+    for rating_value, sign in ((previous_value, -1), (value, 1)):
+        if rating_value == POSITIVE_RATING:
+            deltas["cached_positive_rating_count"] += sign
+        elif rating_value == NEGATIVE_RATING:
+            deltas["cached_negative_rating_count"] += sign
+    return deltas
+
+
+def repair_counters(model):
+    """Recalculate the counters of all items of the model.
+
+    Returns the number of items whose counters were wrong.
+    """
+    items = query.CommentableQuerySet.annotate_comment_count(model.objects.all())
+    items = query.RateableQuerySet.annotate_positive_rating_count(items)
+    items = query.RateableQuerySet.annotate_negative_rating_count(items)
+    fields = list(COUNTER_FIELDS.items())
+    repaired = 0
+    with transaction.atomic():
+        for values in items.values("pk", *COUNTER_FIELDS, *COUNTER_FIELDS.values()):
+            changes = {
+                field: values[annotation] or 0
+                for annotation, field in fields
+                if values[field] != (values[annotation] or 0)
+            }
+            if changes:
+                model.objects.filter(pk=values["pk"]).update(**changes)
+                repaired += 1
+    return repaired
+
+
+def _count(queryset):
+    return Coalesce(
+        models.Subquery(
+            queryset.order_by()
+            .values("content_type")
+            .annotate(count=models.Count("pk"))
+            .values("count"),
+            output_field=models.IntegerField(),
+        ),
+        0,
+    )
+
+
+def initialize_counters(apps, app_label, model_name):
+    """Calculate the counters of all items of a model in one UPDATE.
+
+    Used by the data migrations adding the counter columns, so it only uses
+    the historical models passed as apps.
+    """
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Comment = apps.get_model("a4comments", "Comment")
+    Rating = apps.get_model("a4ratings", "Rating")
+    model = apps.get_model(app_label, model_name)
+
+    item_type = ContentType.objects.filter(
+        app_label=app_label, model=model_name.lower()
+    ).first()
+    if item_type is None:
+        # no item has been created yet
+        return
+    comment_type = ContentType.objects.filter(
+        app_label="a4comments", model="comment"
+    ).first()
+
+    # comments store the pk of their object as text
+    item_pk = Cast(models.OuterRef("pk"), models.CharField())
+    comments = Comment.objects.filter(content_type=item_type, object_pk=item_pk)
+    # replies count for the item of the comment they reply to
+    replies = Comment.objects.filter(
+        content_type=comment_type,
+        object_pk__in=Comment.objects.filter(
+            content_type=item_type,
+            object_pk=Cast(models.OuterRef(models.OuterRef("pk")), models.CharField()),
+        ).values(comment_pk=Cast("pk", models.CharField())),
+    )
+    ratings = Rating.objects.filter(
+        content_type=item_type, object_pk=models.OuterRef("pk")
+    )
+    model.objects.update(
+        cached_comment_count=_count(comments) + _count(replies),
+        cached_positive_rating_count=_count(ratings.filter(value=POSITIVE_RATING)),
+        cached_negative_rating_count=_count(ratings.filter(value=NEGATIVE_RATING)),
+    )
@@ -0,0 +1,20 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.contrib.counters import CountedItem
+from apps.contrib.counters import repair_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the comment and rating counters stored on ideas, "
+        "map ideas, proposals and topics."
+    )
+
+    def handle(self, *args, **options):
+        for model in apps.get_models():
+            if issubclass(model, CountedItem):
+                repaired = repair_counters(model)
+                self.stdout.write(
+                    "{}: repaired {} items".format(model._meta.label, repaired)
+                )
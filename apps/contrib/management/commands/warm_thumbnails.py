@@ -0,0 +1,87 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connections
+from django.db.models import Q
+
+from apps.contrib import thumbnails
+
+
+def _init_worker():
+    django.setup()
+    # forked workers must not share the connections of the parent
+    connections.close_all()
+
+
+def _generate(model_label, pk):
+    obj = apps.get_model(model_label).objects.filter(pk=pk).first()
+    if obj is None:
+        return {}
+    return thumbnails.generate_object_thumbnails(obj)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the thumbnails of project, idea, proposal, topic and "
+        "organisation images, so they are not generated on the first page view. "
+        "Only the aliases the templates use for an image field are generated "
+        "(see THUMBNAIL_FIELDS in apps/contrib/thumbnails.py), the other "
+        "aliases are skipped on purpose."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes generating thumbnails",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Only warm the thumbnails of this model, e.g. a4projects.Project",
+        )
+
+    def handle(self, *args, **options):
+        labels = options["models"] or list(thumbnails.THUMBNAIL_FIELDS)
+        unknown = set(labels) - set(thumbnails.THUMBNAIL_FIELDS)
+        if unknown:
+            raise CommandError("No thumbnails for {}".format(", ".join(unknown)))
+
+        jobs = []
+        for label in labels:
+            model = apps.get_model(label)
+            with_image = Q()
+            for field in thumbnails.get_fields(model):
+                with_image |= Q(**{"{}__gt".format(field): ""})
+            pks = model.objects.filter(with_image).values_list("pk", flat=True)
+            jobs.extend((label, pk) for pk in pks.iterator())
+
+        start = time.monotonic()
+        connections.close_all()
+        durations = {}
+        with ProcessPoolExecutor(
+            max_workers=max(options["processes"], 1), initializer=_init_worker
+        ) as executor:
+            results = executor.map(_generate, *zip(*jobs)) if jobs else []
+            for result in results:
+                for alias, duration in result.items():
+                    durations.setdefault(alias, []).append(duration)
+
+        for alias, times in sorted(durations.items()):
+            self.stdout.write(
+                "{}: {} thumbnails, {:.3f}s average, {:.3f}s max".format(
+                    alias, len(times), sum(times) / len(times), max(times)
+                )
+            )
+        self.stdout.write(
+            "Warmed thumbnails of {} objects in {:.2f}s".format(
+                len(jobs), time.monotonic() - start
+            )
+        )
@@ -1,8 +1,19 @@
+import functools
+
+from django.db import transaction
 from django.db.models.signals import m2m_changed
 from django.db.models.signals import post_delete
+from django.db.models.signals import post_init
 from django.db.models.signals import post_save
 from django.db.models.signals import pre_delete
 from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from adhocracy4.comments.models import Comment
+from adhocracy4.ratings.models import Rating
+
+from . import counters
+from . import thumbnails
 
 signals = [
     pre_save,
@@ -36,3 +47,91 @@ def connect_proxy_signals(from_model, to_model):
             sender=from_model,
             weak=False,
         )
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, **kwargs):
+    if created:
+        target = counters.get_comment_target(instance)
+        if target:
+            counters.update_counters(*target, cached_comment_count=1)
+
+
+@receiver(pre_delete, sender=Comment)
+def get_deleted_comment_target(sender, instance, **kwargs):
+    # replies are deleted together with their parent, so the item has to be
+    # looked up before anything is deleted
+    instance._counter_target = counters.get_comment_target(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    target = getattr(instance, "_counter_target", None)
+    if target:
+        counters.update_counters(*target, cached_comment_count=-1)
+
+
+@receiver(pre_save, sender=Rating)
+def get_previous_rating_value(sender, instance, **kwargs):
+    instance._previous_value = None
+    if instance.pk:
+        instance._previous_value = (
+            Rating.objects.filter(pk=instance.pk)
+            .values_list("value", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Rating)
+def update_rating_counts(sender, instance, **kwargs):
+    counters.update_counters(
+        instance.content_type_id,
+        instance.object_pk,
+        **counters.get_rating_deltas(
+            getattr(instance, "_previous_value", None), instance.value
+        ),
+    )
+
+
+@receiver(post_delete, sender=Rating)
+def decrease_rating_counts(sender, instance, **kwargs):
+    counters.update_counters(
+        instance.content_type_id,
+        instance.object_pk,
+        **counters.get_rating_deltas(instance.value, None),
+    )
+
+
+def _get_image_names(instance):
+    # read the raw values, the file descriptor would wrap them in field files
+    # and deferred fields are left out instead of being loaded
+    names = {}
+    for field in thumbnails.get_fields(type(instance)):
+        if field in instance.__dict__:
+            value = instance.__dict__[field]
+            names[field] = getattr(value, "name", value) or ""
+    return names
+
+
+def track_image_names(sender, instance, **kwargs):
+    instance._previous_image_names = _get_image_names(instance)
+
+
+def generate_changed_thumbnails(sender, instance, created, **kwargs):
+    previous = {}
+    if not created:
+        previous = getattr(instance, "_previous_image_names", {})
+    current = _get_image_names(instance)
+    changed = [
+        field for field, name in current.items() if name and name != previous.get(field)
+    ]
+    if changed:
+        transaction.on_commit(
+            functools.partial(thumbnails.schedule_thumbnails, instance, changed)
+        )
+    instance._previous_image_names = current
+
+
+for model in thumbnails.get_models():
+    post_init.connect(track_image_names, sender=model)
+    post_save.connect(generate_changed_thumbnails, sender=model)
@@ -0,0 +1,15 @@
+from celery import shared_task
+from django.apps import apps
+
+from . import thumbnails
+
+
+@shared_task(name="generate_thumbnails")
+def generate_thumbnails_task(model_label, pk, field_names=None):
+    """
+    Generate the thumbnails of the image fields of an object
+    """
+    obj = apps.get_model(model_label).objects.filter(pk=pk).first()
+    if obj is None:
+        return {}
+    return thumbnails.generate_object_thumbnails(obj, field_names)
@@ -1,3 +1,4 @@
+import logging
 import re
 import unicodedata
 
@@ -10,10 +11,29 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.safestring import mark_safe
+from easy_thumbnails.exceptions import EasyThumbnailsError
+
+from apps.contrib import thumbnails
+
+logger = logging.getLogger(__name__)
 
 register = template.Library()
 
 
+@register.filter
+def prepared_thumbnail_url(image, alias):
+    """Return the url of the thumbnail, preferably one generated in advance.
+
+    Unlike the thumbnail_url filter this only generates the thumbnail
+    during the request if the task has not generated it yet.
+    """
+    try:
+        return thumbnails.get_thumbnail_url(image, alias)
+    except (OSError, EasyThumbnailsError):
+        logger.exception("could not get the %s thumbnail of %s", alias, image)
+        return ""
+
+
 @register.simple_tag
 def include_template_string(template, **kwargs):
     rendered_template = render_to_string(template, kwargs)
@@ -0,0 +1,110 @@
+"""Thumbnails generated in the background.
+
+easy_thumbnails generates a thumbnail when its url is first requested, so the
+first page view after an upload pays for the smart crop of every alias shown
+on the page. The aliases used for the image fields in THUMBNAIL_FIELDS are
+generated by a celery task when an image changes instead (see signals.py)
+and can be generated in bulk with the warm_thumbnails command.
+
+Only the aliases the templates use for a field are listed, generating every
+alias of THUMBNAIL_ALIASES for every image would mostly create thumbnails
+that are never shown. Other aliases, and thumbnails whose task has not run
+yet, are generated when they are first requested, as before.
+"""
+
+import logging
+import time
+
+from django.apps import apps
+from easy_thumbnails.alias import aliases
+from easy_thumbnails.files import get_thumbnailer
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_FIELDS = {
+    "a4projects.Project": {
+        "image": ["heroimage", "heroimage_preview", "project_thumbnail"],
+        "tile_image": ["project_thumbnail"],
+    },
+    "a4_candy_ideas.Idea": {"image": ["item_image"]},
+    "a4_candy_mapideas.MapIdea": {"image": ["item_image"]},
+    "a4_candy_budgeting.Proposal": {"image": ["item_image"]},
+    "a4_candy_topicprio.Topic": {"image": ["item_image"]},
+    "a4_candy_organisations.Organisation": {"image": ["organisation_heroimage"]},
+}
+
+
+def get_models():
+    return [apps.get_model(label) for label in THUMBNAIL_FIELDS]
+
+
+def get_fields(model):
+    return THUMBNAIL_FIELDS.get(model._meta.label, {})
+
+
+def generate_thumbnails(fieldfile, alias_names):
+    """Generate the thumbnails of the image for the given aliases.
+
+    Returns a dict of the generation time in seconds per alias.
+    """
+    thumbnailer = get_thumbnailer(fieldfile)
+    durations = {}
+    for alias in alias_names:
+        options = aliases.get(alias, target=thumbnailer.alias_target)
+        if not options:
+            continue
+        start = time.perf_counter()
+        thumbnailer.get_thumbnail(options)
+        durations[alias] = time.perf_counter() - start
+        logger.info(
+            "generated thumbnail %s of %s in %.3fs",
+            alias,
+            fieldfile.name,
+            durations[alias],
+        )
+    return durations
+
+
+def generate_object_thumbnails(obj, field_names=None):
+    """Generate the thumbnails of the image fields of the object.
+
+    Returns a dict of the generation time in seconds per alias.
+    """
+    durations = {}
+    for field_name, alias_names in get_fields(type(obj)).items():
+        if field_names is not None and field_name not in field_names:
+            continue
+        fieldfile = getattr(obj, field_name)
+        if not fieldfile:
+            continue
+        try:
+            for alias, duration in generate_thumbnails(fieldfile, alias_names).items():
+                durations[alias] = durations.get(alias, 0) + duration
+        except Exception:
+            logger.exception("could not generate thumbnails of %s", fieldfile.name)
+    return durations
+
+
+def schedule_thumbnails(obj, field_names):
+    from .tasks import generate_thumbnails_task
+
+    generate_thumbnails_task.delay(obj._meta.label, obj.pk, list(field_names))
+
+
+def get_thumbnail_url(fieldfile, alias):
+    """Return the url of the thumbnail of the image.
+
+    Thumbnails are usually generated by the task after the upload. If the
+    thumbnail does not exist yet it is generated now, so pages and og:image
+    never get the full-size original.
+    """
+    if not fieldfile:
+        return ""
+    thumbnailer = get_thumbnailer(fieldfile)
+    options = aliases.get(alias, target=thumbnailer.alias_target)
+    if not options:
+        return ""
+    thumbnail = thumbnailer.get_existing_thumbnail(options)
+    if thumbnail is None:
+        thumbnail = thumbnailer.get_thumbnail(options)
+    return thumbnail.url
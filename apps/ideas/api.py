@@ -29,6 +29,8 @@ class IdeaViewSet(
     def get_queryset(self):
         ideas = (
             Idea.objects.filter(module=self.module)
+            .select_related("creator", "category", "module__project")
+            .prefetch_related("labels")
             .annotate_comment_count()
             .annotate_positive_rating_count()
             .annotate_negative_rating_count()
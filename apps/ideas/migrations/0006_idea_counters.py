@@ -0,0 +1,37 @@
+from django.db import migrations
+from django.db import models
+
+from apps.contrib.counters import initialize_counters
+
+
+def initialize_idea_counters(apps, schema_editor):
+    initialize_counters(apps, "a4_candy_ideas", "Idea")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("a4comments", "__first__"),
+        ("a4ratings", "__first__"),
+        ("a4_candy_ideas", "0005_alter_idea_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="idea",
+            name="cached_comment_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="idea",
+            name="cached_positive_rating_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="idea",
+            name="cached_negative_rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(initialize_idea_counters, migrations.RunPython.noop),
+    ]
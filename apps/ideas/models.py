@@ -16,17 +16,21 @@ from adhocracy4.labels import models as labels_models
 from adhocracy4.models import query
 from adhocracy4.modules import models as module_models
 from adhocracy4.ratings import models as rating_models
+from apps.contrib import counters
 from apps.moderatorfeedback.models import Moderateable
 from apps.moderatorremark import models as remark_models
 
 
 class IdeaQuerySet(
-    query.RateableQuerySet, query.CommentableQuerySet, PolymorphicQuerySet
+    counters.CountedQuerySetMixin,
+    query.RateableQuerySet,
+    query.CommentableQuerySet,
+    PolymorphicQuerySet,
 ):
     pass
 
 
-class AbstractIdea(module_models.Item, Moderateable):
+class AbstractIdea(module_models.Item, Moderateable, counters.CountedItem):
     item_ptr = models.OneToOneField(
         to=module_models.Item,
         parent_link=True,
@@ -110,45 +110,70 @@ class IdeaSerializer(serializers.ModelSerializer):
     def get_content_type(self, idea):
         return ContentType.objects.get_for_model(idea).id
 
+    def _get_user(self):
+        request = self.context.get("request")
+        if request and hasattr(request, "user"):
+            return request.user
+        return None
+
+    def _get_user_ratings(self, idea):
+        """Return the ratings of the user for all ideas of the module.
+
+        The ratings are fetched in one query and keyed by object_pk, so
+        listing the ideas does not need a query per idea.
+        """
+        if not hasattr(self, "_user_ratings"):
+            self._user_ratings = {}
+        if idea.module_id not in self._user_ratings:
+            ratings = Rating.objects.filter(
+                content_type=ContentType.objects.get_for_model(idea),
+                object_pk__in=Idea.objects.filter(module_id=idea.module_id).values(
+                    "pk"
+                ),
+                creator=self._get_user(),
+            ).order_by("pk")
+            user_ratings = {}
+            for rating in ratings:
+                user_ratings.setdefault(rating.object_pk, rating)
+            self._user_ratings[idea.module_id] = user_ratings
+        return self._user_ratings[idea.module_id]
+
+    def _has_perm(self, perm, idea):
+        """Check the permission once per module and ownership.
+
+        The idea rules depend on the module, its phases and project and on
+        whether the user is the creator, so ideas sharing both share the
+        result.
+        """
+        user = self._get_user()
+        if user is None:
+            return False
+        if not hasattr(self, "_permissions"):
+            self._permissions = {}
+        key = (perm, idea.module_id, idea.creator_id == user.pk)
+        if key not in self._permissions:
+            self._permissions[key] = user.has_perm(perm, idea)
+        return self._permissions[key]
+
     def get_user_rating(self, idea):
-        if "request" in self.context:
-            user = self.context["request"].user
-            if user.is_authenticated:
-                ct = ContentType.objects.get_for_model(idea)
-                ratings = Rating.objects.filter(
-                    content_type_id=ct.id, object_pk=idea.pk, creator=user
-                )
-                if ratings.exists():
-                    return RatingSerializer(ratings.first()).data
+        user = self._get_user()
+        if user and user.is_authenticated:
+            rating = self._get_user_ratings(idea).get(idea.pk)
+            if rating:
+                return RatingSerializer(rating).data
         return None
 
     def get_has_rating_permission(self, idea):
-        request = self.context.get("request")
-        if request and hasattr(request, "user"):
-            user = request.user
-            return user.has_perm("a4_candy_ideas.rate_idea", idea)
-        return False
+        return self._has_perm("a4_candy_ideas.rate_idea", idea)
 
     def get_has_commenting_permission(self, idea):
-        request = self.context.get("request")
-        if request and hasattr(request, "user"):
-            user = request.user
-            return user.has_perm("a4_candy_ideas.comment_idea", idea)
-        return False
+        return self._has_perm("a4_candy_ideas.comment_idea", idea)
 
     def get_has_changing_permission(self, idea):
-        request = self.context.get("request")
-        if request and hasattr(request, "user"):
-            user = request.user
-            return user.has_perm("a4_candy_ideas.change_idea", idea)
-        return False
+        return self._has_perm("a4_candy_ideas.change_idea", idea)
 
     def get_has_deleting_permission(self, idea):
-        request = self.context.get("request")
-        if request and hasattr(request, "user"):
-            user = request.user
-            return user.has_perm("a4_candy_ideas.delete_idea", idea)
-        return False
+        return self._has_perm("a4_candy_ideas.delete_idea", idea)
 
     def create(self, validated_data):
         validated_data["creator"] = self.context["request"].user
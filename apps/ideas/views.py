@@ -50,7 +50,7 @@ class AbstractIdeaListView(ProjectMixin, filter_views.FilteredListView):
 
     def get_queryset(self):
         qs = super().get_queryset().filter(module=self.module)
-        if qs and not hasattr(qs.first(), "comment_count"):
+        if "comment_count" not in qs.query.annotations:
             return self.annotate_queryset(qs)
         return qs
 
@@ -1,20 +1,82 @@
+import asyncio
+import hashlib
 import json
+import time
+from urllib.parse import urlencode
 
-from django.contrib.sessions.models import Session
+from django.conf import settings
+from django.http import Http404
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins
 from rest_framework import viewsets
 from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
 
 from adhocracy4.api.mixins import ModuleMixin
 from adhocracy4.api.permissions import ViewSetRulesPermission
+from adhocracy4.modules.models import Module
 
+from . import cache
+from . import helpers
 from .models import Like
 from .models import LiveQuestion
 from .serializers import LikeSerializer
 from .serializers import LiveQuestionSerializer
 
+# an event stream is closed after EVENTS_DURATION seconds and the browser
+# reconnects, sending the id of the last event it received
+EVENTS_DURATION = 55
+EVENTS_POLL_INTERVAL = 1
+EVENTS_KEEPALIVE = 15
+EVENTS_RETRY = 1000
+
+
+async def stream_versions(module_id, version):
+    """Yield a server-sent event for every new version of the questions.
+
+    Only the version in the cache is read, so open streams do not cause
+    database queries.
+    """
+    yield "retry: {}\n\n".format(EVENTS_RETRY)
+    start = last_message = time.monotonic()
+    while time.monotonic() - start < EVENTS_DURATION:
+        current = await cache.aget_questions_version(module_id)
+        if current != version:
+            version = current
+            last_message = time.monotonic()
+            yield "id: {0}\ndata: {0}\n\n".format(version)
+        elif time.monotonic() - last_message >= EVENTS_KEEPALIVE:
+            last_message = time.monotonic()
+            yield ": keepalive\n\n"
+        await asyncio.sleep(EVENTS_POLL_INTERVAL)
+
+
+async def question_events(request, module_pk):
+    """Stream the new versions of the questions of the module.
+
+    The viewers reload the list when they receive an event instead of
+    polling it. Must be served by the ASGI application, a WSGI worker would
+    be blocked for the whole stream.
+    """
+    if not settings.INTERACTIVE_EVENTS_PUSH:
+        raise Http404
+    if not await Module.objects.filter(pk=module_pk).aexists():
+        raise Http404
+    version = request.headers.get("Last-Event-ID")
+    if not version:
+        version = await cache.aget_questions_version(module_pk)
+    response = StreamingHttpResponse(
+        stream_versions(module_pk, version), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # keep nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
 
 class LiveQuestionViewSet(
     ModuleMixin,
@@ -33,21 +95,83 @@ class LiveQuestionViewSet(
     filterset_fields = ("is_answered", "is_live", "is_hidden")
     ordering_fields = ("like_count",)
 
+    @cached_property
+    def module(self):
+        return get_object_or_404(Module, pk=self.module_pk)
+
     def get_permission_object(self):
         return self.module
 
+    @cached_property
+    def is_moderator(self):
+        user = self.request.user
+        return user.is_authenticated and user.has_perm(
+            "a4_candy_livequestions.moderate_livequestions", self.module
+        )
+
     def get_queryset(self):
         live_questions = (
             LiveQuestion.objects.filter(module=self.module)
             .order_by("created")
             .annotate_like_count()
         )
-        if not self.request.user.has_perm(
-            "a4_candy_livequestions.moderate_livequestions", self.module
-        ):
+        if not self.is_moderator:
             live_questions = live_questions.filter(is_hidden=False)
         return live_questions
 
+    def list(self, request, *args, **kwargs):
+        # All viewers of a live event poll the list, so it is served from
+        # the cache and unchanged lists are answered with a 304.
+        conditional_list = condition(etag_func=self.get_etag)(self._list)
+        return conditional_list(request, *args, **kwargs)
+
+    def _get_query(self):
+        params = sorted(
+            (key, value)
+            for key, values in self.request.query_params.lists()
+            if key in self.filterset_fields or key == "ordering"
+            for value in values
+        )
+        return hashlib.md5(urlencode(params).encode()).hexdigest()
+
+    def _get_session_likes(self):
+        return cache.get_session_likes(self.module.pk, self.request.session.session_key)
+
+    @cached_property
+    def cached_questions(self):
+        # the ETag and the response have to be built from the same version
+        return cache.get_questions(
+            self.module.pk, self.is_moderator, self._get_query(), self._serialize
+        )
+
+    def _serialize(self):
+        queryset = self.filter_queryset(self.get_queryset()).select_related("category")
+        context = dict(self.get_serializer_context(), session_likes=frozenset())
+        serializer = self.get_serializer(queryset, many=True, context=context)
+        return [dict(question) for question in serializer.data]
+
+    def get_etag(self, request, *args, **kwargs):
+        state = "{}-{}-{}-{}".format(
+            self.cached_questions[0],
+            int(self.is_moderator),
+            self._get_query(),
+            ",".join(str(pk) for pk in sorted(self._get_session_likes())),
+        )
+        return hashlib.md5(state.encode()).hexdigest()
+
+    def _list(self, request, *args, **kwargs):
+        session_likes = self._get_session_likes()
+        questions = [
+            dict(
+                question,
+                likes=dict(
+                    question["likes"], session_like=question["id"] in session_likes
+                ),
+            )
+            for question in self.cached_questions[1]
+        ]
+        return Response(questions)
+
     def dispatch(self, request, *args, **kwargs):
         if request.method == "POST":
             body = json.loads(request.body.decode("utf-8"))
@@ -70,17 +194,15 @@ class LikesViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
         return Like.objects.filter(livequestion=self.livequestion)
 
     def perform_create(self, serializer):
-        if not self.request.session.session_key:
-            self.request.session.create()
-        session = Session.objects.get(session_key=self.request.session.session_key)
-        like_value = bool(self.request.data["value"])
-        if like_value:
-            serializer.save(session=session, livequestion=self.livequestion)
-        elif Like.objects.filter(
-            session=session, livequestion=self.livequestion
-        ).exists():
-            Like.objects.get(session=session, livequestion=self.livequestion).delete()
-
-    @property
+        session = self.request.session
+        if not session.session_key:
+            session.create()
+        serializer.instance = helpers.toggle_like(
+            self.livequestion, session.session_key, bool(self.request.data["value"])
+        )
+
+    @cached_property
     def livequestion(self):
-        return get_object_or_404(LiveQuestion, pk=self.livequestion_pk)
+        return get_object_or_404(
+            LiveQuestion.objects.select_related("module"), pk=self.livequestion_pk
+        )
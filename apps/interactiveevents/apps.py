@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class Config(AppConfig):
     name = "apps.interactiveevents"
     label = "a4_candy_interactive_events"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -27,11 +27,33 @@ export default class PresentBox extends React.Component {
 
   componentDidMount () {
     this.getItems()
-    this.timer = setInterval(() => this.getItems(), 5000)
+    if (this.props.events_url && window.EventSource) {
+      this.events = new window.EventSource(this.props.events_url)
+      this.events.onmessage = () => this.scheduleGetItems()
+      // the list is still reloaded now and then in case events get lost
+      this.timer = setInterval(() => this.getItems(), 60000)
+    } else {
+      this.timer = setInterval(() => this.getItems(), 5000)
+    }
   }
 
   componentWillUnmount () {
+    clearInterval(this.timer)
     this.timer = null
+    if (this.events) {
+      this.events.close()
+      this.events = null
+    }
+  }
+
+  scheduleGetItems () {
+    // bursts of likes only reload the list once
+    if (!this.reloadTimeout) {
+      this.reloadTimeout = setTimeout(() => {
+        this.reloadTimeout = null
+        this.getItems()
+      }, 1000)
+    }
   }
 
   displayFooterOrInfo () {
@@ -41,7 +41,12 @@ export default class QuestionBox extends React.Component {
   }
 
   componentWillUnmount () {
+    clearInterval(this.timer)
     this.timer = null
+    if (this.events) {
+      this.events.close()
+      this.events = null
+    }
   }
 
   componentDidUpdate () {
@@ -177,10 +182,29 @@ export default class QuestionBox extends React.Component {
     })
   }
 
+  scheduleGetItems () {
+    // bursts of likes only reload the list once
+    if (!this.reloadTimeout) {
+      this.reloadTimeout = setTimeout(() => {
+        this.reloadTimeout = null
+        this.getItems()
+      }, 1000)
+    }
+  }
+
   restartPolling () {
     this.getItems()
     clearInterval(this.timer)
-    this.timer = setInterval(() => this.getItems(), 5000)
+    if (this.props.events_url && window.EventSource) {
+      if (!this.events) {
+        this.events = new window.EventSource(this.props.events_url)
+        this.events.onmessage = () => this.scheduleGetItems()
+      }
+      // the list is still reloaded now and then in case events get lost
+      this.timer = setInterval(() => this.getItems(), 60000)
+    } else {
+      this.timer = setInterval(() => this.getItems(), 5000)
+    }
   }
 
   render () {
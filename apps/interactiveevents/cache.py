@@ -0,0 +1,97 @@
+"""Caches for the live questions of a module.
+
+During a live event every viewer polls the question list. The serialized
+list is cached per module and filter, and the questions liked from a session
+are cached per session, so a poll does not need to count the likes again.
+Saving or deleting a question, like or category replaces the version of the
+module. The likes of a session are only invalidated by likes from that
+session.
+
+A cached list is stored together with the version it was built for. After
+a change only the first poll rebuilds the list, the polls arriving while it
+is rebuilt are answered with the previous list.
+
+If INTERACTIVE_EVENTS_PUSH is set, the viewers are told about a new version
+by an event stream (see api.question_events) and only then reload the
+list. The event streams are served by an ASGI server, so they do not hold
+the sync workers of gunicorn. Otherwise the viewers poll the list.
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+from .models import Like
+
+QUESTIONS_VERSION_KEY = "livequestions_version_{module_id}"
+QUESTIONS_KEY = "livequestions_{module_id}_{moderator}_{query}"
+QUESTIONS_LOCK_KEY = "livequestions_lock_{module_id}_{version}_{moderator}_{query}"
+SESSION_LIKES_KEY = "livequestions_session_likes_{module_id}_{session}"
+QUESTIONS_TIMEOUT = 60 * 60
+# a rebuild taking longer is started again by the next poll
+QUESTIONS_LOCK_TIMEOUT = 10
+
+
+def invalidate_questions(module_id):
+    cache.set(
+        QUESTIONS_VERSION_KEY.format(module_id=module_id),
+        uuid.uuid4().hex,
+        timeout=None,
+    )
+
+
+def get_questions_version(module_id):
+    key = QUESTIONS_VERSION_KEY.format(module_id=module_id)
+    cache.add(key, uuid.uuid4().hex, timeout=None)
+    return cache.get(key)
+
+
+async def aget_questions_version(module_id):
+    key = QUESTIONS_VERSION_KEY.format(module_id=module_id)
+    await cache.aadd(key, uuid.uuid4().hex, timeout=None)
+    return await cache.aget(key)
+
+
+def get_questions(module_id, is_moderator, query, get_data):
+    """Return the version and the serialized questions of the module.
+
+    query identifies the filters and ordering of the list, get_data is
+    called to serialize the questions if they are not cached. While another
+    request rebuilds the list, the previous version is returned.
+    """
+    version = get_questions_version(module_id)
+    kwargs = {
+        "module_id": module_id,
+        "moderator": int(bool(is_moderator)),
+        "query": query,
+    }
+    key = QUESTIONS_KEY.format(**kwargs)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached
+    lock_key = QUESTIONS_LOCK_KEY.format(version=version, **kwargs)
+    if cached is not None and not cache.add(lock_key, True, QUESTIONS_LOCK_TIMEOUT):
+        return cached
+    questions = (version, get_data())
+    cache.set(key, questions, QUESTIONS_TIMEOUT)
+    return questions
+
+
+def get_session_likes(module_id, session_key):
+    """Return the ids of the questions liked from the session."""
+    if not session_key:
+        return frozenset()
+    key = SESSION_LIKES_KEY.format(module_id=module_id, session=session_key)
+    return cache.get_or_set(
+        key,
+        lambda: frozenset(
+            Like.objects.filter(
+                session=session_key, livequestion__module_id=module_id
+            ).values_list("livequestion_id", flat=True)
+        ),
+        QUESTIONS_TIMEOUT,
+    )
+
+
+def invalidate_session_likes(module_id, session_key):
+    cache.delete(SESSION_LIKES_KEY.format(module_id=module_id, session=session_key))
@@ -0,0 +1,44 @@
+from django.db import IntegrityError
+from django.db import transaction
+from django.db.models import F
+from django.db.models import Value
+from django.db.models.functions import Greatest
+
+from . import cache
+from .models import Like
+from .models import LiveQuestion
+from .signals import like_toggled
+
+
+def toggle_like(livequestion, session_key, liked):
+    """Add or remove the like of a session and update the like counter.
+
+    Returns the new like, or None if nothing was added. Adding a like is an
+    INSERT in a savepoint, a second like is stopped by the unique
+    constraint. Removing a like is a single DELETE, as likes have no model
+    signal receivers. Only if a like was added or removed the counter of the
+    question is updated and like_toggled is sent.
+    """
+    like = None
+    if liked:
+        try:
+            with transaction.atomic():
+                like = Like.objects.create(
+                    session=session_key, livequestion=livequestion
+                )
+        except IntegrityError:
+            return None
+    else:
+        deleted, _ = Like.objects.filter(
+            session=session_key, livequestion=livequestion
+        ).delete()
+        if not deleted:
+            return None
+    delta = 1 if liked else -1
+    LiveQuestion.objects.filter(pk=livequestion.pk).update(
+        cached_like_count=Greatest(F("cached_like_count") + delta, Value(0))
+    )
+    cache.invalidate_questions(livequestion.module_id)
+    cache.invalidate_session_likes(livequestion.module_id, session_key)
+    like_toggled.send(sender=Like, livequestion=livequestion, liked=liked)
+    return like
@@ -0,0 +1,32 @@
+from django.db import migrations
+from django.db import models
+
+
+def initialize_like_counts(apps, schema_editor):
+    LiveQuestion = apps.get_model("a4_candy_interactive_events", "LiveQuestion")
+    like_counts = (
+        LiveQuestion.objects.annotate(like_count=models.Count("livequestion_likes"))
+        .filter(like_count__gt=0)
+        .values_list("pk", "like_count")
+    )
+    for pk, like_count in like_counts:
+        LiveQuestion.objects.filter(pk=pk).update(cached_like_count=like_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "a4_candy_interactive_events",
+            "0007_alter_extrafieldsinteractiveevent_options",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="livequestion",
+            name="cached_like_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(initialize_like_counts, migrations.RunPython.noop),
+    ]
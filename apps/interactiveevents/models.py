@@ -9,6 +9,7 @@ from adhocracy4.categories.fields import CategoryField
 from adhocracy4.images.fields import ConfiguredImageField
 from adhocracy4.models.base import TimeStampedModel
 from adhocracy4.modules import models as module_models
+from apps.contrib import counters
 
 
 class AnonymousItem(TimeStampedModel):
@@ -32,9 +33,8 @@ class AnonymousItem(TimeStampedModel):
 
 class LikeQuerySet(models.QuerySet):
     def annotate_like_count(self):
-        return self.annotate(
-            like_count=models.Count("livequestion_likes", distinct=True)
-        )
+        # the counter is kept up to date by toggle_like
+        return self.annotate(like_count=models.F("cached_like_count"))
 
 
 class LiveQuestion(AnonymousItem):
@@ -43,6 +43,9 @@ class LiveQuestion(AnonymousItem):
     is_on_shortlist = models.BooleanField(default=False)
     is_hidden = models.BooleanField(default=False)
     is_live = models.BooleanField(default=False)
+    cached_like_count = models.PositiveIntegerField(
+        default=0, editable=False, db_index=True
+    )
 
     category = CategoryField(verbose_name=_("Characteristic"))
 
@@ -51,6 +54,12 @@ class LiveQuestion(AnonymousItem):
     def __str__(self):
         return str(self.text)
 
+    def save(self, update_fields=None, *args, **kwargs):
+        # the like counter is only changed by toggle_like
+        if update_fields is None:
+            update_fields = counters.get_update_fields(self, ["cached_like_count"])
+        super().save(update_fields=update_fields, *args, **kwargs)
+
     def get_absolute_url(self):
         return reverse(
             "module-detail",
@@ -16,10 +16,14 @@ class LiveQuestionSerializer(serializers.ModelSerializer):
         exclude = ("module", "created", "modified")
 
     def get_likes(self, livequestion):
-        session = self.context["request"].session.session_key
-        session_like = bool(
-            livequestion.livequestion_likes.filter(session=session).first()
-        )
+        session_likes = self.context.get("session_likes")
+        if session_likes is not None:
+            session_like = livequestion.pk in session_likes
+        else:
+            session = self.context["request"].session.session_key
+            session_like = bool(
+                livequestion.livequestion_likes.filter(session=session).first()
+            )
         if hasattr(livequestion, "like_count"):
             like_count = livequestion.like_count
         else:
@@ -0,0 +1,29 @@
+from django.db.models import signals
+from django.dispatch import Signal
+from django.dispatch import receiver
+
+from adhocracy4.categories.models import Category
+
+from . import cache
+from .models import LiveQuestion
+
+# Sent by toggle_like with the livequestion and liked after a like was added
+# or removed. Likes are only changed by toggle_like and have no model
+# signal receivers, so removing a like is a single DELETE.
+like_toggled = Signal()
+
+
+@receiver(signals.post_save, sender=LiveQuestion)
+def question_saved(sender, instance, **kwargs):
+    cache.invalidate_questions(instance.module_id)
+
+
+@receiver(signals.post_delete, sender=LiveQuestion)
+def question_deleted(sender, instance, **kwargs):
+    cache.invalidate_questions(instance.module_id)
+
+
+@receiver(signals.post_save, sender=Category)
+@receiver(signals.post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    cache.invalidate_questions(instance.module_id)
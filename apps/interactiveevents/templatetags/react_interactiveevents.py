@@ -1,6 +1,7 @@
 import json
 
 from django import template
+from django.conf import settings
 from django.urls import reverse
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
@@ -22,6 +23,9 @@ def react_interactiveevents(context, obj):
     categories = [category.name for category in obj.category_set.all()]
     category_dict = {category.pk: category.name for category in obj.category_set.all()}
     questions_api_url = reverse("interactiveevents-list", kwargs={"module_pk": obj.pk})
+    events_url = ""
+    if settings.INTERACTIVE_EVENTS_PUSH:
+        events_url = reverse("interactiveevents-events", kwargs={"module_pk": obj.pk})
 
     private_policy_label = str(
         _(
@@ -56,6 +60,7 @@ def react_interactiveevents(context, obj):
     attributes = {
         "information": obj.description,
         "questions_api_url": questions_api_url,
+        "events_url": events_url,
         "likes_api_url": likes_api_url,
         "present_url": present_url,
         "isModerator": is_moderator,
@@ -81,12 +86,16 @@ def react_interactiveevents_present(context, obj):
 
     categories = [category.name for category in obj.category_set.all()]
     questions_api_url = reverse("interactiveevents-list", kwargs={"module_pk": obj.pk})
+    events_url = ""
+    if settings.INTERACTIVE_EVENTS_PUSH:
+        events_url = reverse("interactiveevents-events", kwargs={"module_pk": obj.pk})
     request = context["request"]
     url = obj.project.get_absolute_url()
     full_url = request.build_absolute_uri(url)
 
     attributes = {
         "questions_api_url": questions_api_url,
+        "events_url": events_url,
         "categories": categories,
         "url": full_url,
         "title": obj.project.name,
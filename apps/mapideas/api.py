@@ -0,0 +1,206 @@
+import json
+import math
+from collections import defaultdict
+
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework import mixins
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from adhocracy4.api.mixins import ModuleMixin
+from adhocracy4.api.permissions import ViewSetRulesPermission
+
+from .models import MapIdea
+
+MAX_ZOOM = 22
+
+
+def _get_coordinates(point):
+    if isinstance(point, str):
+        try:
+            point = json.loads(point)
+        except ValueError:
+            return None
+    try:
+        lng, lat = point["geometry"]["coordinates"][:2]
+        return float(lng), float(lat)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def filter_bbox(items, bbox):
+    """Filter the items to the points within the bounding box in the database.
+
+    Only points stored as GeoJSON objects are matched, points stored as
+    strings were converted by the normalize_*_point migrations.
+    """
+    west, south, east, north = bbox
+    items = items.filter(
+        point__geometry__coordinates__1__gte=south,
+        point__geometry__coordinates__1__lte=north,
+    )
+    if west <= east:
+        return items.filter(
+            point__geometry__coordinates__0__gte=west,
+            point__geometry__coordinates__0__lte=east,
+        )
+    # the bounding box crosses the antimeridian
+    return items.filter(
+        Q(point__geometry__coordinates__0__gte=west)
+        | Q(point__geometry__coordinates__0__lte=east)
+    )
+
+
+def _get_feature(coordinates, properties):
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": list(coordinates)},
+        "properties": properties,
+    }
+
+
+def cluster_features(features, zoom, cells_per_tile):
+    """Merge the features within the same grid cell into one cluster.
+
+    The grid has cells_per_tile cells along each edge of a map tile at the
+    given zoom level. Clusters are placed at the mean of their points.
+    """
+    cell_size = 360 / (2**zoom * cells_per_tile)
+    cells = defaultdict(list)
+    for feature in features:
+        lng, lat = feature["geometry"]["coordinates"]
+        cells[(math.floor(lng / cell_size), math.floor(lat / cell_size))].append(
+            feature
+        )
+
+    clustered = []
+    for cell_features in cells.values():
+        if len(cell_features) == 1:
+            clustered.append(cell_features[0])
+            continue
+        lngs = [feature["geometry"]["coordinates"][0] for feature in cell_features]
+        lats = [feature["geometry"]["coordinates"][1] for feature in cell_features]
+        clustered.append(
+            _get_feature(
+                (sum(lngs) / len(lngs), sum(lats) / len(lats)),
+                {
+                    "cluster": True,
+                    "count": len(cell_features),
+                    "bbox": [min(lngs), min(lats), max(lngs), max(lats)],
+                },
+            )
+        )
+    return clustered
+
+
+class AbstractMapIdeaGeoJSONViewSet(
+    ModuleMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """Points of the items of a module as a GeoJSON feature collection.
+
+    Only the pk, name, url, point, category and counts are returned. The
+    points can be limited to a bounding box (bbox=west,south,east,north) and
+    are clustered if a zoom level is given.
+    """
+
+    permission_classes = (ViewSetRulesPermission,)
+    model = None
+    cells_per_tile = 4
+
+    def get_permission_object(self):
+        return self.module
+
+    def get_queryset(self):
+        items = self.model.objects.filter(module=self.module)
+        category = self.request.query_params.get("category")
+        if category:
+            if not category.isdigit():
+                raise ValidationError({"category": _("Invalid category.")})
+            items = items.filter(category_id=category)
+        return (
+            items.annotate_comment_count()
+            .annotate_positive_rating_count()
+            .annotate_negative_rating_count()
+        )
+
+    def get_bbox(self):
+        bbox = self.request.query_params.get("bbox")
+        if not bbox:
+            return None
+        try:
+            west, south, east, north = (float(value) for value in bbox.split(","))
+        except ValueError:
+            raise ValidationError({"bbox": _("Expected west,south,east,north.")})
+        return west, south, east, north
+
+    def get_zoom(self):
+        zoom = self.request.query_params.get("zoom")
+        if zoom is None:
+            return None
+        if not zoom.isdigit() or int(zoom) > MAX_ZOOM:
+            raise ValidationError(
+                {"zoom": _("Expected a zoom level from 0 to {}.").format(MAX_ZOOM)}
+            )
+        return int(zoom)
+
+    def get_item_url(self, pk, created):
+        # the module and its organisation are loaded once for all items
+        return self.model(pk=pk, created=created, module=self.module).get_absolute_url()
+
+    def get_features(self, bbox):
+        items = self.get_queryset()
+        if bbox:
+            items = filter_bbox(items, bbox)
+        items = items.values_list(
+            "pk",
+            "name",
+            "created",
+            "point",
+            "category_id",
+            "comment_count",
+            "positive_rating_count",
+            "negative_rating_count",
+        )
+        features = []
+        for (
+            pk,
+            name,
+            created,
+            point,
+            category_id,
+            comments,
+            positive,
+            negative,
+        ) in items.order_by("pk"):
+            coordinates = _get_coordinates(point)
+            if coordinates is None:
+                continue
+            features.append(
+                _get_feature(
+                    coordinates,
+                    {
+                        "pk": pk,
+                        "name": name,
+                        "url": self.get_item_url(pk, created),
+                        "category": category_id,
+                        "comment_count": comments,
+                        "positive_rating_count": positive,
+                        "negative_rating_count": negative,
+                    },
+                )
+            )
+        return features
+
+    def list(self, request, *args, **kwargs):
+        bbox = self.get_bbox()
+        zoom = self.get_zoom()
+        features = self.get_features(bbox)
+        if zoom is not None:
+            features = cluster_features(features, zoom, self.cells_per_tile)
+        return Response({"type": "FeatureCollection", "features": features})
+
+
+class MapIdeaGeoJSONViewSet(AbstractMapIdeaGeoJSONViewSet):
+    model = MapIdea
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from apps.maps.geometry import normalize_points
+
+
+def normalize_mapidea_points(apps, schema_editor):
+    normalize_points(apps.get_model("a4_candy_mapideas", "MapIdea"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("a4_candy_mapideas", "0007_mapidea_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_mapidea_points, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,5 @@
 import re
 
-from django.core.paginator import EmptyPage
-from django.core.paginator import Paginator
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -37,34 +35,44 @@ class MapIdeaFilterSet(a4_filters.DefaultsFilterSet):
         fields = ["category"]
 
 
-class MapIdeaListView(idea_views.AbstractIdeaListView, DisplayProjectOrModuleMixin):
-    model = models.MapIdea
-    filter_set = MapIdeaFilterSet
-    paginate_by = 0  # Maps need all ideas, pagination is handled get_context_data
+class AbstractMapIdeaListView(idea_views.AbstractIdeaListView):
+    """List paginated in the database with all items shown on the map.
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
+    The map loads the points of the visible area from the GeoJSON endpoint
+    named by geojson_url_name, so only the current page is rendered. Out of
+    range pages show the last page.
+    """
+
+    geojson_url_name = None
+
+    def get_paginate_by(self, queryset):
         ua = self.request.headers.get("User-Agent", "")
         is_mobile = bool(re.search(r"Mobi|Android|iPhone|iPod|Windows Phone", ua, re.I))
         page_size = int(self.request.GET.get("page_size", 15 if is_mobile else 8))
+        return page_size if page_size > 0 else None
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.get_paginator(queryset, page_size)
+        page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
         self.mode = self.request.GET.get("mode", "map")
-        object_list = context.get("object_list", [])
-
-        if page_size > 0:
-            paginator = Paginator(object_list, page_size)
-            page = int(self.request.GET.get("page", 1))
-            try:
-                paginated_list = paginator.page(page)
-            except EmptyPage:
-                paginated_list = paginator.page(paginator.num_pages)
-        else:
-            paginated_list = object_list
-        context["paginated_list"] = paginated_list
-        context["page_obj"] = paginated_list  # page_obj ist die paginierte Liste selbst
-        context["is_paginated"] = paginator.num_pages > 1 if page_size > 0 else False
+        context["paginated_list"] = context["page_obj"] or context["object_list"]
+        context["geojson_url"] = reverse(
+            self.geojson_url_name, kwargs={"module_pk": self.module.pk}
+        )
+        context["hide_ratings"] = not self.module.has_feature("rate", self.model)
         return context
 
 
+class MapIdeaListView(AbstractMapIdeaListView, DisplayProjectOrModuleMixin):
+    model = models.MapIdea
+    geojson_url_name = "mapideas-geojson-list"
+    filter_set = MapIdeaFilterSet
+
+
 class MapIdeaDetailView(idea_views.AbstractIdeaDetailView):
     model = models.MapIdea
     queryset = (
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class Config(AppConfig):
     name = "apps.maps"
     label = "a4_candy_maps"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -276,22 +276,36 @@ function init () {
     })
 
     $('#select_' + name).on('change', function (event) {
-      const geoJson = event.target.value
-      if (geoJson) {
-        const shape = L.geoJson(JSON.parse(geoJson), {
-          style: polygonStyle
-        })
-
-        const isEmpty = drawnItems.getLayers().length === 0
-        const msg = django.gettext('Do you want to load this preset and delete all the existing polygons?')
-        if (isEmpty || window.confirm(msg)) {
-          drawnItems.clearLayers()
-          shape.eachLayer(function (layer) {
-            drawnItems.addLayer(layer)
+      const url = event.target.value
+      if (url) {
+        // the polygons of the presets are only loaded when chosen
+        window.fetch(url)
+          .then((response) => {
+            if (!response.ok) {
+              throw new Error(response.statusText)
+            }
+            return response.json()
+          })
+          .then((geoJson) => {
+            const shape = L.geoJson(geoJson, {
+              style: polygonStyle
+            })
+
+            const isEmpty = drawnItems.getLayers().length === 0
+            const msg = django.gettext('Do you want to load this preset and delete all the existing polygons?')
+            if (isEmpty || window.confirm(msg)) {
+              drawnItems.clearLayers()
+              shape.eachLayer(function (layer) {
+                drawnItems.addLayer(layer)
+              })
+              map.fitBounds(drawnItems.getBounds())
+              map.fire(L.Draw.Event.EDITED)
+            }
+          })
+          .catch((error) => {
+            console.error('Error loading preset:', error)
+            window.alert(django.gettext('The preset could not be loaded.'))
           })
-          map.fitBounds(drawnItems.getBounds())
-          map.fire(L.Draw.Event.EDITED)
-        }
       }
     })
   })
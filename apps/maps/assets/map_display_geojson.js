@@ -0,0 +1,181 @@
+/* Displays the points of a module, loaded from its GeoJSON endpoint for the
+ * visible area of the map instead of being rendered into the page. */
+
+/* global django */
+import { maps } from 'adhocracy4'
+
+// the list filters also apply to the points on the map
+const FILTER_PARAMS = ['category', 'is_archived']
+
+const markerStyle = {
+  radius: 8,
+  color: '#fff',
+  weight: 2,
+  fillColor: '#0076ae',
+  fillOpacity: 1
+}
+
+const polygonStyle = {
+  color: '#0076ae',
+  weight: 2,
+  opacity: 1,
+  fillOpacity: 0.2
+}
+
+function escapeHtml (text) {
+  const element = document.createElement('span')
+  element.textContent = text
+  return element.innerHTML
+}
+
+function getPopupContent (properties, hideRatings) {
+  let meta = '<span class="map-popup-comments-count"><i class="far fa-comment" aria-hidden="true"></i> ' +
+    properties.comment_count + '<span class="visually-hidden">' + django.gettext('Comments') + '</span></span>'
+  if (!hideRatings) {
+    meta = '<span class="map-popup-upvotes"><i class="far fa-thumbs-up" aria-hidden="true"></i> ' +
+      properties.positive_rating_count + '<span class="visually-hidden">' + django.gettext('Likes') + '</span></span>' +
+      '<span class="map-popup-downvotes"><i class="far fa-thumbs-down" aria-hidden="true"></i> ' +
+      properties.negative_rating_count + '<span class="visually-hidden">' + django.gettext('Dislikes') + '</span></span>' +
+      meta
+  }
+  return '<div class="maps-popups-popup-text-content">' +
+    '<div class="maps-popups-popup-name"><a href="' + escapeHtml(properties.url) + '">' +
+    escapeHtml(properties.name) + '</a></div>' +
+    '<div class="maps-popups-popup-meta">' + meta + '</div>' +
+    '</div>'
+}
+
+function getUrl (url, map) {
+  const bounds = map.getBounds()
+  const params = new URLSearchParams(window.location.search)
+  const query = new URLSearchParams()
+  // an empty filter (e.g. "All") is forwarded, as only a missing filter
+  // falls back to the default of the list
+  FILTER_PARAMS.forEach(function (name) {
+    if (params.has(name)) {
+      query.set(name, params.get(name))
+    }
+  })
+  query.set('bbox', [
+    bounds.getWest(), bounds.getSouth(), bounds.getEast(), bounds.getNorth()
+  ].join(','))
+  query.set('zoom', Math.max(map.getZoom(), 0))
+  return url + '?' + query.toString()
+}
+
+function init () {
+  const L = window.L
+
+  document.querySelectorAll('[data-map="display_geojson"]').forEach(function (e) {
+    const url = e.getAttribute('data-url')
+    const polygon = JSON.parse(e.getAttribute('data-polygon'))
+    const bbox = JSON.parse(e.getAttribute('data-bbox'))
+    const hideRatings = JSON.parse(e.getAttribute('data-hide-ratings'))
+
+    const map = maps.createMap(L, e, {
+      baseUrl: e.getAttribute('data-baseurl'),
+      useVectorMap: e.getAttribute('data-usevectormap'),
+      attribution: e.getAttribute('data-attribution'),
+      mapboxToken: e.getAttribute('data-mapbox-token'),
+      omtToken: e.getAttribute('data-omt-token'),
+      dragging: true,
+      scrollWheelZoom: false,
+      zoomControl: false,
+      minZoom: 2
+    })
+
+    const polygonLayer = L.geoJson(polygon, { style: polygonStyle }).addTo(map)
+    const pointsLayer = L.featureGroup().addTo(map)
+
+    function fitBounds () {
+      if (polygonLayer.getLayers().length > 0) {
+        map.fitBounds(polygonLayer.getBounds())
+      } else {
+        map.fitBounds(bbox)
+      }
+    }
+
+    function addFeature (feature) {
+      const [lng, lat] = feature.geometry.coordinates
+      const properties = feature.properties
+      if (properties.cluster) {
+        const [west, south, east, north] = properties.bbox
+        L.marker([lat, lng], {
+          icon: L.divIcon({
+            html: '<div><span>' + properties.count + '</span></div>',
+            className: 'marker-cluster',
+            iconSize: L.point(40, 40)
+          })
+        }).on('click', function () {
+          map.fitBounds([[south, west], [north, east]])
+        }).addTo(pointsLayer)
+      } else {
+        L.circleMarker([lat, lng], markerStyle)
+          .bindPopup(getPopupContent(properties, hideRatings))
+          .addTo(pointsLayer)
+      }
+    }
+
+    // only the response to the latest move is shown
+    let request = 0
+    function loadPoints () {
+      const current = ++request
+      window.fetch(getUrl(url, map), { headers: { Accept: 'application/json' } })
+        .then((response) => {
+          if (!response.ok) {
+            throw new Error(response.statusText)
+          }
+          return response.json()
+        })
+        .then((geoJson) => {
+          if (current !== request) {
+            return
+          }
+          pointsLayer.clearLayers()
+          geoJson.features.forEach(addFeature)
+        })
+        .catch((error) => {
+          console.error('Error loading points:', error)
+          // do not keep showing the points of the previous area
+          if (current === request) {
+            pointsLayer.clearLayers()
+          }
+        })
+    }
+
+    map.on('moveend', loadPoints)
+    fitBounds()
+
+    const zoomIn = document.getElementById('zoom-in')
+    const zoomOut = document.getElementById('zoom-out')
+    function updateZoomControls () {
+      if (zoomIn && zoomOut) {
+        zoomIn.classList.toggle('leaflet-disabled', map.getZoom() >= map.getMaxZoom())
+        zoomOut.classList.toggle('leaflet-disabled', map.getZoom() <= map.getMinZoom())
+      }
+    }
+    if (zoomIn && zoomOut) {
+      zoomIn.addEventListener('click', function (event) {
+        event.preventDefault()
+        map.zoomIn()
+      })
+      zoomOut.addEventListener('click', function (event) {
+        event.preventDefault()
+        map.zoomOut()
+      })
+      map.on('zoomend', updateZoomControls)
+      updateZoomControls()
+    }
+
+    // the map has no size while the list is shown on mobile
+    const mapView = document.getElementById('map-view')
+    if (mapView) {
+      mapView.addEventListener('mapViewShown', function () {
+        map.invalidateSize()
+        fitBounds()
+      })
+    }
+  })
+}
+
+document.addEventListener('DOMContentLoaded', init, false)
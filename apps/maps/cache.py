@@ -0,0 +1,81 @@
+"""Caches for the map presets of the polygon widget.
+
+The catalogue only lists the names of the presets, the polygons are loaded
+from a separate view when a preset is chosen. Polygons are cached for every
+simplification level. Saving or deleting a preset or category replaces the
+version, which is part of every cache key.
+"""
+
+import json
+import uuid
+
+from django.core.cache import cache
+
+from . import geometry
+from .models import MapPreset
+
+PRESETS_VERSION_KEY = "map_presets_version"
+PRESET_CATALOGUE_KEY = "map_preset_catalogue_{version}"
+PRESET_GEOMETRY_KEY = "map_preset_geometry_{pk}_{level}_{version}"
+PRESETS_TIMEOUT = 60 * 60 * 24
+
+
+def invalidate_presets():
+    cache.set(PRESETS_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def get_presets_version():
+    cache.add(PRESETS_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    return cache.get(PRESETS_VERSION_KEY)
+
+
+def _get_preset_catalogue():
+    uncategorized = []
+    categories = {}
+    presets = MapPreset.objects.order_by(
+        "category__name", "category_id", "name"
+    ).values_list("pk", "name", "category_id", "category__name")
+    for pk, name, category_id, category_name in presets:
+        preset = {"pk": pk, "name": name}
+        if category_id is None:
+            uncategorized.append(preset)
+        else:
+            categories.setdefault(category_id, (category_name, []))[1].append(preset)
+    return uncategorized, list(categories.values())
+
+
+def get_preset_catalogue():
+    """Return the uncategorized presets and the presets by category.
+
+    Presets are dicts with pk and name, categories are (name, presets)
+    tuples ordered by name.
+    """
+    key = PRESET_CATALOGUE_KEY.format(version=get_presets_version())
+    return cache.get_or_set(key, _get_preset_catalogue, PRESETS_TIMEOUT)
+
+
+def get_preset_geometry(pk, level):
+    """Return the simplified polygon of the preset as GeoJSON string.
+
+    All levels are calculated at once, as the polygon has to be loaded for
+    any of them. Returns None if the preset does not exist.
+    """
+    version = get_presets_version()
+    key = PRESET_GEOMETRY_KEY.format(pk=pk, level=level, version=version)
+    polygon = cache.get(key)
+    if polygon is None:
+        preset = MapPreset.objects.filter(pk=pk).first()
+        if preset is None:
+            return None
+        polygons = {
+            PRESET_GEOMETRY_KEY.format(pk=pk, level=preset_level, version=version): (
+                json.dumps(
+                    geometry.simplify_geojson(preset.polygon, tolerance),
+                    separators=(",", ":"),
+                )
+            )
+            for preset_level, tolerance in geometry.SIMPLIFICATION_LEVELS.items()
+        }
+        cache.set_many(polygons, PRESETS_TIMEOUT)
+        polygon = polygons[key]
+    return polygon
@@ -0,0 +1,131 @@
+"""Douglas-Peucker simplification of GeoJSON polygons and normalisation of
+points stored as strings.
+
+Tolerances are in degrees, which is precise enough for the small areas of
+map presets.
+"""
+
+import json
+import math
+
+# level 0 keeps the geometry unchanged, 1 is about a metre, 3 about 100 m
+SIMPLIFICATION_LEVELS = {
+    0: 0,
+    1: 0.00001,
+    2: 0.0001,
+    3: 0.001,
+}
+
+
+def _distance_to_segment(point, start, end):
+    x, y = point[0], point[1]
+    x1, y1 = start[0], start[1]
+    x2, y2 = end[0], end[1]
+    dx, dy = x2 - x1, y2 - y1
+    if dx == 0 and dy == 0:
+        return math.hypot(x - x1, y - y1)
+    t = max(0, min(1, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+def simplify_line(points, tolerance):
+    """Return the points of the line that are kept by Douglas-Peucker."""
+    if tolerance <= 0 or len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_distance = 0
+        index = None
+        for i in range(first + 1, last):
+            distance = _distance_to_segment(points[i], points[first], points[last])
+            if distance > max_distance:
+                max_distance = distance
+                index = i
+        if index is not None and max_distance > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _simplify_ring(ring, tolerance):
+    if len(ring) < 5:
+        return ring
+    # split closed rings so the start and end point are not the only anchors
+    middle = len(ring) // 2
+    simplified = simplify_line(ring[: middle + 1], tolerance)[:-1] + simplify_line(
+        ring[middle:], tolerance
+    )
+    if len(simplified) < 4:
+        # a ring needs at least three distinct points
+        third = (len(ring) - 1) // 3
+        simplified = [ring[0], ring[third], ring[2 * third], ring[-1]]
+    return simplified
+
+
+def _simplify_polygon(rings, tolerance):
+    return [_simplify_ring(ring, tolerance) for ring in rings]
+
+
+def simplify_geojson(geojson, tolerance):
+    """Return a copy of the GeoJSON object with simplified polygons.
+
+    Other geometries are returned unchanged.
+    """
+    if not isinstance(geojson, dict) or tolerance <= 0:
+        return geojson
+    geojson_type = geojson.get("type")
+    if geojson_type == "FeatureCollection":
+        return dict(
+            geojson,
+            features=[
+                simplify_geojson(feature, tolerance)
+                for feature in geojson.get("features", [])
+            ],
+        )
+    if geojson_type == "Feature":
+        return dict(
+            geojson, geometry=simplify_geojson(geojson.get("geometry"), tolerance)
+        )
+    if geojson_type == "GeometryCollection":
+        return dict(
+            geojson,
+            geometries=[
+                simplify_geojson(geometry, tolerance)
+                for geometry in geojson.get("geometries", [])
+            ],
+        )
+    if geojson_type == "Polygon":
+        return dict(
+            geojson,
+            coordinates=_simplify_polygon(geojson["coordinates"], tolerance),
+        )
+    if geojson_type == "MultiPolygon":
+        return dict(
+            geojson,
+            coordinates=[
+                _simplify_polygon(polygon, tolerance)
+                for polygon in geojson["coordinates"]
+            ],
+        )
+    return geojson
+
+
+def normalize_points(model):
+    """Store points saved as GeoJSON strings as objects.
+
+    Older items have their point stored as a string, which the bounding box
+    filter of the GeoJSON api cannot match. Used by the data migrations of
+    the apps with points.
+    """
+    for pk, point in model.objects.values_list("pk", "point").iterator():
+        if not isinstance(point, str):
+            continue
+        try:
+            point = json.loads(point)
+        except ValueError:
+            continue
+        model.objects.filter(pk=pk).update(point=point)
@@ -1,12 +1,127 @@
 import json
 import os
+import re
 import subprocess
 import sys
+import time
 
 from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
 
+from apps.maps import cache
 from apps.maps import models as map_models
 
+DISTRICTS_CATEGORY = "Bezirke - Berlin"
+DISTRICTS_URL = "http://fbinter.stadt-berlin.de/fb/wfs/geometry/senstadt/re_bezirke/"
+REGIONS_URL = (
+    "http://fbinter.stadt-berlin.de/fb/wfs/geometry/senstadt/re_bezirksregion/"
+)
+READ_SIZE = 64 * 1024
+
+# the characters changing the nesting outside and inside of strings
+_TOKENS = re.compile(r'[{}\[\]"]')
+_STRING_TOKENS = re.compile(r'["\\]')
+FEATURES_KEY = "features"
+
+
+class _FeatureScanner:
+    """Find the features of a GeoJSON feature collection read in chunks.
+
+    Keeps track of the nesting and of strings to find the "features" key of
+    the collection. Only the text of the feature being read is kept, it is
+    parsed once complete.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        # the beginning of a string of the collection, to recognise the key
+        self.string = None
+        self.key = None
+        self.in_features = False
+        self.done = False
+        # the text of the feature read so far, if reading a feature
+        self.parts = None
+        self.feature_start = 0
+
+    def feed(self, chunk):
+        """Yield the features completed by the chunk."""
+        position = 0
+        self.feature_start = 0
+        while position < len(chunk) and not self.done:
+            if self.escape:
+                self.escape = False
+                position += 1
+            elif self.in_string:
+                position = self._read_string(chunk, position)
+            else:
+                match = _TOKENS.search(chunk, position)
+                if match is None:
+                    break
+                position = match.end()
+                feature = self._read_token(chunk, match)
+                if feature is not None:
+                    yield feature
+        if self.parts is not None:
+            self.parts.append(chunk[self.feature_start :])
+
+    def _read_string(self, chunk, position):
+        match = _STRING_TOKENS.search(chunk, position)
+        end = match.start() if match else len(chunk)
+        if self.string is not None:
+            self.string += chunk[position:end]
+            if len(self.string) > len(FEATURES_KEY):
+                self.string = None
+        if match is None:
+            return len(chunk)
+        if match.group() == "\\":
+            self.escape = True
+            self.string = None
+        else:
+            self.in_string = False
+            if self.depth == 1:
+                self.key = self.string
+        return match.end()
+
+    def _read_token(self, chunk, match):
+        token = match.group()
+        if token == '"':
+            self.in_string = True
+            self.string = "" if self.depth == 1 else None
+        elif token in "{[":
+            if self.in_features and self.depth == 2 and token == "{":
+                self.parts = []
+                self.feature_start = match.start()
+            # the latest string of the collection is the key of the list
+            elif self.depth == 1 and token == "[" and self.key == FEATURES_KEY:
+                self.in_features = True
+            self.depth += 1
+        else:
+            self.depth -= 1
+            if self.in_features and self.depth == 2 and self.parts is not None:
+                self.parts.append(chunk[self.feature_start : match.end()])
+                feature = json.loads("".join(self.parts))
+                self.parts = None
+                return feature
+            self.done = self.in_features and self.depth == 1
+        return None
+
+
+def iter_features(fp, read_size=READ_SIZE):
+    """Yield the features of a GeoJSON feature collection one by one.
+
+    The file is scanned once and only the feature being read is kept in
+    memory.
+    """
+    scanner = _FeatureScanner()
+    while not scanner.done:
+        chunk = fp.read(read_size)
+        if not chunk:
+            return
+        yield from scanner.feed(chunk)
+
 
 class Command(BaseCommand):
     help = "Create map presets for berlin GEO-Data"
@@ -19,48 +134,151 @@ class Command(BaseCommand):
             default=False,
             help="GDAL version <= 1.10",
         )
+        parser.add_argument(
+            "--districts-file",
+            dest="districts_file",
+            help="Read the districts from a local GeoJSON file, "
+            "requires --regions-file",
+        )
+        parser.add_argument(
+            "--regions-file",
+            dest="regions_file",
+            help="Read the district regions from a local GeoJSON file, "
+            "requires --districts-file",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            default=False,
+            help="Update the polygons of existing presets",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of presets saved per query",
+        )
 
     def handle(self, *args, **options):
+        if bool(options["districts_file"]) != bool(options["regions_file"]):
+            # importing only one level would download the other one
+            raise CommandError(
+                "--districts-file and --regions-file must be given together"
+            )
         self.is_gdal_legacy = options["gdal_legacy"]
-        self._import_districts()
-        self._import_regions()
-
-    def _import_districts(self):
-        category = self._preset_category("Bezirke - Berlin")
-        tmpfile = "/tmp/bezirke.json"
-        url = "http://fbinter.stadt-berlin.de/fb/" "wfs/geometry/senstadt/re_bezirke/"
-        self._download_geodata(tmpfile, url, "fis:re_bezirke")
-        data = json.load(open(tmpfile, "r"))
-        for feature in data["features"]:
-            district = feature["properties"]["spatial_alias"]
-            if not map_models.MapPreset.objects.filter(name=district).exists():
-                self._create_map_preset(district, feature, category)
-        os.remove(tmpfile)
-
-    def _import_regions(self):
-        url = (
-            "http://fbinter.stadt-berlin.de/fb/"
-            "wfs/geometry/senstadt/re_bezirksregion/"
+        self.update = options["update"]
+        self.batch_size = options["batch_size"]
+        self.categories = {
+            category.name: category
+            for category in map_models.MapPresetCategory.objects.all()
+        }
+        self.presets = dict(map_models.MapPreset.objects.values_list("name", "pk"))
+
+        start = time.monotonic()
+        # the files are downloaded before the transaction is started
+        districts = self._geodata(
+            options["districts_file"],
+            "/tmp/bezirke.json",
+            DISTRICTS_URL,
+            "fis:re_bezirke",
+        )
+        regions = self._geodata(
+            options["regions_file"],
+            "/tmp/bezirksregions.json",
+            REGIONS_URL,
+            "fis:re_bezirksregion",
+        )
+        with districts as districts_fp, regions as regions_fp:
+            with transaction.atomic():
+                self._import_districts(districts_fp)
+                self._import_regions(regions_fp)
+        # bulk saves do not send the signals which invalidate the presets
+        cache.invalidate_presets()
+        self.stdout.write("Import done in {:.2f}s".format(time.monotonic() - start))
+
+    def _import_districts(self, fp):
+        self._import_features(
+            "districts",
+            (
+                (
+                    feature["properties"]["spatial_alias"],
+                    DISTRICTS_CATEGORY,
+                    feature,
+                )
+                for feature in iter_features(fp)
+            ),
+        )
+
+    def _import_regions(self, fp):
+        self._import_features(
+            "regions",
+            (
+                (
+                    feature["properties"]["BZR_NAME"],
+                    feature["properties"]["BEZNAME"],
+                    feature,
+                )
+                for feature in iter_features(fp)
+            ),
         )
-        tmpfile = "/tmp/bezirksregions.json"
-        self._download_geodata(tmpfile, url, "fis:re_bezirksregion")
-        data = json.load(open(tmpfile, "r"))
-        for feature in data["features"]:
-            district = feature["properties"]["BEZNAME"]
-            region = feature["properties"]["BZR_NAME"]
-            category = self._preset_category(district)
-            if not map_models.MapPreset.objects.filter(name=region).exists():
-                self._create_map_preset(region, feature, category)
-        os.remove(tmpfile)
+
+    def _import_features(self, label, features):
+        start = time.monotonic()
+        created = []
+        updated = []
+        counts = {"new": 0, "updated": 0, "skipped": 0}
+        for name, category_name, feature in features:
+            category = self._preset_category(category_name)
+            polygon = {"type": "FeatureCollection", "features": [feature]}
+            if name not in self.presets:
+                created.append(
+                    map_models.MapPreset(name=name, polygon=polygon, category=category)
+                )
+                # later features with the same name are skipped
+                self.presets[name] = None
+                counts["new"] += 1
+            elif self.update and self.presets[name]:
+                updated.append(
+                    map_models.MapPreset(
+                        pk=self.presets[name],
+                        name=name,
+                        polygon=polygon,
+                        category=category,
+                    )
+                )
+                counts["updated"] += 1
+            else:
+                counts["skipped"] += 1
+            if len(created) >= self.batch_size:
+                self._save(created, updated=False)
+            if len(updated) >= self.batch_size:
+                self._save(updated, updated=True)
+        self._save(created, updated=False)
+        self._save(updated, updated=True)
+        self.stdout.write(
+            "Imported {}: {new} new, {updated} updated, {skipped} skipped "
+            "in {:.2f}s".format(label, time.monotonic() - start, **counts)
+        )
+
+    def _save(self, presets, updated):
+        if updated:
+            map_models.MapPreset.objects.bulk_update(presets, ["polygon", "category"])
+        else:
+            map_models.MapPreset.objects.bulk_create(presets)
+        presets.clear()
 
     def _preset_category(self, name):
-        category, _ = map_models.MapPresetCategory.objects.get_or_create(name=name)
-        return category
+        if name not in self.categories:
+            self.categories[name] = map_models.MapPresetCategory.objects.create(
+                name=name
+            )
+        return self.categories[name]
 
-    def _create_map_preset(self, name, feature, category):
-        polygon = {"type": "FeatureCollection", "features": [feature]}
-        map_preset = map_models.MapPreset(name=name, polygon=polygon, category=category)
-        map_preset.save()
+    def _geodata(self, filename, tmpfile, url, layer):
+        if filename:
+            return open(filename, "r")
+        self._download_geodata(tmpfile, url, layer)
+        return _TemporaryFile(tmpfile)
 
     def _download_geodata(self, filename: str, url: str, layer: str):
         try:
@@ -70,7 +288,7 @@ class Command(BaseCommand):
 
         src = "WFS:{}{}".format(url, "?VERSION=1.1.0" if self.is_gdal_legacy else "")
         try:
-            print("Trying to download file from {}".format(url))
+            self.stdout.write("Trying to download file from {}".format(url))
             subprocess.check_call(
                 [
                     "ogr2ogr",
@@ -86,5 +304,20 @@ class Command(BaseCommand):
                 ]
             )
         except FileNotFoundError as e:
-            print("Make sure ogr2ogr is installed and in user PATH.")
+            self.stderr.write("Make sure ogr2ogr is installed and in user PATH.")
             sys.exit(e)
+
+
+class _TemporaryFile:
+    """Open a downloaded file and remove it when closed."""
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def __enter__(self):
+        self.fp = open(self.filename, "r")
+        return self.fp
+
+    def __exit__(self, *args):
+        self.fp.close()
+        os.remove(self.filename)
@@ -0,0 +1,14 @@
+from django.db.models import signals
+from django.dispatch import receiver
+
+from . import cache
+from .models import MapPreset
+from .models import MapPresetCategory
+
+
+@receiver(signals.post_save, sender=MapPreset)
+@receiver(signals.post_delete, sender=MapPreset)
+@receiver(signals.post_save, sender=MapPresetCategory)
+@receiver(signals.post_delete, sender=MapPresetCategory)
+def invalidate_presets(sender, instance, **kwargs):
+    cache.invalidate_presets()
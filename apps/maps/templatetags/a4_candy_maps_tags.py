@@ -0,0 +1,26 @@
+import json
+
+from django import template
+from django.template import loader
+
+from apps.maps.widgets import get_map_settings
+
+register = template.Library()
+
+
+@register.simple_tag()
+def map_display_geojson(url, polygon, hide_ratings=False):
+    """Render a map loading its points from a GeoJSON endpoint.
+
+    The points are requested for the visible area of the map whenever it is
+    moved or zoomed.
+    """
+    context = get_map_settings()
+    context.update(
+        {
+            "url": url,
+            "polygon": json.dumps(polygon),
+            "hide_ratings": json.dumps(bool(hide_ratings)),
+        }
+    )
+    return loader.render_to_string("a4_candy_maps/map_display_geojson.html", context)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from . import views
+
+app_name = "a4_candy_maps"
+
+urlpatterns = [
+    path(
+        "<int:pk>/geometry/",
+        views.preset_geometry,
+        name="preset-geometry",
+    ),
+]
@@ -0,0 +1,39 @@
+import hashlib
+
+from django.http import Http404
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+from django.views.decorators.http import require_GET
+
+from . import cache
+from . import geometry
+
+DEFAULT_LEVEL = 1
+
+
+def _get_level(request):
+    try:
+        level = int(request.GET.get("level", DEFAULT_LEVEL))
+    except ValueError:
+        raise Http404
+    if level not in geometry.SIMPLIFICATION_LEVELS:
+        raise Http404
+    return level
+
+
+def _get_etag(request, pk):
+    key = "{}-{}-{}".format(cache.get_presets_version(), pk, _get_level(request))
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+@require_GET
+@condition(etag_func=_get_etag)
+def preset_geometry(request, pk):
+    """Return the polygon of a map preset at a simplification level."""
+    polygon = cache.get_preset_geometry(pk, _get_level(request))
+    if polygon is None:
+        raise Http404
+    response = HttpResponse(polygon, content_type="application/geo+json")
+    patch_cache_control(response, public=True, max_age=60 * 60)
+    return response
@@ -4,8 +4,32 @@ from django.conf import settings
 from django.forms.widgets import Widget
 from django.template import loader
 
-from apps.maps.models import MapPreset
-from apps.maps.models import MapPresetCategory
+from apps.maps import cache
+
+
+def get_map_settings():
+    """Return the settings of the base map shared by all map widgets."""
+    use_vector_map = 0
+    mapbox_token = ""
+    omt_token = ""
+
+    if hasattr(settings, "A4_USE_VECTORMAP") and settings.A4_USE_VECTORMAP:
+        use_vector_map = 1
+
+    if hasattr(settings, "A4_MAPBOX_TOKEN"):
+        mapbox_token = settings.A4_MAPBOX_TOKEN
+
+    if hasattr(settings, "A4_OPENMAPTILES_TOKEN"):
+        omt_token = settings.A4_OPENMAPTILES_TOKEN
+
+    return {
+        "baseurl": settings.A4_MAP_BASEURL,
+        "usevectormap": use_vector_map,
+        "mapbox_token": mapbox_token,
+        "omt_token": omt_token,
+        "attribution": settings.A4_MAP_ATTRIBUTION,
+        "bbox": json.dumps(settings.A4_MAP_BOUNDING_BOX),
+    }
 
 
 class MapChoosePolygonWithPresetWidget(Widget):
@@ -14,46 +38,18 @@ class MapChoosePolygonWithPresetWidget(Widget):
 
         css = {"all": ["a4maps_choose_polygon.css"]}
 
-    def get_presets(self, category):
-        presets = MapPreset.objects.filter(category=category)
-
-        return [
-            {"name": preset.name, "polygon": json.dumps(preset.polygon)}
-            for preset in presets
-        ]
-
     def render(self, name, value, attrs, renderer=None):
-        presets_uncategorized = self.get_presets(None)
-        preset_categories = [
-            (category.name, self.get_presets(category))
-            for category in MapPresetCategory.objects.all()
-        ]
-
-        use_vector_map = 0
-        mapbox_token = ""
-        omt_token = ""
-
-        if hasattr(settings, "A4_USE_VECTORMAP") and settings.A4_USE_VECTORMAP:
-            use_vector_map = 1
-
-        if hasattr(settings, "A4_MAPBOX_TOKEN"):
-            mapbox_token = settings.A4_MAPBOX_TOKEN
-
-        if hasattr(settings, "A4_OPENMAPTILES_TOKEN"):
-            omt_token = settings.A4_OPENMAPTILES_TOKEN
-
-        context = {
-            "baseurl": settings.A4_MAP_BASEURL,
-            "usevectormap": use_vector_map,
-            "mapbox_token": mapbox_token,
-            "omt_token": omt_token,
-            "attribution": settings.A4_MAP_ATTRIBUTION,
-            "bbox": json.dumps(settings.A4_MAP_BOUNDING_BOX),
-            "name": name,
-            "polygon": value,
-            "presets_uncategorized": presets_uncategorized,
-            "preset_categories": preset_categories,
-        }
+        presets_uncategorized, preset_categories = cache.get_preset_catalogue()
+
+        context = get_map_settings()
+        context.update(
+            {
+                "name": name,
+                "polygon": value,
+                "presets_uncategorized": presets_uncategorized,
+                "preset_categories": preset_categories,
+            }
+        )
 
         return loader.render_to_string(
             "a4_candy_maps/map_choose_polygon_with_preset_widget.html", context
@@ -1,11 +1,9 @@
-from django.apps import apps
-from django.conf import settings
 from django.contrib import auth
 
 from adhocracy4.emails.mixins import ReportToAdminEmailMixin
+from apps.organisations import cache as organisation_cache
 from apps.users.emails import EmailAplus as Email
 
-Organisation = apps.get_model(settings.A4_ORGANISATIONS_MODEL)
 User = auth.get_user_model()
 
 
@@ -16,7 +14,7 @@ class NewsletterEmail(ReportToAdminEmailMixin, Email):
         organisation_pk = kwargs.pop("organisation_pk", None)
         organisation = None
         if organisation_pk:
-            organisation = Organisation.objects.get(pk=organisation_pk)
+            organisation = organisation_cache.get_organisation(organisation_pk)
         kwargs["organisation"] = organisation
 
         return super().dispatch(object, *args, **kwargs)
@@ -38,4 +36,6 @@ class NewsletterEmail(ReportToAdminEmailMixin, Email):
 
 class NewsletterEmailAll(NewsletterEmail):
     def get_receivers(self):
-        return User.objects.filter(is_active=True).distinct()
+        return User.objects.filter(
+            id__in=self.kwargs["participant_ids"], is_active=True
+        )
@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_finished(apps, schema_editor):
+    # newsletters sent before were sent at once
+    Newsletter = apps.get_model("a4_candy_newsletters", "Newsletter")
+    Newsletter.objects.update(finished=F("sent"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("a4_candy_newsletters", "0005_alter_newsletter_sender_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsletter",
+            name="receiver_count",
+            field=models.PositiveIntegerField(
+                editable=False, null=True, verbose_name="Number of receivers"
+            ),
+        ),
+        migrations.AddField(
+            model_name="newsletter",
+            name="sent_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of sent emails"
+            ),
+        ),
+        migrations.AddField(
+            model_name="newsletter",
+            name="last_receiver_id",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="newsletter",
+            name="finished",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="Sending finished"
+            ),
+        ),
+        migrations.RunPython(set_finished, migrations.RunPython.noop),
+    ]
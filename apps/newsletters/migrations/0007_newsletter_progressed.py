@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("a4_candy_newsletters", "0006_newsletter_send_progress"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsletter",
+            name="progressed",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -1,12 +1,14 @@
 import re
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_ckeditor_5.fields import CKEditor5Field
 
 from adhocracy4 import transforms
+from adhocracy4.follows.models import Follow
 from adhocracy4.images.validators import ImageAltTextValidator
 from adhocracy4.models.base import UserGeneratedContentModel
 from adhocracy4.projects.models import Project
@@ -52,6 +54,34 @@ class Newsletter(UserGeneratedContentModel):
         settings.A4_ORGANISATIONS_MODEL, null=True, blank=True, on_delete=models.CASCADE
     )
 
+    receiver_count = models.PositiveIntegerField(
+        null=True, editable=False, verbose_name=_("Number of receivers")
+    )
+    sent_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_("Number of sent emails")
+    )
+    # checkpoint of the chunked send, the receivers are sent in order of pk
+    last_receiver_id = models.PositiveIntegerField(default=0, editable=False)
+    finished = models.DateTimeField(
+        blank=True, null=True, editable=False, verbose_name=_("Sending finished")
+    )
+    # last progress of the chunked send, stalled sends are resumed
+    progressed = models.DateTimeField(blank=True, null=True, editable=False)
+
+    def get_receivers(self):
+        User = get_user_model()
+        if self.receivers == PROJECT:
+            return User.objects.filter(
+                id__in=Follow.objects.filter(
+                    project=self.project_id, enabled=True
+                ).values("creator"),
+                get_newsletters=True,
+                is_active=True,
+            )
+        if self.receivers == PLATFORM:
+            return User.objects.filter(get_newsletters=True, is_active=True)
+        return User.objects.none()
+
     @cached_property
     def body_with_absolute_urls(self):
         return self.replace_relative_media_urls(self.body)
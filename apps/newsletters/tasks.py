@@ -0,0 +1,121 @@
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.db.models import F
+from django.db.models import Q
+from django.utils import timezone
+
+from . import emails
+from .models import PLATFORM
+from .models import Newsletter
+
+logger = logging.getLogger(__name__)
+
+NEWSLETTER_CHUNK_SIZE = 100
+# seconds between two chunks, limits the number of emails sent per minute
+NEWSLETTER_CHUNK_INTERVAL = 10
+# seconds before the first retry of a failed chunk, doubled for every retry
+NEWSLETTER_RETRY_DELAY = 30
+# sends without progress for longer than this are resumed, longer than all
+# retries of a chunk together
+NEWSLETTER_RESUME_AFTER = timedelta(minutes=30)
+
+
+@shared_task(name="send_newsletter")
+def send_newsletter(newsletter_id, organisation_pk=None):
+    """
+    Start or resume sending a newsletter from its last checkpoint
+    """
+    newsletter = Newsletter.objects.filter(pk=newsletter_id).first()
+    if newsletter is None or newsletter.finished:
+        return
+    if newsletter.receivers == PLATFORM and not newsletter.creator.is_superuser:
+        logger.warning(
+            "newsletter %s to the platform not sent, created by a non superuser",
+            newsletter_id,
+        )
+        # finish it, so it is not resumed again
+        Newsletter.objects.filter(pk=newsletter_id).update(finished=timezone.now())
+        return
+    update = {"progressed": timezone.now()}
+    if newsletter.receiver_count is None:
+        update["receiver_count"] = newsletter.get_receivers().count()
+    Newsletter.objects.filter(pk=newsletter_id).update(**update)
+    send_newsletter_chunk.delay(
+        newsletter_id, newsletter.last_receiver_id, organisation_pk
+    )
+
+
+@shared_task(bind=True, name="send_newsletter_chunk", max_retries=5)
+def send_newsletter_chunk(self, newsletter_id, after_id, organisation_pk=None):
+    """
+    Send a newsletter to the next receivers after the checkpoint
+
+    The checkpoint is advanced after every receiver, a failed chunk is
+    retried with the receivers it has not been sent to yet.
+    """
+    newsletter = Newsletter.objects.filter(pk=newsletter_id).first()
+    if newsletter is None or newsletter.last_receiver_id != after_id:
+        # deleted or the chunk was already sent
+        return 0
+    receiver_ids = list(
+        newsletter.get_receivers()
+        .filter(pk__gt=after_id)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:NEWSLETTER_CHUNK_SIZE]
+    )
+    if not receiver_ids:
+        Newsletter.objects.filter(pk=newsletter_id).update(finished=timezone.now())
+        return 0
+
+    if newsletter.receivers == PLATFORM:
+        email = emails.NewsletterEmailAll()
+    else:
+        email = emails.NewsletterEmail()
+    for receiver_id in receiver_ids:
+        try:
+            email.dispatch(
+                newsletter,
+                participant_ids=[receiver_id],
+                organisation_pk=organisation_pk,
+            )
+        except Exception as exc:
+            raise self.retry(
+                args=(newsletter_id, after_id, organisation_pk),
+                exc=exc,
+                countdown=NEWSLETTER_RETRY_DELAY * 2**self.request.retries,
+            )
+        advanced = Newsletter.objects.filter(
+            pk=newsletter_id, last_receiver_id=after_id
+        ).update(
+            last_receiver_id=receiver_id,
+            sent_count=F("sent_count") + 1,
+            progressed=timezone.now(),
+        )
+        if not advanced:
+            # another task is sending the newsletter
+            return 0
+        after_id = receiver_id
+
+    send_newsletter_chunk.apply_async(
+        (newsletter_id, after_id, organisation_pk),
+        countdown=NEWSLETTER_CHUNK_INTERVAL,
+    )
+    return len(receiver_ids)
+
+
+@shared_task(name="resume_newsletters")
+def resume_newsletters():
+    """
+    Resume the newsletters whose sending stalled
+
+    A send stalls if a chunk failed on all retries or its task got lost.
+    """
+    stalled = timezone.now() - NEWSLETTER_RESUME_AFTER
+    newsletters = Newsletter.objects.filter(
+        Q(progressed__lt=stalled) | Q(progressed__isnull=True, sent__lt=stalled),
+        finished__isnull=True,
+    ).values_list("pk", "organisation_id")
+    for newsletter_id, organisation_pk in newsletters:
+        send_newsletter.delay(newsletter_id, organisation_pk)
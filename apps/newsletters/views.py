@@ -10,11 +10,10 @@ from django.utils.translation import gettext_lazy as _
 from django.views import generic
 
 from adhocracy4.dashboard import mixins as a4dashboard_mixins
-from adhocracy4.follows.models import Follow
 from adhocracy4.rules import mixins as rules_mixins
 
-from . import emails
 from . import models
+from . import tasks
 from .forms import RestrictedNewsletterForm
 
 Organisation = apps.get_model(settings.A4_ORGANISATIONS_MODEL)
@@ -32,6 +31,10 @@ class NewsletterCreateView(rules_mixins.PermissionRequiredMixin, generic.CreateV
         organisation = form.cleaned_data["organisation"]
         if not self._check_permission(organisation, self.request.user):
             raise PermissionDenied
+        # only superusers may send to every user of the platform
+        receivers = int(form.cleaned_data["receivers"])
+        if receivers == models.PLATFORM and not self.request.user.is_superuser:
+            raise PermissionDenied
 
         instance = form.save(commit=False)
         instance.creator = self.request.user
@@ -39,19 +42,8 @@ class NewsletterCreateView(rules_mixins.PermissionRequiredMixin, generic.CreateV
         instance.save()
         form.save_m2m()
 
-        receivers = int(form.cleaned_data["receivers"])
-
-        if receivers == models.PROJECT:
-            participant_ids = Follow.objects.filter(
-                project=form.cleaned_data["project"].pk, enabled=True
-            ).values_list("creator", flat=True)
-
-        else:
-            participant_ids = []
-
-        emails.NewsletterEmail.send(
-            instance, participant_ids=list(participant_ids), **self.get_email_kwargs()
-        )
+        # the receivers are looked up and sent to in chunks by the task
+        tasks.send_newsletter.delay(instance.pk, **self.get_email_kwargs())
         messages.success(
             self.request,
             _("Newsletter has been saved and " "will be sent to the recipients."),
@@ -79,6 +71,13 @@ class DashboardNewsletterCreateView(
         kwargs["initial"]["receivers"] = models.PROJECT
         return kwargs
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["newsletters_in_progress"] = models.Newsletter.objects.filter(
+            organisation=self.organisation, finished__isnull=True
+        ).order_by("created")
+        return context
+
     def get_success_url(self):
         return reverse(
             "a4dashboard:newsletter-create",
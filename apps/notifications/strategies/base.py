@@ -4,6 +4,8 @@ from abc import abstractmethod
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
+from apps.organisations import cache as organisation_cache
+
 User = get_user_model()
 
 
@@ -11,12 +13,16 @@ class BaseNotificationStrategy(ABC):
     """Abstract base class for all notification strategies"""
 
     def get_organisation(self, obj):
-        if hasattr(obj, "organisation"):
-            return obj.organisation
+        if hasattr(obj, "organisation_id"):
+            return organisation_cache.get_organisation(obj.organisation_id)
         elif hasattr(obj, "project"):
-            return obj.project.organisation
+            return self._get_project_organisation(obj.project)
         pass
 
+    def _get_project_organisation(self, project):
+        # the organisations are shared by all notifications of a process
+        return organisation_cache.get_organisation(project.organisation_id)
+
     @abstractmethod
     def get_recipients(self, obj) -> list[User]:
         """Get all potential recipients (before preference filtering)"""
@@ -20,7 +20,7 @@ class CommentHighlighted(BaseNotificationStrategy):
         return []
 
     def get_organisation(self, comment):
-        return comment.project.organisation
+        return self._get_project_organisation(comment.project)
 
     def create_notification_data(self, comment) -> dict:
         # Determine if there's a specific post URL or just project URL
@@ -65,7 +65,7 @@ class ProjectComment(ProjectNotificationStrategy):
     """Strategy for notifications when someone comments on project content"""
 
     def get_organisation(self, comment):
-        return comment.project.organisation
+        return self._get_project_organisation(comment.project)
 
     def get_recipients(self, comment) -> List[User]:
         """Get moderators and content creator as potential recipients"""
@@ -135,7 +135,7 @@ class CommentReply(BaseNotificationStrategy):
         return comment.parent_comment.first()
 
     def get_organisation(self, comment):
-        return comment.project.organisation
+        return self._get_project_organisation(comment.project)
 
     def create_notification_data(self, comment) -> dict:
         parent_comment = self._get_parent_comment(comment)
@@ -12,7 +12,7 @@ class OfflineEventCreated(ProjectNotificationStrategy):
     """Strategy for notifications when an offline event is added to a project"""
 
     def get_organisation(self, event):
-        return event.project.organisation
+        return self._get_project_organisation(event.project)
 
     def get_recipients(self, event) -> list[User]:
         return self._get_event_recipients(event)
@@ -59,7 +59,7 @@ class OfflineEventDeleted(ProjectNotificationStrategy):
     """Strategy for event reminder notifications"""
 
     def get_organisation(self, event):
-        return event.project.organisation
+        return self._get_project_organisation(event.project)
 
     def get_recipients(self, event) -> list[User]:
         return self._get_event_recipients(event)
@@ -104,7 +104,7 @@ class OfflineEventReminder(ProjectNotificationStrategy):
     """Strategy for event reminder notifications"""
 
     def get_organisation(self, event):
-        return event.project.organisation
+        return self._get_project_organisation(event.project)
 
     def get_recipients(self, event) -> list[User]:
         return self._get_event_recipients(event)
@@ -149,7 +149,7 @@ class OfflineEventReminder(ProjectNotificationStrategy):
 
 class OfflineEventUpdate(ProjectNotificationStrategy):
     def get_organisation(self, event):
-        return event.project.organisation
+        return self._get_project_organisation(event.project)
 
     def get_recipients(self, event) -> list[User]:
         return self._get_event_recipients(event)
@@ -152,7 +152,7 @@ class CommentBlocked(BaseNotificationStrategy):
     """
 
     def get_organisation(self, comment):
-        return comment.project.organisation
+        return self._get_project_organisation(comment.project)
 
     def get_recipients(self, comment) -> List[User]:
         """Notify the comment creator if they exist."""
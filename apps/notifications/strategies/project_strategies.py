@@ -13,7 +13,7 @@ class ProjectNotificationStrategy(BaseNotificationStrategy):
     """Base class for project-related notifications"""
 
     def get_organisation(self, project):
-        return project.organisation
+        return self._get_project_organisation(project)
 
     def _get_project_followers(self, project):
         """Get followers for a project - with optional caching"""
@@ -126,7 +126,7 @@ class ProjectEnded(ProjectNotificationStrategy):
 
 class ProjectInvitationCreated(ProjectNotificationStrategy):
     def get_organisation(self, invitation):
-        return invitation.project.organisation
+        return self._get_project_organisation(invitation.project)
 
     def get_recipients(self, invitation) -> List[User]:
         user_email = invitation.email
@@ -173,7 +173,7 @@ class ProjectInvitationCreated(ProjectNotificationStrategy):
 class ProjectModerationInvitationReceived(ProjectNotificationStrategy):
 
     def get_organisation(self, invitation):
-        return invitation.project.organisation
+        return self._get_project_organisation(invitation.project)
 
     def get_recipients(self, invitation) -> List[User]:
         user_email = invitation.email
@@ -288,7 +288,7 @@ class UserContentCreated(ProjectNotificationStrategy):
         super().__init__()
 
     def get_organisation(self, obj):
-        return obj.project.organisation
+        return self._get_project_organisation(obj.project)
 
     def get_recipients(self, obj) -> List[User]:
         return self._get_project_moderators(obj.project)
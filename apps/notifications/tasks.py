@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 from celery import shared_task
+from django.apps import apps
 from django.db.models import Q
 from django.utils import timezone
 
@@ -10,8 +11,15 @@ from apps.offlineevents.models import OfflineEvent
 from .services import NotificationService
 from .strategies import OfflineEventReminder
 from .strategies import ProjectEnded
+from .strategies import ProjectInvitationCreated
+from .strategies import ProjectModerationInvitationReceived
 from .strategies import ProjectStarted
 
+INVITE_STRATEGIES = {
+    "a4_candy_projects.participantinvite": ProjectInvitationCreated,
+    "a4_candy_projects.moderatorinvite": ProjectModerationInvitationReceived,
+}
+
 
 @shared_task(name="send_recently_started_project_notifications")
 def send_recently_started_project_notifications():
@@ -95,3 +103,22 @@ def send_upcoming_event_notifications():
         NotificationService.create_notifications(event, strategy)
 
     return
+
+
+@shared_task(name="send_invite_notifications")
+def send_invite_notifications(invite_model, project_id, emails):
+    """
+    Send notifications for invites created with bulk_invite
+    """
+    model = apps.get_model(invite_model)
+    strategy = INVITE_STRATEGIES[invite_model]()
+    invites = model.objects.filter(
+        project_id=project_id, email__in=emails
+    ).select_related("project__organisation")
+    sent = 0
+    for invite in invites:
+        NotificationService.create_notifications(invite, strategy)
+        # the progress shown on the dashboard
+        model.objects.filter(pk=invite.pk).update(notification_sent=True)
+        sent += 1
+    return sent
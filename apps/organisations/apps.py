@@ -7,3 +7,4 @@ class Config(AppConfig):
 
     def ready(self):
         from . import function_overwrites  # noqa
+        from . import signals  # noqa
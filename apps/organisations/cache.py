@@ -0,0 +1,205 @@
+"""Caches for the organisation landing page.
+
+Anonymous users all see the same projects, so the rendered project list is
+shared between them. For logged-in users the ids of the public and
+semipublic projects are shared as well and only the ids of the private
+projects visible to the user are cached per user. The projects are sorted
+into the active, future and past lists when they are loaded, so projects
+move between the lists when phases start or end without invalidating the
+caches.
+
+All caches of an organisation are invalidated at once by replacing its
+version, which is part of every cache key.
+
+Organisations looked up by slug or pk are kept in a small in-process LRU.
+Only the field values are kept, every lookup returns a new instance, so
+callers never share an instance or its translations. Saving or deleting an
+organisation replaces a shared version, so every process drops its entries
+on the next lookup.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import get_language
+
+from adhocracy4.projects.enums import Access
+from adhocracy4.projects.models import Project
+from apps.projects import query
+
+from .models import Organisation
+
+PROJECTS_VERSION_KEY = "organisation_projects_version_{organisation_id}"
+PUBLIC_PROJECTS_KEY = "organisation_public_projects_{organisation_id}_{version}"
+PRIVATE_PROJECTS_KEY = (
+    "organisation_private_projects_{organisation_id}_{version}_{user_id}_{superuser}"
+)
+PROJECTS_FRAGMENT_KEY = (
+    "organisation_projects_fragment_{organisation_id}_{version}_{language}"
+)
+PROJECTS_TIMEOUT = 60 * 60
+# the rendered list shows the remaining participation time
+PROJECTS_FRAGMENT_TIMEOUT = 60
+
+ORGANISATIONS_VERSION_KEY = "organisations_version"
+ORGANISATIONS_MAX_SIZE = 128
+
+_ORGANISATION_FIELDS = [field.attname for field in Organisation._meta.concrete_fields]
+
+_organisations = OrderedDict()
+_organisations_version = None
+_organisations_lock = threading.Lock()
+
+
+def invalidate_organisations():
+    global _organisations_version
+    version = uuid.uuid4().hex
+    cache.set(ORGANISATIONS_VERSION_KEY, version, timeout=None)
+    with _organisations_lock:
+        _organisations.clear()
+        _organisations_version = version
+
+
+def _get_organisations_version():
+    version = cache.get(ORGANISATIONS_VERSION_KEY)
+    if version is None:
+        cache.add(ORGANISATIONS_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(ORGANISATIONS_VERSION_KEY)
+    return version
+
+
+def _to_instance(values):
+    return Organisation.from_db(
+        router.db_for_read(Organisation), _ORGANISATION_FIELDS, values
+    )
+
+
+def _get_organisation(field, value):
+    global _organisations_version
+    key = (field, value)
+    version = _get_organisations_version()
+    with _organisations_lock:
+        if version != _organisations_version:
+            _organisations.clear()
+            _organisations_version = version
+        elif key in _organisations:
+            _organisations.move_to_end(key)
+            values = _organisations[key]
+            return _to_instance(values)
+
+    values = (
+        Organisation.objects.filter(**{field: value})
+        .values_list(*_ORGANISATION_FIELDS)
+        .first()
+    )
+    if values is None:
+        return None
+    with _organisations_lock:
+        if version == _organisations_version:
+            _organisations[key] = values
+            while len(_organisations) > ORGANISATIONS_MAX_SIZE:
+                _organisations.popitem(last=False)
+    return _to_instance(values)
+
+
+def get_organisation_by_slug(slug):
+    """Return the organisation with the given slug or None."""
+    return _get_organisation("slug", slug)
+
+
+def get_organisation(pk):
+    """Return the organisation with the given pk or None."""
+    return _get_organisation("pk", pk)
+
+
+def invalidate_projects(*organisation_ids):
+    for organisation_id in set(organisation_ids):
+        cache.set(
+            PROJECTS_VERSION_KEY.format(organisation_id=organisation_id),
+            uuid.uuid4().hex,
+            timeout=None,
+        )
+
+
+def _get_projects_version(organisation_id):
+    key = PROJECTS_VERSION_KEY.format(organisation_id=organisation_id)
+    cache.add(key, uuid.uuid4().hex, timeout=None)
+    return cache.get(key)
+
+
+def _get_project_ids(projects):
+    return list(projects.values_list("pk", flat=True))
+
+
+def get_public_project_ids(organisation):
+    key = PUBLIC_PROJECTS_KEY.format(
+        organisation_id=organisation.pk,
+        version=_get_projects_version(organisation.pk),
+    )
+    return cache.get_or_set(
+        key,
+        lambda: _get_project_ids(
+            organisation.projects.filter(access__in=[Access.PUBLIC, Access.SEMIPUBLIC])
+        ),
+        PROJECTS_TIMEOUT,
+    )
+
+
+def get_private_project_ids(organisation, user):
+    if not user.is_authenticated:
+        return []
+    key = PRIVATE_PROJECTS_KEY.format(
+        organisation_id=organisation.pk,
+        version=_get_projects_version(organisation.pk),
+        user_id=user.pk,
+        superuser=user.is_superuser,
+    )
+    return cache.get_or_set(
+        key,
+        lambda: _get_project_ids(
+            query.filter_viewable(
+                organisation.projects.filter(access=Access.PRIVATE), user
+            )
+        ),
+        PROJECTS_TIMEOUT,
+    )
+
+
+def get_projects_list(organisation, user):
+    """Return the active, future and past projects visible to the user."""
+    project_ids = get_public_project_ids(organisation) + get_private_project_ids(
+        organisation, user
+    )
+    projects = query.sort_by_participation(
+        Project.objects.filter(pk__in=project_ids), past_by_latest_end=True
+    )
+
+    active, future, past = [], [], []
+    for project in projects:
+        if project.participation_status == query.PARTICIPATION_ACTIVE:
+            active.append(project)
+        elif project.participation_status == query.PARTICIPATION_FUTURE:
+            future.append(project)
+        else:
+            past.append(project)
+    return active, future, past
+
+
+def get_projects_fragment(organisation, render):
+    """Return the rendered project list shared by all anonymous users.
+
+    render is only called if the list is not cached for the language yet.
+    """
+    key = PROJECTS_FRAGMENT_KEY.format(
+        organisation_id=organisation.pk,
+        version=_get_projects_version(organisation.pk),
+        language=get_language(),
+    )
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render()
+        cache.set(key, fragment, PROJECTS_FRAGMENT_TIMEOUT)
+    return fragment
@@ -0,0 +1,19 @@
+from . import cache
+
+
+class CurrentOrganisationMiddleware:
+    """Resolve the organisation of the current url once per request.
+
+    The organisation is available as request.organisation and is None if the
+    url does not belong to an organisation.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        slug = view_kwargs.get("organisation_slug")
+        request.organisation = cache.get_organisation_by_slug(slug) if slug else None
@@ -0,0 +1,79 @@
+from django.db.models import signals
+from django.dispatch import receiver
+
+from adhocracy4.modules.models import Module
+from adhocracy4.phases.models import Phase
+from adhocracy4.projects.models import Project
+
+from . import cache
+from .models import Member
+from .models import Organisation
+
+
+def _invalidate_projects_of(project_ids):
+    cache.invalidate_projects(
+        *Project.objects.filter(pk__in=project_ids).values_list(
+            "organisation_id", flat=True
+        )
+    )
+
+
+@receiver(signals.post_save, sender=Organisation)
+@receiver(signals.post_delete, sender=Organisation)
+def invalidate_organisation(sender, instance, **kwargs):
+    cache.invalidate_projects(instance.pk)
+    cache.invalidate_organisations()
+
+
+@receiver(signals.post_save, sender=Project)
+@receiver(signals.post_delete, sender=Project)
+def invalidate_project(sender, instance, **kwargs):
+    cache.invalidate_projects(instance.organisation_id)
+
+
+@receiver(signals.post_save, sender=Module)
+@receiver(signals.post_delete, sender=Module)
+def invalidate_module(sender, instance, **kwargs):
+    _invalidate_projects_of([instance.project_id])
+
+
+@receiver(signals.post_save, sender=Phase)
+@receiver(signals.post_delete, sender=Phase)
+def invalidate_phase(sender, instance, **kwargs):
+    _invalidate_projects_of(
+        Module.objects.filter(pk=instance.module_id).values_list(
+            "project_id", flat=True
+        )
+    )
+
+
+@receiver(signals.post_save, sender=Member)
+@receiver(signals.post_delete, sender=Member)
+def invalidate_member(sender, instance, **kwargs):
+    cache.invalidate_projects(instance.organisation_id)
+
+
+@receiver(signals.m2m_changed, sender=Organisation.initiators.through)
+def invalidate_initiators(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if not reverse:
+        cache.invalidate_projects(instance.pk)
+    elif pk_set:
+        cache.invalidate_projects(*pk_set)
+    else:
+        # clearing from the user side does not provide the organisations
+        cache.invalidate_projects(*Organisation.objects.values_list("pk", flat=True))
+
+
+@receiver(signals.m2m_changed, sender=Project.participants.through)
+@receiver(signals.m2m_changed, sender=Project.moderators.through)
+def invalidate_project_users(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if not reverse:
+        cache.invalidate_projects(instance.organisation_id)
+    elif pk_set:
+        _invalidate_projects_of(pk_set)
+    else:
+        cache.invalidate_projects(*Organisation.objects.values_list("pk", flat=True))
@@ -2,17 +2,26 @@ from django import template
 from django.urls import Resolver404
 from django.urls import resolve
 
-from apps.organisations.models import Organisation
+from apps.organisations import cache
 
 register = template.Library()
 
 
 @register.simple_tag(takes_context=True)
 def get_current_organisation(context):
-    try:
-        request = context.request
-        resolver = resolve(request.path_info)
-        if resolver.kwargs and "organisation_slug" in resolver.kwargs:
-            return Organisation.objects.get(slug=resolver.kwargs["organisation_slug"])
-    except (Resolver404, Organisation.DoesNotExist, AttributeError):
-        pass
+    request = getattr(context, "request", None)
+    if request is None:
+        return None
+    if not hasattr(request, "organisation"):
+        # set by CurrentOrganisationMiddleware unless no view was resolved,
+        # e.g. on error pages
+        request.organisation = None
+        try:
+            resolver = resolve(request.path_info)
+            if "organisation_slug" in resolver.kwargs:
+                request.organisation = cache.get_organisation_by_slug(
+                    resolver.kwargs["organisation_slug"]
+                )
+        except Resolver404:
+            pass
+    return request.organisation
@@ -6,8 +6,10 @@ from io import BytesIO
 from django.conf import settings
 from django.contrib.messages.views import SuccessMessageMixin
 from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
+from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.views import generic
@@ -19,24 +21,43 @@ from PIL import ImageFont
 from adhocracy4.dashboard import mixins as a4dashboard_mixins
 from apps.projects.models import Project
 
+from . import cache
 from . import forms
 from .forms import SOCIAL_MEDIA_SIZES
 from .forms import CommunicationContentCreationForm
 from .models import Organisation
 
 
-class OrganisationView(DetailView):
+class CurrentOrganisationMixin:
+    """Show the organisation resolved by CurrentOrganisationMiddleware."""
+
+    def get_object(self, queryset=None):
+        if self.request.organisation is None:
+            raise Http404(_("No organisation found matching the query"))
+        return self.request.organisation
+
+
+class OrganisationView(CurrentOrganisationMixin, DetailView):
     template_name = "a4_candy_organisations/organisation_landing_page.html"
     model = Organisation
     slug_url_kwarg = "organisation_slug"
 
+    projects_template_name = (
+        "a4_candy_organisations/includes/organisation_projects.html"
+    )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        active, future, past = self.object.get_projects_list(self.request.user)
+        if self.request.user.is_authenticated:
+            context.update(self.get_projects_context())
+        else:
+            context["projects_fragment"] = cache.get_projects_fragment(
+                self.object, self.render_projects
+            )
+        return context
 
-        context["active_projects"] = active
-        context["future_projects"] = future
-        context["past_projects"] = past
+    def get_projects_context(self):
+        active, future, past = cache.get_projects_list(self.object, self.request.user)
 
         project_headline = ""
         if active:
@@ -45,36 +66,48 @@ class OrganisationView(DetailView):
             project_headline = _("Upcoming participation")
         elif past:
             project_headline = _("Ended participation")
-        context["project_headline"] = project_headline
 
-        return context
+        return {
+            "projects": active + future + past,
+            "active_projects": active,
+            "future_projects": future,
+            "past_projects": past,
+            "project_headline": project_headline,
+        }
+
+    def render_projects(self):
+        context = self.get_projects_context()
+        context["object"] = context["organisation"] = self.object
+        return render_to_string(
+            self.projects_template_name, context, request=self.request
+        )
 
 
-class InformationView(DetailView):
+class InformationView(CurrentOrganisationMixin, DetailView):
     template_name = "a4_candy_organisations/organisation_information.html"
     model = Organisation
     slug_url_kwarg = "organisation_slug"
 
 
-class ImprintView(DetailView):
+class ImprintView(CurrentOrganisationMixin, DetailView):
     template_name = "a4_candy_organisations/organisation_imprint.html"
     model = Organisation
     slug_url_kwarg = "organisation_slug"
 
 
-class TermsOfUseView(DetailView):
+class TermsOfUseView(CurrentOrganisationMixin, DetailView):
     template_name = "a4_candy_organisations/organisation_terms_of_use.html"
     model = Organisation
     slug_url_kwarg = "organisation_slug"
 
 
-class NetiquetteView(DetailView):
+class NetiquetteView(CurrentOrganisationMixin, DetailView):
     template_name = "a4_candy_organisations/organisation_netiquette.html"
     model = Organisation
     slug_url_kwarg = "organisation_slug"
 
 
-class DataProtectionView(DetailView):
+class DataProtectionView(CurrentOrganisationMixin, DetailView):
     template_name = "a4_candy_organisations/organisation_data_protection.html"
     model = Organisation
     slug_url_kwarg = "organisation_slug"
@@ -1,12 +1,24 @@
+import hashlib
+
+from django.db.models import Count
+from django.db.models import Exists
+from django.db.models import Max
+from django.db.models import Min
+from django.db.models import OuterRef
+from django.db.models import Prefetch
 from django.db.models import Q
 from django.utils import timezone
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
 from rest_framework import permissions
 from rest_framework import viewsets
 
 from adhocracy4.modules.models import Module
+from adhocracy4.phases.models import Phase
 from adhocracy4.projects.enums import Access
 from adhocracy4.projects.models import Project
 
+from . import helpers
 from .serializers import AppModuleSerializer
 from .serializers import AppProjectSerializer
 from .serializers import ModerationProjectSerializer
@@ -20,23 +32,99 @@ class AppProjectsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         now = timezone.now()
-        return Project.objects.filter(
-            Q(access=Access.PUBLIC) | Q(access=Access.SEMIPUBLIC),
-            Q(module__phase__start_date__lte=now)
-            | Q(module__phase__start_date__gt=now),
-            module__phase__end_date__gt=now,
-            is_draft=False,
-            is_archived=False,
-            organisation__enable_geolocation=True,  # TODO: replace with a django filter later
+        running_or_future_phases = Phase.objects.filter(
+            module__project=OuterRef("pk"),
+            start_date__isnull=False,
+            end_date__gt=now,
+        )
+        # module_start and module_end are annotated, so the serializer can
+        # determine running, future and past modules without further queries
+        published_modules = (
+            Module.objects.filter(is_draft=False)
+            .annotate(module_start=Min("phase__start_date"))
+            .annotate(module_end=Max("phase__end_date"))
+        )
+        return (
+            Project.objects.filter(
+                Q(access=Access.PUBLIC) | Q(access=Access.SEMIPUBLIC),
+                Exists(running_or_future_phases),
+                is_draft=False,
+                is_archived=False,
+                organisation__enable_geolocation=True,  # TODO: replace with a django filter later
+            )
+            .select_related("organisation")
+            .prefetch_related(
+                Prefetch(
+                    "module_set",
+                    queryset=published_modules,
+                    to_attr="prefetched_published_modules",
+                )
+            )
         )
 
+    def list(self, request, *args, **kwargs):
+        # Polling app clients get a 304 if nothing changed since their last
+        # request, without serializing the projects again.
+        conditional_list = condition(
+            etag_func=self.get_etag, last_modified_func=self.get_last_modified
+        )(super().list)
+        return conditional_list(request, *args, **kwargs)
+
+    def _get_list_state(self):
+        """Return the number of listed projects and their last modification.
+
+        Besides edits of the projects themselves, the list changes whenever
+        modules, phases or organisations are edited, when a phase starts or
+        ends and, as the remaining participation time is shown, every hour.
+        """
+        if not hasattr(self, "_list_state"):
+            now = timezone.now()
+            projects = self.get_queryset().aggregate(
+                count=Count("pk"),
+                last_created=Max("created"),
+                last_modified=Max("modified"),
+            )
+            phases = Phase.objects.aggregate(
+                last_start=Max("start_date", filter=Q(start_date__lte=now)),
+                last_end=Max("end_date", filter=Q(end_date__lte=now)),
+            )
+            last_modified = max(
+                date
+                for date in (
+                    projects["last_created"],
+                    projects["last_modified"],
+                    phases["last_start"],
+                    phases["last_end"],
+                    helpers.get_app_projects_changed(),
+                    now.replace(minute=0, second=0, microsecond=0),
+                )
+                if date
+            )
+            self._list_state = projects["count"], last_modified
+        return self._list_state
+
+    def get_last_modified(self, request, *args, **kwargs):
+        _count, last_modified = self._get_list_state()
+        return last_modified
+
+    def get_etag(self, request, *args, **kwargs):
+        count, last_modified = self._get_list_state()
+        state = "{}-{}-{}".format(count, last_modified.isoformat(), get_language())
+        return hashlib.md5(state.encode()).hexdigest()
+
 
 class AppModuleViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = AppModuleSerializer
     permission_classes = (permissions.IsAuthenticated,)
 
     def get_queryset(self):
-        return Module.objects.filter(is_draft=False, project__is_app_accessible=True)
+        return Module.objects.filter(
+            is_draft=False, project__is_app_accessible=True
+        ).prefetch_related(
+            Prefetch("phase_set", queryset=Phase.objects.order_by("start_date")),
+            "label_set",
+            "category_set",
+        )
 
 
 class ModerationProjectsViewSet(viewsets.ReadOnlyModelViewSet):
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 
+from apps.organisations import cache as organisation_cache
 from apps.users.emails import EmailAplus as Email
 
 User = get_user_model()
@@ -9,7 +10,7 @@ class InviteParticipantEmail(Email):
     template_name = "a4_candy_projects/emails/invite_participant"
 
     def get_organisation(self):
-        return self.object.project.organisation
+        return organisation_cache.get_organisation(self.object.project.organisation_id)
 
     def get_receivers(self):
         return [self.object.email]
@@ -19,7 +20,7 @@ class InviteModeratorEmail(Email):
     template_name = "a4_candy_projects/emails/invite_moderator"
 
     def get_organisation(self):
-        return self.object.project.organisation
+        return organisation_cache.get_organisation(self.object.project.organisation_id)
 
     def get_receivers(self):
         return [self.object.email]
@@ -29,7 +30,7 @@ class WelcomeToPrivateProjectEmail(Email):
     template_name = "a4_candy_projects/emails/welcome_participant"
 
     def get_organisation(self):
-        return self.object.organisation
+        return organisation_cache.get_organisation(self.object.organisation_id)
 
     def get_receivers(self):
         participant_pks = self.kwargs["participant_pks"]
@@ -1,13 +1,22 @@
 from datetime import timedelta
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Count
+from django.db.models import Min
 from django.db.models import Q
 from django.utils import timezone
 
 from adhocracy4.comments.models import Comment
 from adhocracy4.reports.models import Report
 
+APP_PROJECTS_CHANGED_CACHE_KEY = "app_projects_changed"
+PROJECT_STATS_CACHE_KEY = "project_stats_{project_id}"
+PROJECT_STATS_TIMEOUT = 60 * 60 * 24
+MODULE_ENTRIES_CACHE_KEY = "module_entries_{module_id}"
+MODULE_ENTRIES_TIMEOUT = 60 * 60 * 24
+INVITES_PROGRESS_TIMEOUT = 60 * 60 * 24
+
 
 def get_all_comments_project(project):
     return Comment.objects.filter(
@@ -41,3 +50,56 @@ def get_num_reported_unread_comments(project):
         .filter(num_reports__gt=0)
         .count()
     )
+
+
+def set_app_projects_changed():
+    cache.set(APP_PROJECTS_CHANGED_CACHE_KEY, timezone.now(), timeout=None)
+
+
+def get_app_projects_changed():
+    """Return when projects, modules, phases or organisations last changed.
+
+    If the cache has been cleared the change date is unknown and is reset
+    to now, so clients refetch the app projects once.
+    """
+    cache.add(APP_PROJECTS_CHANGED_CACHE_KEY, timezone.now(), timeout=None)
+    return cache.get(APP_PROJECTS_CHANGED_CACHE_KEY)
+
+
+def invalidate_project_stats(project_id):
+    cache.delete(PROJECT_STATS_CACHE_KEY.format(project_id=project_id))
+
+
+def increase_module_entries(module_id):
+    try:
+        cache.incr(MODULE_ENTRIES_CACHE_KEY.format(module_id=module_id))
+    except ValueError:
+        # not cached, the entries are counted when they are shown next
+        pass
+
+
+def invalidate_module_entries(module_id):
+    cache.delete(MODULE_ENTRIES_CACHE_KEY.format(module_id=module_id))
+
+
+def get_invite_progress(invite_model, project_id):
+    """Return the number of sent and queued invite notifications.
+
+    Returns None if no notifications are being sent. The queued
+    notifications are those of the invites created since the oldest invite
+    still waiting for its notification. Invites waiting for longer than
+    INVITES_PROGRESS_TIMEOUT are not shown, their task has failed.
+    """
+    invites = invite_model.objects.filter(
+        project_id=project_id,
+        created__gte=timezone.now() - timedelta(seconds=INVITES_PROGRESS_TIMEOUT),
+    )
+    oldest = invites.filter(notification_sent=False).aggregate(Min("created"))[
+        "created__min"
+    ]
+    if oldest is None:
+        return None
+    progress = invites.filter(created__gte=oldest).aggregate(
+        sent=Count("pk", filter=Q(notification_sent=True)), queued=Count("pk")
+    )
+    return progress["sent"], progress["queued"]
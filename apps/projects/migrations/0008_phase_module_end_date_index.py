@@ -0,0 +1,36 @@
+from django.db import migrations
+
+INDEX_NAME = "a4phases_phase_module_end_date_idx"
+
+
+class Migration(migrations.Migration):
+    """Index the phases by module and end date.
+
+    The app projects list checks for running or future phases of each
+    project. The phase model lives in adhocracy4, which is a separate
+    package shared with other platforms, and only this query needs the
+    index, so it is added here instead of in Phase.Meta.
+
+    Migration operations can only change the state of models of their own
+    app, so the index is not part of the migration state of a4phases. The
+    autodetector never sees it and does not try to drop it. The SQL uses a
+    fixed name and IF [NOT] EXISTS, so it does not fail if adhocracy4 adds
+    an index with the same name later, and it is dropped again on reverse.
+    """
+
+    dependencies = [
+        ("a4_candy_projects", "0007_projectinsight_unregistered_participants"),
+        ("a4phases", "__first__"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS {} "
+                "ON a4phases_phase (module_id, end_date)".format(INDEX_NAME)
+            ),
+            reverse_sql="DROP INDEX IF EXISTS {}".format(INDEX_NAME),
+            # the state of the a4phases models cannot be changed from here
+            state_operations=[],
+        )
+    ]
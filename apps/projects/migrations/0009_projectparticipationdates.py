@@ -0,0 +1,43 @@
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("a4projects", "0039_add_alt_text_to_field"),
+        ("a4_candy_projects", "0008_phase_module_end_date_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectParticipationDates",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "participation_start",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+                (
+                    "participation_end",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participation_period",
+                        to="a4projects.project",
+                    ),
+                ),
+            ],
+        ),
+    ]
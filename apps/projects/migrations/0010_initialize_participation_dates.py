@@ -0,0 +1,52 @@
+from django.db import migrations
+from django.db import models
+
+
+def initialize_participation_dates(apps, schema_editor):
+    Project = apps.get_model("a4projects", "Project")
+    ProjectParticipationDates = apps.get_model(
+        "a4_candy_projects", "ProjectParticipationDates"
+    )
+
+    projects = Project.objects.annotate(
+        start=models.Min(
+            "module__phase__start_date", filter=models.Q(module__is_draft=False)
+        ),
+        end=models.Max(
+            "module__phase__end_date", filter=models.Q(module__is_draft=False)
+        ),
+    ).values_list("pk", "start", "end")
+
+    ProjectParticipationDates.objects.bulk_create(
+        [
+            ProjectParticipationDates(
+                project_id=project_id,
+                participation_start=start,
+                participation_end=end,
+            )
+            for project_id, start, end in projects.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def delete_participation_dates(apps, schema_editor):
+    ProjectParticipationDates = apps.get_model(
+        "a4_candy_projects", "ProjectParticipationDates"
+    )
+    ProjectParticipationDates.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("a4_candy_projects", "0009_projectparticipationdates"),
+        ("a4modules", "__first__"),
+        ("a4phases", "__first__"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=initialize_participation_dates,
+            reverse_code=delete_participation_dates,
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("a4_candy_projects", "0010_initialize_participation_dates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="moderatorinvite",
+            name="notification_sent",
+            field=models.BooleanField(default=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="participantinvite",
+            name="notification_sent",
+            field=models.BooleanField(default=True, editable=False),
+        ),
+    ]
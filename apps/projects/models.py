@@ -2,10 +2,13 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Max
+from django.db.models import Min
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from adhocracy4.models import base
+from adhocracy4.phases.models import Phase
 from adhocracy4.projects.models import Project
 
 
@@ -15,6 +18,8 @@ class Invite(base.TimeStampedModel):
     email = models.EmailField()
     token = models.UUIDField(default=uuid.uuid4, unique=True)
     site = models.CharField(max_length=200)
+    # invites created with bulk_invite get their notification from a task
+    notification_sent = models.BooleanField(default=True, editable=False)
 
     class Meta:
         abstract = True
@@ -26,7 +31,29 @@ class Invite(base.TimeStampedModel):
         self.delete()
 
 
-class ParticipantInviteManager(models.Manager):
+class InviteManager(models.Manager):
+    def bulk_invite(self, creator, project, emails, site, batch_size=500):
+        """Create invites for all emails at once.
+
+        No signals are sent, the notifications have to be sent by the
+        caller (see send_invite_notifications).
+        """
+        return self.bulk_create(
+            [
+                self.model(
+                    project=project,
+                    creator=creator,
+                    email=email,
+                    site=site,
+                    notification_sent=False,
+                )
+                for email in emails
+            ],
+            batch_size=batch_size,
+        )
+
+
+class ParticipantInviteManager(InviteManager):
     def invite(self, creator, project, email, site):
         invite = super().create(
             project=project, creator=creator, email=email, site=site
@@ -57,7 +84,7 @@ class ParticipantInvite(Invite):
         unique_together = ("email", "project")
 
 
-class ModeratorInviteManager(models.Manager):
+class ModeratorInviteManager(InviteManager):
     def invite(self, creator, project, email, site):
         invite = super().create(
             project=project, creator=creator, email=email, site=site
@@ -112,6 +139,40 @@ class ProjectInsight(base.TimeStampedModel):
         return "Insights for project %s" % self.project.name
 
 
+class ProjectParticipationDatesManager(models.Manager):
+    def update_for_project(self, project_id):
+        """Recompute the participation dates from the published phases."""
+        dates = Phase.objects.filter(
+            module__project_id=project_id, module__is_draft=False
+        ).aggregate(
+            participation_start=Min("start_date"),
+            participation_end=Max("end_date"),
+        )
+        # update only, as this also runs while the project is being deleted
+        self.filter(project_id=project_id).update(**dates)
+
+
+class ProjectParticipationDates(models.Model):
+    """Start and end of participation of a project.
+
+    Precomputed from the phases of the published modules, so projects can be
+    classified into active, future and past projects without aggregating
+    over their phases. Kept up to date by the phase and module signals.
+    """
+
+    # Project.participation_dates is already taken by adhocracy4
+    project = models.OneToOneField(
+        Project, related_name="participation_period", on_delete=models.CASCADE
+    )
+    participation_start = models.DateTimeField(null=True, blank=True, db_index=True)
+    participation_end = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = ProjectParticipationDatesManager()
+
+    def __str__(self):
+        return "Participation dates for project %s" % self.project.name
+
+
 def create_insight_context(insight: ProjectInsight) -> dict:
     """
     ("BS", _("brainstorming")),
@@ -1,7 +1,19 @@
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Case
+from django.db.models import F
+from django.db.models import IntegerField
 from django.db.models import Q
+from django.db.models import Value
+from django.db.models import When
+from django.utils import timezone
 
 from adhocracy4.projects.enums import Access
 
+PARTICIPATION_ACTIVE = 0
+PARTICIPATION_FUTURE = 1
+PARTICIPATION_PAST = 2
+
 
 def filter_viewable(queryset, user):
     # FIXME: has to be in sync with a4projects.view_project  and should
@@ -11,13 +23,87 @@ def filter_viewable(queryset, user):
     if user.is_superuser:
         return queryset
     elif user.is_authenticated:
+        # Each membership is checked with a semi-join on an indexed subquery
+        # instead of joining all memberships, so no distinct is needed.
+        Organisation = apps.get_model(settings.A4_ORGANISATIONS_MODEL)
+        Member = apps.get_model("a4_candy_organisations", "Member")
+        Project = queryset.model
+
+        participant_projects = Project.participants.through.objects.filter(
+            user_id=user.id
+        ).values("project_id")
+        moderator_projects = Project.moderators.through.objects.filter(
+            user_id=user.id
+        ).values("project_id")
+        initiator_organisations = Organisation.initiators.through.objects.filter(
+            user_id=user.id
+        ).values("organisation_id")
+        member_organisations = Member.objects.filter(member_id=user.id).values(
+            "organisation_id"
+        )
         return queryset.filter(
             Q(access=Access.PUBLIC)
             | Q(access=Access.SEMIPUBLIC)
-            | Q(participants__in=[user.id])
-            | Q(organisation__initiators__id__in=[user.id])
-            | Q(moderators__in=[user.id])
-            | Q(organisation__member__member__id=user.id)
-        ).distinct()
+            | Q(pk__in=participant_projects)
+            | Q(pk__in=moderator_projects)
+            | Q(organisation_id__in=initiator_organisations)
+            | Q(organisation_id__in=member_organisations)
+        )
     else:
         return queryset.filter(Q(access=Access.PUBLIC) | Q(access=Access.SEMIPUBLIC))
+
+
+def sort_by_participation(queryset, past_by_latest_end=False):
+    """Classify projects into active, future and past projects and sort them.
+
+    Uses the precomputed ProjectParticipationDates, so the projects are
+    classified and sorted in a single query without aggregating over their
+    phases. Projects are annotated with project_start, project_end and
+    participation_status and sorted by status first. Active projects are
+    sorted by end, future projects by start and past projects by start or,
+    if past_by_latest_end is set, by latest end.
+    """
+    now = timezone.now()
+    projects = (
+        queryset.annotate(
+            project_start=F("participation_period__participation_start"),
+            project_end=F("participation_period__participation_end"),
+        )
+        .annotate(
+            participation_status=Case(
+                When(
+                    project_start__lte=now,
+                    project_end__gt=now,
+                    then=Value(PARTICIPATION_ACTIVE),
+                ),
+                When(
+                    Q(project_start__gt=now) | Q(project_start=None),
+                    then=Value(PARTICIPATION_FUTURE),
+                ),
+                When(project_end__lt=now, then=Value(PARTICIPATION_PAST)),
+                default=None,
+                output_field=IntegerField(),
+            )
+        )
+        .filter(participation_status__isnull=False)
+    )
+
+    active_first = Case(
+        When(
+            participation_status=PARTICIPATION_ACTIVE,
+            then=F("project_end"),
+        ),
+        When(
+            participation_status=PARTICIPATION_FUTURE,
+            then=F("project_start"),
+        ),
+    )
+    if past_by_latest_end:
+        past = Case(
+            When(participation_status=PARTICIPATION_PAST, then=F("project_end"))
+        ).desc()
+    else:
+        past = Case(
+            When(participation_status=PARTICIPATION_PAST, then=F("project_start"))
+        ).asc()
+    return projects.order_by("participation_status", active_first.asc(), past)
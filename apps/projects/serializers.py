@@ -1,32 +1,34 @@
 from functools import lru_cache
 
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from easy_thumbnails.files import get_thumbnailer
 from rest_framework import serializers
 
 from adhocracy4.api.dates import get_date_display
 from adhocracy4.api.dates import get_datetime_display
-from adhocracy4.categories.models import Category
-from adhocracy4.labels.models import Label
 from adhocracy4.maps.mixins import PointSerializerMixin
 from adhocracy4.modules.models import Module
 from adhocracy4.phases.models import Phase
 from adhocracy4.projects.models import Project
+from apps.contrib.thumbnails import get_thumbnail_url
 from apps.projects import helpers
 
 
 class AppProjectSerializer(PointSerializerMixin, serializers.ModelSerializer):
     information = serializers.SerializerMethodField()
     result = serializers.SerializerMethodField()
-    # todo: remove many=True once AppProjects are restricted to single module
-    published_modules = serializers.PrimaryKeyRelatedField(read_only=True, many=True)
+    # todo: return a single pk once AppProjects are restricted to single module
+    published_modules = serializers.SerializerMethodField()
     organisation = serializers.SerializerMethodField()
     organisation_logo = serializers.SerializerMethodField()
     access = serializers.SerializerMethodField()
     single_idea_collection_module = serializers.SerializerMethodField()
     single_poll_module = serializers.SerializerMethodField()
     participation_time_display = serializers.SerializerMethodField()
+    # already part of the api, computed from the prefetched modules instead
+    # of project.module_running_progress to avoid queries per project
+    module_running_progress = serializers.SerializerMethodField()
     has_contact_info = serializers.SerializerMethodField()
     url = serializers.SerializerMethodField()
 
@@ -86,40 +88,87 @@ class AppProjectSerializer(PointSerializerMixin, serializers.ModelSerializer):
     def get_access(self, project):
         return project.access.name
 
-    def get_single_idea_collection_module(self, project):
+    def _get_published_modules(self, project):
+        """Return the published modules of the project as a list.
+
+        Uses the modules prefetched by AppProjectsViewSet if available, so
+        serializing a list of projects does not query the modules per project.
+        """
+        if hasattr(project, "prefetched_published_modules"):
+            return project.prefetched_published_modules
+        return list(project.published_modules)
+
+    def _get_modules_by_status(self, project):
+        """Split the published modules into running, future and past modules.
+
+        Mirrors running_modules, future_modules and past_modules of the
+        project, but works on the (prefetched) module list.
+        """
+        now = timezone.now()
+        running_modules, future_modules, past_modules = [], [], []
+        for module in self._get_published_modules(project):
+            module_start, module_end = module.module_start, module.module_end
+            if module_start is None or module_start > now:
+                future_modules.append(module)
+            elif module_end is not None and module_end > now:
+                running_modules.append(module)
+            elif module_end is not None:
+                past_modules.append(module)
+        future_modules.sort(
+            key=lambda module: (module.module_start is None, module.module_start)
+        )
+        return running_modules, future_modules, past_modules
+
+    def _get_running_module_ends_next(self, project):
+        running_modules, _future, _past = self._get_modules_by_status(project)
+        if running_modules:
+            return min(running_modules, key=lambda module: module.module_end)
+        return None
+
+    def _get_single_module_of_type(self, project, blueprint_type):
+        published_modules = self._get_published_modules(project)
         if (
-            project.published_modules.count() == 1
-            and project.published_modules.first().blueprint_type == "IC"
+            len(published_modules) == 1
+            and published_modules[0].blueprint_type == blueprint_type
         ):
-            return project.published_modules.first().pk
+            return published_modules[0].pk
         return False
 
+    def get_published_modules(self, project):
+        return [module.pk for module in self._get_published_modules(project)]
+
+    def get_single_idea_collection_module(self, project):
+        return self._get_single_module_of_type(project, "IC")
+
     def get_single_poll_module(self, project):
-        if (
-            project.published_modules.count() == 1
-            and project.published_modules.first().blueprint_type == "PO"
-        ):
-            return project.published_modules.first().pk
-        return False
+        return self._get_single_module_of_type(project, "PO")
 
     def get_participation_time_display(self, project):
-        if project.running_modules:
-            if project.module_running_days_left < 365:
+        running_modules, future_modules, past_modules = self._get_modules_by_status(
+            project
+        )
+        if running_modules:
+            module = self._get_running_module_ends_next(project)
+            if module.module_running_days_left < 365:
                 return _("%(time_left)s remaining") % {
-                    "time_left": project.module_running_time_left
+                    "time_left": module.module_running_time_left
                 }
             else:
                 return _("more than 1 year remaining")
-        elif project.future_modules:
+        elif future_modules:
             return _("Participation: from %(project_start)s") % {
-                "project_start": get_date_display(
-                    project.future_modules.first().module_start
-                )
+                "project_start": get_date_display(future_modules[0].module_start)
             }
-        elif project.past_modules:
+        elif past_modules:
             return _("Participation ended. Read result.")
         return ""
 
+    def get_module_running_progress(self, project):
+        module = self._get_running_module_ends_next(project)
+        if module:
+            return module.module_running_progress
+        return None
+
     def get_has_contact_info(self, project):
         if (
             project.contact_name
@@ -167,32 +216,62 @@ class AppModuleSerializer(serializers.ModelSerializer):
             "has_idea_adding_permission",
         )
 
+    def _get_phases_by_status(self, module):
+        """Split the phases into active, future and past phases.
+
+        Mirrors active_phases, future_phases and past_phases of the phase
+        queryset, but works on the phases prefetched by AppModuleViewSet.
+        """
+        now = timezone.now()
+        phases = sorted(
+            module.phase_set.all(),
+            key=lambda phase: (phase.start_date is None, phase.start_date),
+        )
+        active_phases = [
+            phase
+            for phase in phases
+            if phase.start_date
+            and phase.start_date <= now
+            and phase.end_date
+            and phase.end_date > now
+        ]
+        future_phases = [
+            phase for phase in phases if not phase.start_date or phase.start_date > now
+        ]
+        past_phases = [
+            phase for phase in phases if phase.end_date and phase.end_date <= now
+        ]
+        return active_phases, future_phases, past_phases
+
     def get_active_phase(self, module):
-        if module.active_phase:
-            serializer = AppPhaseSerializer(instance=module.active_phase)
+        active_phases, _future, _past = self._get_phases_by_status(module)
+        if active_phases:
+            serializer = AppPhaseSerializer(instance=active_phases[0])
             return serializer.data
         return None
 
     def get_future_phases(self, module):
-        if module.future_phases:
-            serializer = AppPhaseSerializer(instance=module.future_phases, many=True)
+        _active, future_phases, _past = self._get_phases_by_status(module)
+        if future_phases:
+            serializer = AppPhaseSerializer(instance=future_phases, many=True)
             return serializer.data
         return None
 
     def get_past_phases(self, module):
-        if module.past_phases:
-            serializer = AppPhaseSerializer(instance=module.past_phases, many=True)
+        _active, _future, past_phases = self._get_phases_by_status(module)
+        if past_phases:
+            serializer = AppPhaseSerializer(instance=past_phases, many=True)
             return serializer.data
         return None
 
     def get_labels(self, instance):
-        labels = Label.objects.filter(module=instance)
+        labels = instance.label_set.all()
         if labels:
             return [{"id": label.pk, "name": label.name} for label in labels]
         return False
 
     def get_categories(self, instance):
-        categories = Category.objects.filter(module=instance)
+        categories = instance.category_set.all()
         if categories:
             return [
                 {"id": category.pk, "name": category.name} for category in categories
@@ -276,11 +355,9 @@ class ModerationProjectSerializer(serializers.ModelSerializer):
     def get_tile_image(self, instance):
         image_url = ""
         if instance.tile_image:
-            image = get_thumbnailer(instance.tile_image)["project_thumbnail"]
-            image_url = image.url
+            image_url = get_thumbnail_url(instance.tile_image, "project_thumbnail")
         elif instance.image:
-            image = get_thumbnailer(instance.image)["project_thumbnail"]
-            image_url = image.url
+            image_url = get_thumbnail_url(instance.image, "project_thumbnail")
         return image_url
 
     def get_tile_image_alt_text(self, instance):
@@ -1,21 +1,33 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
 from django.db.models import signals
 from django.dispatch import receiver
+from django.utils import timezone
 
 from adhocracy4.comments.models import Comment
+from adhocracy4.modules.models import Module
+from adhocracy4.phases.models import Phase
 from adhocracy4.polls.models import Answer
+from adhocracy4.polls.models import Poll
 from adhocracy4.polls.models import Vote
 from adhocracy4.polls.signals import poll_voted
 from adhocracy4.projects.models import Project
 from adhocracy4.ratings.models import Rating
 from apps.budgeting.models import Proposal
+from apps.debate.models import Subject
+from apps.documents.models import Chapter
+from apps.documents.models import Paragraph
 from apps.ideas.models import Idea
-from apps.interactiveevents.models import Like
 from apps.interactiveevents.models import LiveQuestion
+from apps.interactiveevents.signals import like_toggled
 from apps.mapideas.models import MapIdea
+from apps.organisations.models import Organisation
 from apps.topicprio.models import Topic
 
 from . import emails
+from . import helpers
 from .models import ProjectInsight
+from .models import ProjectParticipationDates
 
 
 @receiver(signals.m2m_changed, sender=Project.participants.through)
@@ -29,6 +41,95 @@ def send_welcome_to_private_project_email(action, **kwargs):
         )
 
 
+@receiver(signals.post_save, sender=Project)
+@receiver(signals.post_delete, sender=Project)
+@receiver(signals.post_save, sender=Module)
+@receiver(signals.post_delete, sender=Module)
+@receiver(signals.post_save, sender=Phase)
+@receiver(signals.post_delete, sender=Phase)
+@receiver(signals.post_save, sender=Organisation)
+@receiver(signals.post_delete, sender=Organisation)
+def set_app_projects_changed(sender, instance, **kwargs):
+    helpers.set_app_projects_changed()
+
+
+@receiver(signals.post_save, sender=Project)
+def create_participation_dates(sender, instance, created, **kwargs):
+    if created:
+        ProjectParticipationDates.objects.get_or_create(project=instance)
+
+
+@receiver(signals.post_save, sender=Module)
+@receiver(signals.post_delete, sender=Module)
+def update_participation_dates_for_module(sender, instance, **kwargs):
+    ProjectParticipationDates.objects.update_for_project(instance.project_id)
+
+
+@receiver(signals.post_save, sender=Phase)
+@receiver(signals.post_delete, sender=Phase)
+def update_participation_dates_for_phase(sender, instance, **kwargs):
+    project_ids = Module.objects.filter(pk=instance.module_id).values_list(
+        "project_id", flat=True
+    )
+    for project_id in project_ids:
+        ProjectParticipationDates.objects.update_for_project(project_id)
+
+
+@receiver(signals.post_save, sender=Module)
+@receiver(signals.post_delete, sender=Module)
+def invalidate_project_stats_for_module(sender, instance, **kwargs):
+    helpers.invalidate_project_stats(instance.project_id)
+
+
+@receiver(signals.post_save, sender=Idea)
+@receiver(signals.post_delete, sender=Idea)
+@receiver(signals.post_save, sender=Topic)
+@receiver(signals.post_delete, sender=Topic)
+@receiver(signals.post_save, sender=Subject)
+@receiver(signals.post_delete, sender=Subject)
+@receiver(signals.post_save, sender=Poll)
+@receiver(signals.post_delete, sender=Poll)
+@receiver(signals.post_save, sender=Chapter)
+@receiver(signals.post_delete, sender=Chapter)
+def invalidate_project_stats_for_item(sender, instance, **kwargs):
+    project_ids = Module.objects.filter(pk=instance.module_id).values_list(
+        "project_id", flat=True
+    )
+    for project_id in project_ids:
+        helpers.invalidate_project_stats(project_id)
+
+
+@receiver(signals.post_save, sender=Comment)
+@receiver(signals.post_delete, sender=Comment)
+def invalidate_project_stats_for_comment(sender, instance, **kwargs):
+    if instance.project_id:
+        helpers.invalidate_project_stats(instance.project_id)
+
+
+@receiver(signals.post_save, sender=Vote)
+@receiver(signals.post_delete, sender=Vote)
+@receiver(signals.post_save, sender=Answer)
+@receiver(signals.post_delete, sender=Answer)
+def invalidate_project_stats_for_poll_answer(sender, instance, **kwargs):
+    try:
+        if sender == Answer:
+            question = instance.question
+        else:
+            question = instance.choice.question
+        helpers.invalidate_project_stats(question.poll.module.project_id)
+    except ObjectDoesNotExist:
+        # the poll is deleted as well and invalidates the stats itself
+        pass
+
+
+def _get_commented_module_id(comment):
+    """Return the module of the commented item, None for replies."""
+    content_object = comment.content_object
+    if isinstance(content_object, Paragraph):
+        return content_object.chapter.module_id
+    return getattr(content_object, "module_id", None)
+
+
 @receiver(signals.post_save, sender=Comment)
 def increase_comments_count(sender, instance, created, **kwargs):
     if created and instance.project:
@@ -37,6 +138,10 @@ def increase_comments_count(sender, instance, created, **kwargs):
         insight.save()
         insight.active_participants.add(instance.creator.id)
 
+        module_id = _get_commented_module_id(instance)
+        if module_id:
+            helpers.increase_module_entries(module_id)
+
 
 @receiver(signals.post_save, sender=Idea)
 @receiver(signals.post_save, sender=MapIdea)
@@ -52,6 +157,7 @@ def increase_idea_count(sender, instance, created, **kwargs):
 
     if sender != Topic:
         insight.active_participants.add(instance.creator.id)
+        helpers.increase_module_entries(instance.module_id)
 
 
 @receiver(signals.post_save, sender=Rating)
@@ -72,15 +178,25 @@ def increase_live_questions_count(sender, instance, created, **kwargs):
         insight, _ = ProjectInsight.objects.get_or_create(project=project)
         insight.live_questions += 1
         insight.save()
+        helpers.increase_module_entries(instance.module_id)
 
 
-@receiver(signals.post_save, sender=Like)
-def increase_ratings_count_for_likes(sender, instance, created, **kwargs):
-    if created:
-        project = instance.livequestion.module.project
-        insight, _ = ProjectInsight.objects.get_or_create(project=project)
-        insight.ratings += 1
-        insight.save()
+@receiver(like_toggled)
+def update_ratings_count_for_likes(sender, livequestion, liked, **kwargs):
+    module = livequestion.module
+    if not liked:
+        helpers.invalidate_module_entries(module.pk)
+        return
+    # likes are toggled often during a live event, so the insight is
+    # updated in a single statement instead of being loaded and saved
+    updated = ProjectInsight.objects.filter(project_id=module.project_id).update(
+        ratings=F("ratings") + 1, modified=timezone.now()
+    )
+    if not updated:
+        ProjectInsight.objects.get_or_create(
+            project_id=module.project_id, defaults={"ratings": 1}
+        )
+    helpers.increase_module_entries(module.pk)
 
 
 @receiver(signals.post_save, sender=Vote)
@@ -91,6 +207,7 @@ def increase_poll_answers_count(sender, instance, created, **kwargs):
             project = instance.question.poll.module.project
         else:
             project = instance.project
+            helpers.increase_module_entries(instance.choice.question.poll.module_id)
 
         insight, _ = ProjectInsight.objects.get_or_create(project=project)
         insight.poll_answers += 1
@@ -105,3 +222,26 @@ def increase_poll_participant_count(sender, poll, creator, content_id, **kwargs)
     else:
         insight.unregistered_participants += 1
     insight.save()
+
+
+@receiver(signals.post_delete, sender=Idea)
+@receiver(signals.post_delete, sender=MapIdea)
+@receiver(signals.post_delete, sender=Proposal)
+@receiver(signals.post_delete, sender=LiveQuestion)
+def invalidate_module_entries_for_item(sender, instance, **kwargs):
+    helpers.invalidate_module_entries(instance.module_id)
+
+
+@receiver(signals.post_delete, sender=Comment)
+@receiver(signals.post_delete, sender=Vote)
+def invalidate_module_entries(sender, instance, **kwargs):
+    try:
+        if sender == Comment:
+            module_id = _get_commented_module_id(instance)
+        else:
+            module_id = instance.choice.question.poll.module_id
+    except ObjectDoesNotExist:
+        # the commented item or the module is deleted as well
+        return
+    if module_id:
+        helpers.invalidate_module_entries(module_id)
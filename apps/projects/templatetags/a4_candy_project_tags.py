@@ -1,17 +1,24 @@
 from django import template
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models import Func
+from django.db.models import IntegerField
+from django.db.models import OuterRef
+from django.db.models import Subquery
 
 from adhocracy4.comments.models import Comment
+from adhocracy4.modules.models import Module
 from adhocracy4.polls.models import Answer
 from adhocracy4.polls.models import Poll
 from adhocracy4.polls.models import Vote
 from apps.budgeting.models import Proposal as budget_proposal
 from apps.debate.models import Subject
 from apps.documents.models import Chapter
-from apps.documents.models import Paragraph
 from apps.ideas.models import Idea
 from apps.interactiveevents.models import Like
 from apps.interactiveevents.models import LiveQuestion
 from apps.mapideas.models import MapIdea
+from apps.projects import helpers
 from apps.topicprio.models import Topic
 
 register = template.Library()
@@ -30,24 +37,60 @@ def to_class_name(value):
 @register.simple_tag
 def get_num_entries(module):
     """Count all user-generated items."""
-    item_count = (
-        Idea.objects.filter(module=module).count()
-        + MapIdea.objects.filter(module=module).count()
-        + budget_proposal.objects.filter(module=module).count()
-        + Comment.objects.filter(idea__module=module).count()
-        + Comment.objects.filter(mapidea__module=module).count()
-        + Comment.objects.filter(budget_proposal__module=module).count()
-        + Comment.objects.filter(paragraph__chapter__module=module).count()
-        + Comment.objects.filter(chapter__module=module).count()
-        + Comment.objects.filter(poll__module=module).count()
-        + Comment.objects.filter(topic__module=module).count()
-        + Comment.objects.filter(subject__module=module).count()
-        + Vote.objects.filter(choice__question__poll__module=module).count()
-        + LiveQuestion.objects.filter(module=module).count()
-        + Like.objects.filter(livequestion__module=module).count()
+    key = helpers.MODULE_ENTRIES_CACHE_KEY.format(module_id=module.pk)
+    num_entries = cache.get(key)
+    if num_entries is None:
+        # The tiles of all modules of a project are shown together, so the
+        # entries of all its modules are counted and cached at once.
+        modules = Module.objects.filter(project_id=module.project_id)
+        entries = count_module_entries(modules)
+        cache.set_many(
+            {
+                helpers.MODULE_ENTRIES_CACHE_KEY.format(module_id=pk): count
+                for pk, count in entries.items()
+            },
+            helpers.MODULE_ENTRIES_TIMEOUT,
+        )
+        num_entries = entries.get(module.pk, 0)
+    return num_entries
+
+
+def _count(queryset):
+    counts = queryset.order_by().annotate(count=Func(F("pk"), function="COUNT"))
+    return Subquery(counts.values("count"), output_field=IntegerField())
+
+
+def count_module_entries(modules):
+    """Count all user-generated items of the modules in a single query.
+
+    Returns a dict mapping the module pks to their number of entries.
+    """
+    module = OuterRef("pk")
+    entries = [
+        Idea.objects.filter(module=module),
+        MapIdea.objects.filter(module=module),
+        budget_proposal.objects.filter(module=module),
+        Comment.objects.filter(idea__module=module),
+        Comment.objects.filter(mapidea__module=module),
+        Comment.objects.filter(budget_proposal__module=module),
+        Comment.objects.filter(paragraph__chapter__module=module),
+        Comment.objects.filter(chapter__module=module),
+        Comment.objects.filter(poll__module=module),
+        Comment.objects.filter(topic__module=module),
+        Comment.objects.filter(subject__module=module),
+        Vote.objects.filter(choice__question__poll__module=module),
+        LiveQuestion.objects.filter(module=module),
+        Like.objects.filter(livequestion__module=module),
+    ]
+    counts = modules.order_by().annotate(
+        **{"entries_%d" % i: _count(queryset) for i, queryset in enumerate(entries)}
     )
-
-    return item_count
+    return {
+        pk: sum(module_counts)
+        for pk, *module_counts in counts.values_list(
+            "pk", *["entries_%d" % i for i in range(len(entries))]
+        )
+    }
 
 
 @register.filter
@@ -103,73 +146,40 @@ def get_project_stats(project):
             "modules": 0,
         }
 
-    contributors = _get_project_contributors(project)
-
-    return {
-        "participants": len(contributors),
-        "contributions": _count_contributions(project),
-        "modules": _count_modules(project),
-    }
+    return cache.get_or_set(
+        helpers.PROJECT_STATS_CACHE_KEY.format(project_id=project.pk),
+        lambda: {
+            "participants": _get_project_contributors(project).count(),
+            "contributions": _count_contributions(project),
+            "modules": _count_modules(project),
+        },
+        helpers.PROJECT_STATS_TIMEOUT,
+    )
 
 
 def _get_project_contributors(project):
-    """Get unique contributors for a project."""
-
-    contributors = set()
-
-    # Ideas
-    for idea in Idea.objects.filter(module__project=project):
-        if idea.creator:
-            contributors.add(idea.creator.id)
-
-    # Polls
-    _add_poll_contributors(project, contributors)
+    """Get the ids of the unique contributors of a project.
 
-    # Topics
-    for topic in Topic.objects.filter(module__project=project):
-        if topic.creator:
-            contributors.add(topic.creator.id)
-
-    # Debates
-    for subject in Subject.objects.filter(module__project=project):
-        if subject.creator:
-            contributors.add(subject.creator.id)
-
-    # Documents
-    _add_document_contributors(project, contributors)
-
-    return contributors
-
-
-def _add_poll_contributors(project, contributors):
-    """Add poll voters and answerers to contributors set."""
-
-    for poll in Poll.objects.filter(module__project=project):
-        for question in poll.questions.all():
-            for vote in Vote.objects.filter(choice__question=question):
-                if vote.creator:
-                    contributors.add(vote.creator.id)
-            for answer in Answer.objects.filter(question=question):
-                if answer.creator:
-                    contributors.add(answer.creator.id)
-
-
-def _add_document_contributors(project, contributors):
-    """Add document commenters to contributors set."""
-
-    for chapter in Chapter.objects.filter(module__project=project):
-        for comment in Comment.objects.filter(
-            content_type__model="chapter", object_pk=chapter.id
-        ):
-            if comment.creator:
-                contributors.add(comment.creator.id)
-
-        for paragraph in Paragraph.objects.filter(chapter=chapter):
-            for comment in Comment.objects.filter(
-                content_type__model="paragraph", object_pk=paragraph.id
-            ):
-                if comment.creator:
-                    contributors.add(comment.creator.id)
+    Creators of ideas, topics, subjects, poll votes and answers and of
+    comments on document chapters and paragraphs are combined with UNION,
+    so the database removes the duplicates.
+    """
+    contributions = [
+        Idea.objects.filter(module__project=project),
+        Topic.objects.filter(module__project=project),
+        Subject.objects.filter(module__project=project),
+        Vote.objects.filter(choice__question__poll__module__project=project),
+        Answer.objects.filter(question__poll__module__project=project),
+        Comment.objects.filter(chapter__module__project=project),
+        Comment.objects.filter(paragraph__chapter__module__project=project),
+    ]
+    creator_ids = [
+        queryset.filter(creator__isnull=False)
+        .order_by()
+        .values_list("creator_id", flat=True)
+        for queryset in contributions
+    ]
+    return creator_ids[0].union(*creator_ids[1:])
 
 
 def _count_contributions(project):
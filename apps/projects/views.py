@@ -1,9 +1,11 @@
+import functools
 import itertools
 import logging
 
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.sites.shortcuts import get_current_site
+from django.db import transaction
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
@@ -32,12 +34,14 @@ from adhocracy4.projects.mixins import DisplayProjectOrModuleMixin
 from adhocracy4.projects.mixins import PhaseDispatchMixin
 from adhocracy4.projects.mixins import ProjectMixin
 from adhocracy4.projects.mixins import ProjectModuleDispatchMixin
+from apps.notifications.tasks import send_invite_notifications
 from apps.projects.models import ProjectInsight
 from apps.summarization.models import ProjectSummary
 from apps.summarization.models import SummaryFeedback
 
 from . import dashboard
 from . import forms
+from . import helpers
 from . import models
 from .utils import generate_project_summary
 
@@ -45,6 +49,8 @@ User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
+INVITE_NOTIFICATIONS_BATCH_SIZE = 500
+
 
 class ParticipantInviteDetailView(generic.DetailView):
     model = models.ParticipantInvite
@@ -153,26 +159,21 @@ class AbstractProjectUserInviteListView(
 
     def filter_existing(self, emails):
         related_users = getattr(self.object, self.related_users_field)
-        related_emails = [u.email for u in related_users.all()]
-        existing = []
-        filtered_emails = []
-        for email in emails:
-            if email in related_emails:
-                existing.append(email)
-            else:
-                filtered_emails.append(email)
+        related_emails = set(
+            related_users.filter(email__in=emails).values_list("email", flat=True)
+        )
+        existing = [email for email in emails if email in related_emails]
+        filtered_emails = [email for email in emails if email not in related_emails]
         return filtered_emails, existing
 
     def filter_pending(self, emails):
-        pending = []
-        filtered_emails = []
-        for email in emails:
-            if self.invite_model.objects.filter(
-                email=email, project=self.project
-            ).exists():
-                pending.append(email)
-            else:
-                filtered_emails.append(email)
+        pending_emails = set(
+            self.invite_model.objects.filter(
+                email__in=emails, project=self.project
+            ).values_list("email", flat=True)
+        )
+        pending = [email for email in emails if email in pending_emails]
+        filtered_emails = [email for email in emails if email not in pending_emails]
         return filtered_emails, pending
 
     def form_valid(self, form):
@@ -185,6 +186,24 @@ class AbstractProjectUserInviteListView(
             )
         )
 
+        upload = form.cleaned_data["add_users_upload"]
+        if upload.error_count:
+            lines = ", ".join(
+                "{} ({})".format(line_number, line)
+                for line_number, line in upload.line_errors
+            )
+            if upload.error_count > len(upload.line_errors):
+                lines += ", …"
+            messages.warning(
+                self.request,
+                ngettext(
+                    "{} line of the file contains no valid email address: ",
+                    "{} lines of the file contain no valid email address: ",
+                    upload.error_count,
+                ).format(upload.error_count)
+                + lines,
+            )
+
         emails, existing = self.filter_existing(emails)
         if existing:
             messages.error(
@@ -200,13 +219,13 @@ class AbstractProjectUserInviteListView(
                 _("Following users are already invited: ") + ", ".join(pending),
             )
 
-        for email in emails:
-            self.invite_model.objects.invite(
-                creator=self.request.user,
-                project=self.project,
-                email=email,
-                site=get_current_site(self.request),
-            )
+        self.invite_model.objects.bulk_invite(
+            creator=self.request.user,
+            project=self.project,
+            emails=emails,
+            site=get_current_site(self.request),
+        )
+        self._send_invite_notifications(emails)
 
         messages.success(
             self.request,
@@ -217,6 +236,29 @@ class AbstractProjectUserInviteListView(
 
         return redirect(self.get_success_url())
 
+    def _send_invite_notifications(self, emails):
+        # the notification emails are sent in the background, the progress
+        # is shown on the dashboard page
+        invite_model = self.invite_model._meta.label_lower
+        for start in range(0, len(emails), INVITE_NOTIFICATIONS_BATCH_SIZE):
+            batch = emails[start : start + INVITE_NOTIFICATIONS_BATCH_SIZE]
+            # the task must not run before the invites are committed
+            transaction.on_commit(
+                functools.partial(
+                    send_invite_notifications.delay,
+                    invite_model,
+                    self.project.pk,
+                    batch,
+                )
+            )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["invite_progress"] = helpers.get_invite_progress(
+            self.invite_model, self.project.pk
+        )
+        return context
+
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
         kwargs["labels"] = (self.add_user_field_label, self.add_user_upload_field_label)
@@ -16,15 +16,19 @@ from adhocracy4.labels import models as labels_models
 from adhocracy4.models import query
 from adhocracy4.modules import models as module_models
 from adhocracy4.ratings import models as rating_models
+from apps.contrib import counters
 
 
 class TopicQuerySet(
-    query.RateableQuerySet, query.CommentableQuerySet, PolymorphicQuerySet
+    counters.CountedQuerySetMixin,
+    query.RateableQuerySet,
+    query.CommentableQuerySet,
+    PolymorphicQuerySet,
 ):
     pass
 
 
-class Topic(module_models.Item):
+class Topic(module_models.Item, counters.CountedItem):
     item_ptr = models.OneToOneField(
         to=module_models.Item,
         parent_link=True,
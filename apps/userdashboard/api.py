@@ -1,15 +1,22 @@
-from django.db.models import Count
+import base64
+import json
+from collections import OrderedDict
+
 from django.db.models import ExpressionWrapper
+from django.db.models import F
 from django.db.models import Q
 from django.db.models.fields import BooleanField
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from django_filters.rest_framework import BooleanFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 from adhocracy4.api.permissions import ViewSetRulesPermission
 from adhocracy4.filters.rest_filters import DefaultsRestFilterSet
@@ -27,9 +34,90 @@ class ModerationCommentFilterSet(DefaultsRestFilterSet):
     defaults = {"is_reviewed": "false", "has_reports": "all"}
 
 
-class ModerationCommentPagination(PageNumberPagination):
+class ModerationCommentPagination(BasePagination):
+    """Keyset pagination over the ordering of the comments.
+
+    The cursor holds the ordering values of the last comment of a page, so
+    later pages are found without counting or skipping the comments of the
+    previous pages. The pk is used as last ordering field to break ties.
+    Without page size the comments are not paginated.
+    """
+
     page_size_query_param = "num_of_comments"
+    cursor_query_param = "cursor"
     max_page_size = 1000
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return None
+        if page_size <= 0:
+            return None
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        ordering = [field for field in queryset.query.order_by if field != "pk"]
+        descending = bool(ordering) and ordering[-1].startswith("-")
+        return ordering + ["-pk" if descending else "pk"]
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, values):
+        cursor = json.dumps(values, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    def get_keyset_filter(self, ordering, values):
+        keyset_filter = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "{}__{}".format(name, "lt" if field.startswith("-") else "gt")
+            keyset_filter |= equal & Q(**{lookup: value})
+            equal &= Q(**{name: value})
+        return keyset_filter
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if page_size is None:
+            return None
+        self.request = request
+        ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*ordering)
+        values = self.decode_cursor(request)
+        if values is not None:
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(self.get_keyset_filter(ordering, values))
+
+        page = list(queryset[: page_size + 1])
+        self.has_next = len(page) > page_size
+        page = page[:page_size]
+        if self.has_next:
+            last = page[-1]
+            self.next_values = [getattr(last, field.lstrip("-")) for field in ordering]
+        return page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_values)
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
 
 
 class ModerationCommentViewSet(
@@ -53,7 +141,7 @@ class ModerationCommentViewSet(
         self.project_pk = kwargs.get("project_pk", "")
         return super().dispatch(request, *args, **kwargs)
 
-    @property
+    @cached_property
     def project(self):
         return get_object_or_404(Project, pk=self.project_pk)
 
@@ -62,11 +150,17 @@ class ModerationCommentViewSet(
 
     def get_queryset(self):
         all_comments_project = helpers.get_all_comments_project(self.project)
-        num_reports = Count("reports", distinct=True)
-        return all_comments_project.annotate(num_reports=num_reports).annotate(
-            has_reports=ExpressionWrapper(
-                Q(num_reports__gt=0), output_field=BooleanField()
+        # the reports are counted by the report signals, so ordering by the
+        # number of reports uses the indexed counter of each comment
+        return (
+            all_comments_project.annotate(num_reports=F("report_counter__report_count"))
+            .annotate(
+                has_reports=ExpressionWrapper(
+                    Q(num_reports__gt=0), output_field=BooleanField()
+                )
             )
+            .select_related("creator", "moderator_feedback")
+            .prefetch_related("content_object")
         )
 
     def update(self, request, *args, **kwargs):
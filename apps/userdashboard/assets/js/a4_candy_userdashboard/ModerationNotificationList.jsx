@@ -127,15 +127,33 @@ export default class ModerationNotificationList extends Component {
     })
   }
 
-  handleLoadMore = () => {
-    this.setState(prevState => {
-      const newPacketFactor = prevState.packetFactor + 1
-      return {
-        ...prevState,
-        numOfComments: newPacketFactor * PACKET_COMMENT_SIZE,
-        packetFactor: newPacketFactor
-      }
-    }, this.loadData)
+  handleLoadMore = async () => {
+    if (this.isLoading || !this.state.hasMore) {
+      return
+    }
+    this.isLoading = true
+    try {
+      // the next page continues after the last loaded comment
+      const url = new URL(this.state.hasMore)
+      url.searchParams.set('num_of_comments', PACKET_COMMENT_SIZE)
+      const data = await fetch(url)
+      const jsonData = await data.json()
+      this.setState(prevState => {
+        const newPacketFactor = prevState.packetFactor + 1
+        return {
+          ...prevState,
+          moderationComments: prevState.moderationComments.concat(jsonData.results),
+          hasMore: jsonData.next,
+          // polling reloads all comments loaded so far
+          numOfComments: newPacketFactor * PACKET_COMMENT_SIZE,
+          packetFactor: newPacketFactor
+        }
+      })
+    } catch (error) {
+      console.warn(error)
+    } finally {
+      this.isLoading = false
+    }
   }
 
   handleToTop = () => {
@@ -0,0 +1,71 @@
+import itertools
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+def initialize_report_counts(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Comment = apps.get_model("a4comments", "Comment")
+    Report = apps.get_model("a4reports", "Report")
+    CommentReportCount = apps.get_model("a4_candy_userdashboard", "CommentReportCount")
+    comment_content_type = ContentType.objects.filter(
+        app_label="a4comments", model="comment"
+    ).first()
+    if comment_content_type is None:
+        return
+    report_counts = dict(
+        Report.objects.filter(content_type=comment_content_type)
+        .values("object_pk")
+        .annotate(report_count=models.Count("pk"))
+        .order_by()
+        .values_list("object_pk", "report_count")
+    )
+    report_counts = {int(pk): count for pk, count in report_counts.items()}
+    # every comment gets a counter, reports of deleted comments are not counted
+    comment_pks = Comment.objects.values_list("pk", flat=True).iterator()
+    while True:
+        batch = list(itertools.islice(comment_pks, 1000))
+        if not batch:
+            break
+        CommentReportCount.objects.bulk_create(
+            [
+                CommentReportCount(comment_id=pk, report_count=report_counts.get(pk, 0))
+                for pk in batch
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("a4comments", "__first__"),
+        ("a4reports", "__first__"),
+        ("contenttypes", "__first__"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CommentReportCount",
+            fields=[
+                (
+                    "comment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="report_counter",
+                        serialize=False,
+                        to="a4comments.comment",
+                    ),
+                ),
+                (
+                    "report_count",
+                    models.PositiveIntegerField(db_index=True, default=0),
+                ),
+            ],
+        ),
+        migrations.RunPython(initialize_report_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+from django.db import models
+
+from adhocracy4.comments.models import Comment
+
+
+class CommentReportCount(models.Model):
+    """Number of reports of a comment, kept up to date by the report signals.
+
+    Created for every comment, so the moderation list can be ordered by the
+    indexed count without an aggregation or a coalesce.
+    """
+
+    comment = models.OneToOneField(
+        Comment,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="report_counter",
+    )
+    report_count = models.PositiveIntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return "{} - {}".format(self.comment_id, self.report_count)
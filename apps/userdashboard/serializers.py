@@ -1,6 +1,5 @@
 from django.urls import reverse
 from django.utils.translation import gettext as _
-from easy_thumbnails.files import get_thumbnailer
 from rest_framework import serializers
 from rest_framework.serializers import raise_errors_on_nested_writes
 from rest_framework.utils import model_meta
@@ -8,6 +7,7 @@ from rest_framework.utils import model_meta
 from adhocracy4.comments.models import Comment
 from apps.contrib.dates import get_date_display
 from apps.moderatorfeedback.serializers import ModeratorCommentFeedbackSerializer
+from apps.users import cache
 
 
 class ModerationCommentSerializer(serializers.ModelSerializer):
@@ -80,9 +80,9 @@ class ModerationCommentSerializer(serializers.ModelSerializer):
         if comment.is_censored or comment.is_removed:
             return None
         try:
-            if comment.creator.avatar:
-                avatar = get_thumbnailer(comment.creator.avatar)["avatar"]
-                return avatar.url
+            avatar_url = cache.get_avatar_url(comment.creator)
+            if avatar_url:
+                return avatar_url
         except AttributeError:
             pass
         return self.get_user_image_fallback(comment)
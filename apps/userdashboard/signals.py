@@ -0,0 +1,51 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F
+from django.db.models import Value
+from django.db.models import signals
+from django.db.models.functions import Greatest
+from django.dispatch import receiver
+
+from adhocracy4.comments.models import Comment
+from adhocracy4.reports.models import Report
+
+from .models import CommentReportCount
+
+
+def _get_reported_comment_id(report):
+    if report.content_type_id != ContentType.objects.get_for_model(Comment).id:
+        return None
+    return int(report.object_pk)
+
+
+@receiver(signals.post_save, sender=Comment)
+def create_report_count(sender, instance, created, **kwargs):
+    if created:
+        CommentReportCount.objects.get_or_create(comment=instance)
+
+
+@receiver(signals.post_save, sender=Report)
+def increase_report_count(sender, instance, created, **kwargs):
+    comment_id = _get_reported_comment_id(instance)
+    if not created or comment_id is None:
+        return
+    if not CommentReportCount.objects.filter(comment_id=comment_id).update(
+        report_count=F("report_count") + 1
+    ):
+        report_count, created = CommentReportCount.objects.get_or_create(
+            comment_id=comment_id, defaults={"report_count": 1}
+        )
+        if not created:
+            # created by a concurrent report in the meantime
+            CommentReportCount.objects.filter(comment_id=comment_id).update(
+                report_count=F("report_count") + 1
+            )
+
+
+@receiver(signals.post_delete, sender=Report)
+def decrease_report_count(sender, instance, **kwargs):
+    comment_id = _get_reported_comment_id(instance)
+    if comment_id is None:
+        return
+    CommentReportCount.objects.filter(comment_id=comment_id).update(
+        report_count=Greatest(F("report_count") - 1, Value(0))
+    )
@@ -4,6 +4,7 @@ from django.core.paginator import Paginator
 from django.shortcuts import get_object_or_404
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.views import generic
 from guest_user.mixins import GuestUserRequiredMixin, RegularUserRequiredMixin
@@ -112,20 +113,9 @@ class UserDashboardOverviewView(UserDashboardBaseMixin):
         page_obj = paginator.get_page(page_number)
         return page_obj
 
-    @property
+    @cached_property
     def projects_carousel(self):
-        (
-            sorted_active_projects,
-            sorted_future_projects,
-            sorted_past_projects,
-        ) = self.request.user.get_projects_follow_list()
-        projects = (
-            list(sorted_active_projects)
-            + list(sorted_future_projects)
-            + list(sorted_past_projects)
-        )[:8]
-
-        return projects
+        return self.request.user.get_projects_follow_list()[:8]
 
 
 class UserDashboardNotificationsBaseView(UserDashboardBaseMixin):
@@ -0,0 +1,62 @@
+"""Cache of the avatar thumbnail urls.
+
+Creating or even looking up a thumbnail touches the storage, so the urls of
+the avatar thumbnails are cached. The key contains the file name of the
+avatar, so a new avatar never gets the thumbnail of the old one. The
+thumbnails are generated by a task when an avatar is uploaded, or when a
+thumbnail url is missing from the cache. Until then the original image is
+used.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from easy_thumbnails.files import get_thumbnailer
+
+AVATAR_ALIAS = "avatar"
+AVATAR_URL_KEY = "user_avatar_url_{user_id}_{name}"
+AVATAR_PENDING_KEY = "user_avatar_pending_{user_id}_{name}"
+AVATAR_URL_TIMEOUT = 60 * 60 * 24 * 30
+AVATAR_PENDING_TIMEOUT = 60 * 5
+
+
+def _get_key(key, user):
+    name = hashlib.md5(user._avatar.name.encode()).hexdigest()
+    return key.format(user_id=user.pk, name=name)
+
+
+def generate_avatar_url(user):
+    """Generate the avatar thumbnail of the user and cache its url."""
+    if not user._avatar:
+        return None
+    url = get_thumbnailer(user._avatar)[AVATAR_ALIAS].url
+    cache.set(_get_key(AVATAR_URL_KEY, user), url, AVATAR_URL_TIMEOUT)
+    cache.delete(_get_key(AVATAR_PENDING_KEY, user))
+    return url
+
+
+def schedule_avatar_url(user):
+    """Generate the avatar thumbnail in the background, once at a time."""
+    from .tasks import generate_avatar_thumbnail
+
+    if cache.add(_get_key(AVATAR_PENDING_KEY, user), True, AVATAR_PENDING_TIMEOUT):
+        generate_avatar_thumbnail.delay(user.pk)
+
+
+def get_avatar_url(user):
+    """Return the url of the avatar thumbnail of the user.
+
+    Returns the url of the original image while the thumbnail is generated
+    and None if the user has no avatar.
+    """
+    if not user._avatar:
+        return None
+    url = cache.get(_get_key(AVATAR_URL_KEY, user))
+    if url is None:
+        schedule_avatar_url(user)
+        url = user._avatar.url
+    return url
+
+
+def has_avatar_url(user):
+    return cache.get(_get_key(AVATAR_URL_KEY, user)) is not None
@@ -2,6 +2,7 @@ from email.mime.image import MIMEImage
 
 import magic
 from django.conf import settings
+from django.db.models import QuerySet
 from django.template.loader import get_template
 from django.urls import reverse
 from django.utils import translation
@@ -12,6 +13,7 @@ from sentry_sdk import capture_message
 from adhocracy4.emails import Email
 
 from .models import User
+from .utils import get_languages_by_email
 
 ACCOUNT_LINK_TEXT = _(
     "If you no longer want to receive any notifications, "
@@ -24,16 +26,57 @@ PROJECT_LINK_TEXT = _(
 
 
 class EmailAplus(Email):
+    # languages of the email receivers of the current dispatch, replaced by
+    # dispatch and never updated in place
+    _receiver_languages = {}
+
+    def _get_email_organisation(self):
+        # get_organisation is needed once per receiver, look it up only once
+        if not hasattr(self, "_email_organisation"):
+            self._email_organisation = self.get_organisation()
+        return self._email_organisation
+
+    def dispatch(self, object, *args, **kwargs):
+        # receivers and their languages are loaded once per dispatch
+        self.object = object
+        self.kwargs = kwargs
+        receivers = self.get_receivers()
+        if not isinstance(receivers, QuerySet):
+            receivers = list(receivers)
+        self._receiver_languages = self._load_receiver_languages(receivers)
+        # the dispatch of adhocracy4 gets the receivers again
+        self.get_receivers = lambda: receivers
+        try:
+            return super().dispatch(object, *args, **kwargs)
+        finally:
+            del self.get_receivers
+
+    def _load_receiver_languages(self, receivers):
+        # user receivers have their language, only emails are looked up
+        if isinstance(receivers, QuerySet):
+            return {}
+        emails = [receiver for receiver in receivers if isinstance(receiver, str)]
+        # emails without a user are kept as None
+        languages = dict.fromkeys(emails)
+        if emails:
+            languages.update(get_languages_by_email(emails))
+        return languages
+
+    def _get_receiver_language(self, email):
+        if email in self._receiver_languages:
+            return self._receiver_languages[email]
+        return get_languages_by_email([email]).get(email)
+
     def get_languages(self, receiver):
         languages = super().get_languages(receiver)
-        organisation = self.get_organisation()
+        organisation = self._get_email_organisation()
 
         # Handle User object
         if isinstance(receiver, User):
             user_lang = receiver.language
         # Handle email string
-        elif isinstance(receiver, str) and User.objects.filter(email=receiver).exists():
-            user_lang = User.objects.get(email=receiver).language
+        elif isinstance(receiver, str):
+            user_lang = self._get_receiver_language(receiver)
         else:
             user_lang = None
 
@@ -51,40 +94,49 @@ class EmailAplus(Email):
 
     def get_context(self):
         context = super().get_context()
-        context["organisation"] = self.get_organisation()
+        context["organisation"] = self._get_email_organisation()
         return context
 
+    def _get_organisation_logo(self):
+        # an email instance may be dispatched many times, e.g. for the chunks
+        # of a newsletter, so the logo is read and encoded only once
+        if not hasattr(self, "_organisation_logo"):
+            self._organisation_logo = self._load_organisation_logo()
+        return self._organisation_logo
+
+    def _load_organisation_logo(self):
+        organisation = self._get_email_organisation()
+        if not (organisation and organisation.logo):
+            return None
+        # Replace the default inline logo with the organisation-specific logo,
+        # but keep the Content-ID consistent with the base template (cid:logo).
+        with open(organisation.logo.path, "rb") as f:
+            data = f.read()
+            try:
+                logo = MIMEImage(data)
+            except TypeError:
+                capture_message(
+                    "warning: MIMEImage failed to detect mime type:\n"
+                    "organisation:"
+                    + organisation.name
+                    + "\nfile:"
+                    + organisation.logo.path
+                )
+                mime_type = magic.from_buffer(data, mime=True)
+                logo = MIMEImage(data, _subtype=mime_type)
+        # attach organisation logo using the standard Content-ID expected
+        # by the email templates (cid:logo)
+        logo.add_header("Content-ID", "<logo>")
+        return logo
+
     def get_attachments(self):
         attachments = super().get_attachments()
 
-        organisation = self.get_organisation()
-        if organisation and organisation.logo:
-            # Replace the default inline logo with the organisation-specific logo,
-            # but keep the Content-ID consistent with the base template (cid:logo).
-            logo = None
-            with open(organisation.logo.path, "rb") as f:
-                data = f.read()
-                try:
-                    logo = MIMEImage(data)
-                except TypeError:
-                    capture_message(
-                        "warning: MIMEImage failed to detect mime type:\n"
-                        "organisation:"
-                        + organisation.name
-                        + "\nfile:"
-                        + organisation.logo.path
-                    )
-                    mime_type = magic.from_buffer(data, mime=True)
-                    logo = MIMEImage(data, _subtype=mime_type)
-            if logo:
-                # remove any existing logo attachment first to avoid duplicates
-                attachments = [
-                    a for a in attachments if a.get("Content-Id") != "<logo>"
-                ]
-                # attach organisation logo using the standard Content-ID expected
-                # by the email templates (cid:logo)
-                logo.add_header("Content-ID", "<logo>")
-                attachments += [logo]
+        logo = self._get_organisation_logo()
+        if logo:
+            # remove any existing logo attachment first to avoid duplicates
+            attachments = [a for a in attachments if a.get("Content-Id") != "<logo>"]
+            attachments += [logo]
 
         return attachments
 
@@ -29,37 +29,103 @@ class CommaSeparatedEmailField(forms.Field):
         return emails
 
 
+class EmailList(list):
+    """Emails extracted from a file and the lines which had invalid emails.
+
+    line_errors holds (line number, line) pairs, at most
+    EmailFileField.max_line_errors of them. error_count is the number of all
+    lines with errors.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.line_errors = []
+        self.error_count = 0
+
+
 class EmailFileField(forms.FileField):
-    """Extract emails from uploaded text files."""
+    """Extract emails from uploaded text files.
+
+    The file is read in chunks and the emails are deduplicated while reading,
+    so only the emails and the current line are kept in memory.
+    """
 
     widget = widgets.FileInput
     # Find possible email strings. Emails may be quoted and separated by
     # whitespaces, commas, semicolons or < and >.
     email_regex = re.compile(r'[^\s;,"\'<]+@[^\s;,"\'>]+\.[a-z]{2,}')
+    # Most emails are accepted by this check. As it is stricter than the
+    # EmailValidator, only the other emails have to be validated in full.
+    simple_email_regex = re.compile(
+        r"[-!#$%&'*+/=?^_`{}|~0-9a-zA-Z]+(?:\.[-!#$%&'*+/=?^_`{}|~0-9a-zA-Z]+)*"
+        r"@(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-z]{2,63}"
+    )
     email_validator = EmailValidator()
+    max_emails = 10000
+    max_line_length = 10000
+    max_line_errors = 20
+    default_error_messages = {
+        "too_many_emails": _(
+            "The file contains more than %(max_emails)s email addresses."
+        ),
+    }
 
     def clean(self, data, initial=None):
         file = super().clean(data, initial)
         return self._extract_emails(file)
 
+    def _iter_lines(self, file):
+        """Yield the lines of the file, cutting lines that are too long."""
+        rest = b""
+        for chunk in file.chunks():
+            lines = (rest + chunk).splitlines(keepends=True)
+            rest = lines.pop() if lines and not lines[-1].endswith(b"\n") else b""
+            yield from lines
+            if len(rest) > self.max_line_length:
+                # emails are short, so only the start of the line is kept
+                rest = rest[: self.max_line_length]
+        if rest:
+            yield rest
+
     def _extract_emails(self, file):
+        emails = EmailList()
         if not file:
-            return []
+            return emails
 
-        emails = []
-        for byteline in file:
+        seen = set()
+        for line_number, byteline in enumerate(self._iter_lines(file), 1):
             # As it is difficult to guess the correct encoding of a file,
             # email addresses are restricted to contain only ascii letters.
             # This works for every encoding which is a superset of ascii like
             # utf-8 and latin-1. Non ascii chars are simply ignored.
-            line = byteline.decode("ascii", "ignore")
-            for match in self.email_regex.finditer(line):
-                email = match.group(0)
-                if self.is_valid_email(email):
-                    emails.append(email)
+            line = byteline[: self.max_line_length].decode("ascii", "ignore")
+            if "@" not in line:
+                continue
+            has_error = False
+            matches = self.email_regex.findall(line)
+            for email in matches:
+                if email in seen:
+                    continue
+                if not self.is_valid_email(email):
+                    has_error = True
+                    continue
+                if len(seen) >= self.max_emails:
+                    raise ValidationError(
+                        self.error_messages["too_many_emails"],
+                        code="too_many_emails",
+                        params={"max_emails": self.max_emails},
+                    )
+                seen.add(email)
+                emails.append(email)
+            if has_error or not matches:
+                emails.error_count += 1
+                if len(emails.line_errors) < self.max_line_errors:
+                    emails.line_errors.append((line_number, line.strip()[:100]))
         return emails
 
     def is_valid_email(self, email):
+        if len(email) <= 320 and self.simple_email_regex.fullmatch(email):
+            return True
         try:
             self.email_validator(email)
             return True
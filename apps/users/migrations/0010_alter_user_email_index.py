@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("a4_candy_users", "0009_remove_user_get_notifications"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="email",
+            field=models.EmailField(
+                db_index=True, max_length=254, verbose_name="Email address"
+            ),
+        ),
+    ]
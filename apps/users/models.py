@@ -12,6 +12,7 @@ from adhocracy4.images.fields import ConfiguredImageField
 from adhocracy4.projects.enums import Access
 from adhocracy4.projects.models import Project
 from apps.organisations.models import OrganisationTermsOfUse
+from apps.projects import query
 
 from . import USERNAME_INVALID_MESSAGE
 from . import USERNAME_REGEX
@@ -39,6 +40,7 @@ class User(auth_models.AbstractBaseUser, auth_models.PermissionsMixin):
 
     email = models.EmailField(
         _("Email address"),
+        db_index=True,
     )
 
     is_staff = models.BooleanField(
@@ -121,35 +123,14 @@ class User(auth_models.AbstractBaseUser, auth_models.PermissionsMixin):
     REQUIRED_FIELDS = ["email"]
 
     def get_projects_follow_list(self, exclude_private_projects=False):
+        """Return the followed projects, active first, then future and past."""
         projects = Project.objects.filter(
             follow__creator=self, follow__enabled=True, is_draft=False
         ).select_related("organisation")
         if exclude_private_projects:
             projects = projects.exclude(models.Q(access=Access.PRIVATE))
 
-        now = timezone.now()
-
-        sorted_active_projects = (
-            projects.annotate(project_start=models.Min("module__phase__start_date"))
-            .annotate(project_end=models.Max("module__phase__end_date"))
-            .filter(project_start__lte=now, project_end__gt=now)
-            .order_by("project_end")
-        )
-
-        sorted_future_projects = (
-            projects.annotate(project_start=models.Min("module__phase__start_date"))
-            .filter(models.Q(project_start__gt=now) | models.Q(project_start=None))
-            .order_by("project_start")
-        )
-
-        sorted_past_projects = (
-            projects.annotate(project_start=models.Min("module__phase__start_date"))
-            .annotate(project_end=models.Max("module__phase__end_date"))
-            .filter(project_end__lt=now)
-            .order_by("project_start")
-        )
-
-        return sorted_active_projects, sorted_future_projects, sorted_past_projects
+        return query.sort_by_participation(projects)
 
     @cached_property
     def organisations(self):
@@ -1,16 +1,24 @@
 from rest_framework import serializers
 
+from . import cache
 from .models import User
 
 
 class UserSerializer(serializers.ModelSerializer):
     is_self = serializers.SerializerMethodField()
     user_image = serializers.ImageField(source="_avatar")
+    user_image_thumbnail = serializers.SerializerMethodField()
     user_image_fallback = serializers.SerializerMethodField()
 
     class Meta:
         model = User
-        fields = ("username", "user_image", "user_image_fallback", "is_self")
+        fields = (
+            "username",
+            "user_image",
+            "user_image_thumbnail",
+            "user_image_fallback",
+            "is_self",
+        )
 
     def get_is_self(self, instance):
         request = self.context.get("request")
@@ -19,6 +27,14 @@ class UserSerializer(serializers.ModelSerializer):
             return user == instance
         return False
 
+    def get_user_image_thumbnail(self, user):
+        """Serve the cached avatar thumbnail, the storage is not touched."""
+        url = cache.get_avatar_url(user)
+        request = self.context.get("request", None)
+        if url and request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
     def get_user_image_fallback(self, user):
         """Serve fallback as png as used in app."""
         try:
@@ -1,8 +1,14 @@
-from django.dispatch import receiver
-from allauth.account.signals import email_confirmed
+import functools
 
+from allauth.account.signals import email_confirmed
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from guest_user.models import Guest
 
+from . import cache
+from .models import User
+
 
 @receiver(email_confirmed)
 def on_email_confirmed(request, email_address, **kwargs):
@@ -12,3 +18,10 @@ def on_email_confirmed(request, email_address, **kwargs):
 
     user = email_address.user
     Guest.objects.filter(user=user).delete()
+
+
+@receiver(post_save, sender=User)
+def generate_avatar_thumbnail(sender, instance, **kwargs):
+    if instance._avatar and not cache.has_avatar_url(instance):
+        # the task loads the user, so it must not run before the commit
+        transaction.on_commit(functools.partial(cache.schedule_avatar_url, instance))
@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from . import cache
+from .models import User
+
+
+@shared_task(name="generate_avatar_thumbnail")
+def generate_avatar_thumbnail(user_id):
+    """
+    Generate the avatar thumbnail of a user and cache its url
+    """
+    user = User.objects.filter(pk=user_id).first()
+    if user is None:
+        return None
+    return cache.generate_avatar_url(user)
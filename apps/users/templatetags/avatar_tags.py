@@ -0,0 +1,14 @@
+from django import template
+
+from apps.users import cache
+
+register = template.Library()
+
+
+@register.filter
+def avatar_thumbnail_url(user):
+    """Return the url of the cached avatar thumbnail of the user.
+
+    Unlike the thumbnail_url filter this never touches the storage.
+    """
+    return cache.get_avatar_url(user) or ""
@@ -3,7 +3,15 @@ from django.utils.translation import activate
 from .models import User
 
 
+def get_languages_by_email(emails):
+    """Return a dict of the languages of the users with the given emails."""
+    return dict(
+        User.objects.filter(email__in=set(emails)).values_list("email", "language")
+    )
+
+
 def set_session_language(user_email, language=None):
     if not language:
-        language = User.objects.get(email=user_email).language
-    activate(language)
+        language = get_languages_by_email([user_email]).get(user_email)
+    if language:
+        activate(language)
@@ -1,4 +1,5 @@
 from django.shortcuts import redirect
+from django.utils.functional import cached_property
 from django.utils.translation import check_for_language
 from django.views.generic import FormView
 from django.views.generic.detail import DetailView
@@ -51,18 +52,9 @@ class ProfileView(DetailView):
     model = models.User
     slug_field = "username"
 
-    @property
+    @cached_property
     def projects_carousel(self):
-        (
-            sorted_active_projects,
-            sorted_future_projects,
-            sorted_past_projects,
-        ) = self.object.get_projects_follow_list(exclude_private_projects=True)
-        return (
-            list(sorted_active_projects)
-            + list(sorted_future_projects)
-            + list(sorted_past_projects)
-        )[:6]
+        return self.object.get_projects_follow_list(exclude_private_projects=True)[:6]
 
     @property
     def organisations(self):
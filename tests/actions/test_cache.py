@@ -0,0 +1,33 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from adhocracy4.actions.models import Action
+from apps.actions import cache
+
+
+@pytest.mark.django_db
+def test_public_actions_are_cached(comment_factory, idea):
+    comment_factory(content_object=idea)
+    actions = cache.get_public_actions(5)
+    assert [action.pk for action in actions] == list(
+        Action.objects.filter_public()
+        .exclude_updates()
+        .values_list("pk", flat=True)[:5]
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        cache.get_public_actions(5)
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_new_public_action_is_added(comment_factory, idea):
+    comment_factory(content_object=idea)
+    cache.get_public_actions(5)
+    comment = comment_factory(content_object=idea)
+
+    latest = Action.objects.filter_public().exclude_updates().first()
+    actions = cache.get_public_actions(5)
+    assert actions[0].pk == latest.pk
+    assert actions[0].obj == comment
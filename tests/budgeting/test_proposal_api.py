@@ -0,0 +1,23 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_proposal_geojson_is_archived(apiclient, proposal_factory):
+    proposal = proposal_factory()
+    module = proposal.module
+    archived = proposal_factory(module=module, is_archived=True)
+
+    url = reverse("proposals-geojson-list", kwargs={"module_pk": module.pk})
+
+    def pks(params):
+        response = apiclient.get(url, params)
+        assert response.status_code == 200
+        return {feature["properties"]["pk"] for feature in response.data["features"]}
+
+    # like the list filter, archived proposals are hidden if not filtered
+    assert pks({}) == {proposal.pk}
+    assert pks({"is_archived": "false"}) == {proposal.pk}
+    assert pks({"is_archived": "true"}) == {archived.pk}
+    # an empty filter ("All") shows all proposals
+    assert pks({"is_archived": ""}) == {proposal.pk, archived.pk}
@@ -0,0 +1,41 @@
+import requests
+from django.test import override_settings
+
+from apps.captcha import utils
+
+
+def test_stub_verifier():
+    assert utils.verify_token("testpass:1")
+    assert not utils.verify_token("wrong:1")
+    assert not utils.verify_token("")
+
+
+def test_verified_tokens_are_not_reused(monkeypatch):
+    calls = []
+
+    def verify(token):
+        calls.append(token)
+        return True
+
+    monkeypatch.setattr(utils.get_verifier(), "verify", verify)
+    assert utils.verify_token("valid")
+    assert utils.verify_token("valid")
+    assert calls == ["valid", "valid"]
+
+
+@override_settings(
+    CAPTCHA_VERIFY_BACKEND=utils.DEFAULT_BACKEND, PROSOPO_SECRET_KEY="secret"
+)
+def test_prosopo_verifier_timeout(monkeypatch):
+    verifier = utils.get_verifier()
+    assert isinstance(verifier, utils.ProsopoVerifier)
+    timeouts = []
+
+    def post(url, json, timeout):
+        timeouts.append(timeout)
+        raise requests.Timeout()
+
+    monkeypatch.setattr(verifier.session, "post", post)
+    assert not utils.verify_token("token")
+    assert timeouts == [utils.DEFAULT_TIMEOUT]
+    assert utils.get_verifier() is verifier
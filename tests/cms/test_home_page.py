@@ -0,0 +1,33 @@
+import pytest
+from django.test import RequestFactory
+from wagtail.models import Site
+
+from apps.cms.pages.models import HomePage
+
+
+@pytest.mark.django_db
+def test_home_page_streamfield_is_cached():
+    site = Site.objects.get(is_default_site=True)
+    page = site.root_page.add_child(
+        instance=HomePage(
+            title="Home",
+            body_streamfield_en=[("paragraph", "<p>First</p>")],
+            body_streamfield_de=[("paragraph", "<p>Erste</p>")],
+        )
+    )
+    request = RequestFactory().get("/")
+
+    context = page.get_context(request)
+    assert "First" in context["body_streamfield"]
+
+    # changes are only shown after publishing
+    page.body_streamfield_en = [("paragraph", "<p>Second</p>")]
+    page.save()
+    assert "First" in page.get_context(request)["body_streamfield"]
+
+    page.save_revision().publish()
+    assert "Second" in page.get_context(request)["body_streamfield"]
+
+    request.is_preview = True
+    page.body_streamfield_en = [("paragraph", "<p>Draft</p>")]
+    assert "Draft" in str(page.get_context(request)["body_streamfield"])
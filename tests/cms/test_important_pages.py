@@ -0,0 +1,76 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Page
+from wagtail.models import Site
+
+from apps.cms.settings import cache
+from apps.cms.settings.helpers import add_link_to_helptext
+from apps.cms.settings.helpers import get_important_page_url
+from apps.cms.settings.models import ImportantPages
+
+
+@pytest.mark.django_db
+def test_important_page_url_is_cached():
+    site = Site.objects.get(is_default_site=True)
+    page = site.root_page.add_child(instance=Page(title="Terms of use"))
+    important_pages = ImportantPages.for_site(site)
+
+    assert get_important_page_url("terms_of_use") is None
+    important_pages.terms_of_use = page
+    important_pages.save()
+
+    assert get_important_page_url("terms_of_use") == page.url
+    with CaptureQueriesContext(connection) as queries:
+        assert get_important_page_url("terms_of_use") == page.url
+        help_text = add_link_to_helptext("Help", "terms_of_use")
+    assert len(queries) == 0
+    assert page.url in help_text
+
+    page.unpublish()
+    assert add_link_to_helptext("Help", "terms_of_use") == "Help"
+
+
+@pytest.mark.django_db
+def test_important_page_cache_is_invalidated_on_delete():
+    site = Site.objects.get(is_default_site=True)
+    page = site.root_page.add_child(instance=Page(title="Imprint"))
+    important_pages = ImportantPages.for_site(site)
+    important_pages.imprint = page
+    important_pages.save()
+
+    assert get_important_page_url("imprint") == page.url
+    page.delete()
+    assert get_important_page_url("imprint") is None
+
+
+@pytest.mark.django_db
+def test_important_page_cache_expires(monkeypatch):
+    site = Site.objects.get(is_default_site=True)
+    page = site.root_page.add_child(instance=Page(title="Imprint"))
+    important_pages = ImportantPages.for_site(site)
+    important_pages.imprint = page
+    important_pages.save()
+
+    assert page.url in add_link_to_helptext("Help", "imprint")
+    # changes without a signal are picked up once the copy expired
+    Page.objects.filter(pk=page.pk).update(live=False)
+    assert page.url in add_link_to_helptext("Help", "imprint")
+    monkeypatch.setattr(cache, "IMPORTANT_PAGES_MAX_AGE", 0)
+    assert add_link_to_helptext("Help", "imprint") == "Help"
+
+
+def test_setup_imports_important_pages_cache():
+    # the contacts models import the cache while the models are loading
+    code = "import django; django.setup(); import apps.cms.contacts.models"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    assert result.returncode == 0, result.stderr
@@ -4,6 +4,7 @@ import factory
 import pytest
 from celery import Celery
 from django.contrib.gis.geos import Point
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from PIL import Image
@@ -41,6 +42,13 @@ def pytest_configure():
     Celery(task_always_eager=True)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def apiclient():
     return APIClient()
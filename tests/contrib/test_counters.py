@@ -0,0 +1,105 @@
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+
+from adhocracy4.ratings.models import Rating
+from apps.contrib.counters import initialize_counters
+from apps.ideas.models import Idea
+
+
+def _get_counts(model, item):
+    item = (
+        model.objects.annotate_comment_count()
+        .annotate_positive_rating_count()
+        .annotate_negative_rating_count()
+        .get(pk=item.pk)
+    )
+    return (
+        item.comment_count,
+        item.positive_rating_count,
+        item.negative_rating_count,
+    )
+
+
+@pytest.mark.django_db
+def test_comment_counter(idea_factory, comment_factory):
+    idea = idea_factory()
+    comment = comment_factory(content_object=idea)
+    comment_factory(content_object=idea)
+    comment_factory(content_object=comment)
+    assert _get_counts(Idea, idea) == (3, 0, 0)
+
+    # deleting a comment deletes its replies
+    comment.delete()
+    assert _get_counts(Idea, idea) == (1, 0, 0)
+
+
+@pytest.mark.django_db
+def test_rating_counter(idea_factory, rating_factory, comment_factory):
+    idea = idea_factory()
+    rating = rating_factory(content_object=idea, value=1)
+    rating_factory(content_object=idea, value=1)
+    assert _get_counts(Idea, idea) == (0, 2, 0)
+
+    rating.value = -1
+    rating.save()
+    assert _get_counts(Idea, idea) == (0, 1, 1)
+
+    rating.value = 0
+    rating.save()
+    assert _get_counts(Idea, idea) == (0, 1, 0)
+
+    Rating.objects.filter(value=1).delete()
+    assert _get_counts(Idea, idea) == (0, 0, 0)
+
+    # ratings of comments do not count for the item
+    rating_factory(content_object=comment_factory(content_object=idea))
+    assert _get_counts(Idea, idea) == (1, 0, 0)
+
+
+@pytest.mark.django_db
+def test_repair_item_counters(idea_factory, comment_factory, rating_factory):
+    idea = idea_factory()
+    comment_factory(content_object=idea)
+    rating_factory(content_object=idea, value=-1)
+    Idea.objects.filter(pk=idea.pk).update(
+        cached_comment_count=7, cached_positive_rating_count=3
+    )
+    assert _get_counts(Idea, idea) == (7, 3, 1)
+
+    call_command("repair_item_counters")
+    assert _get_counts(Idea, idea) == (1, 0, 1)
+
+
+@pytest.mark.django_db
+def test_initialize_counters(idea_factory, comment_factory, rating_factory):
+    idea = idea_factory()
+    other_idea = idea_factory(module=idea.module)
+    comment = comment_factory(content_object=idea)
+    comment_factory(content_object=comment)
+    rating_factory(content_object=idea, value=1)
+    rating_factory(content_object=other_idea, value=-1)
+    Idea.objects.update(
+        cached_comment_count=0,
+        cached_positive_rating_count=0,
+        cached_negative_rating_count=0,
+    )
+
+    initialize_counters(apps, "a4_candy_ideas", "Idea")
+    assert _get_counts(Idea, idea) == (2, 1, 0)
+    assert _get_counts(Idea, other_idea) == (0, 0, 1)
+
+
+@pytest.mark.django_db
+def test_save_keeps_concurrent_counter_changes(
+    idea_factory, comment_factory, rating_factory
+):
+    idea = idea_factory()
+    loaded = Idea.objects.get(pk=idea.pk)
+    comment_factory(content_object=idea)
+    rating_factory(content_object=idea, value=1)
+
+    loaded.name = "changed"
+    loaded.save()
+    assert _get_counts(Idea, idea) == (1, 1, 0)
+    assert Idea.objects.get(pk=idea.pk).name == "changed"
@@ -0,0 +1,93 @@
+import pytest
+from easy_thumbnails.alias import aliases
+from easy_thumbnails.files import get_thumbnailer
+
+from adhocracy4.projects.models import Project
+from apps.contrib import thumbnails
+from apps.contrib.templatetags.contrib_tags import prepared_thumbnail_url
+
+
+def _thumbnail_exists(image, alias):
+    thumbnailer = get_thumbnailer(image)
+    options = aliases.get(alias, target=thumbnailer.alias_target)
+    return thumbnailer.get_existing_thumbnail(options) is not None
+
+
+@pytest.mark.django_db
+def test_thumbnails_are_generated_on_upload(
+    project_factory, image_png, small_image, django_capture_on_commit_callbacks
+):
+    # tasks run eagerly in the tests
+    with django_capture_on_commit_callbacks(execute=True):
+        project = project_factory(image=image_png, tile_image=small_image)
+    for alias in ["heroimage", "heroimage_preview", "project_thumbnail"]:
+        assert _thumbnail_exists(project.image, alias)
+    assert _thumbnail_exists(project.tile_image, "project_thumbnail")
+
+
+@pytest.mark.django_db
+def test_item_image_is_generated_on_upload(
+    idea_factory, image_png, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        idea = idea_factory(image=image_png)
+    assert _thumbnail_exists(idea.image, "item_image")
+
+
+@pytest.mark.django_db
+def test_thumbnails_are_generated_on_change(
+    project_factory, image_png, monkeypatch, django_capture_on_commit_callbacks
+):
+    project = project_factory(image=image_png)
+    scheduled = []
+    monkeypatch.setattr(
+        thumbnails,
+        "schedule_thumbnails",
+        lambda obj, field_names: scheduled.append(field_names),
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        project.name = "changed"
+        project.save()
+    assert scheduled == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        project.tile_image = project.image.name
+        project.save()
+    assert scheduled == [["tile_image"]]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        project.save()
+    assert scheduled == [["tile_image"]]
+
+    project = Project.objects.only("pk", "name").get(pk=project.pk)
+    with django_capture_on_commit_callbacks(execute=True):
+        project.save()
+    assert scheduled == [["tile_image"]]
+
+
+@pytest.mark.django_db
+def test_get_thumbnail_url(project_factory, image_png):
+    project = project_factory(image=image_png)
+    thumbnail_url = get_thumbnailer(project.image)["heroimage"].url
+    assert thumbnails.get_thumbnail_url(project.image, "heroimage") == thumbnail_url
+
+    # idea_thumbnail is not generated in advance for project images, it is
+    # generated on the first request instead of serving the original
+    assert not _thumbnail_exists(project.image, "idea_thumbnail")
+    url = thumbnails.get_thumbnail_url(project.image, "idea_thumbnail")
+    assert url != project.image.url
+    assert url == get_thumbnailer(project.image)["idea_thumbnail"].url
+    assert _thumbnail_exists(project.image, "idea_thumbnail")
+
+    assert thumbnails.get_thumbnail_url(project.image, "unknown") == ""
+
+
+@pytest.mark.django_db
+def test_prepared_thumbnail_url_storage_error(project_factory, image_png, monkeypatch):
+    project = project_factory(image=image_png)
+
+    def get_thumbnail_url(image, alias):
+        raise OSError
+
+    monkeypatch.setattr(thumbnails, "get_thumbnail_url", get_thumbnail_url)
+    assert prepared_thumbnail_url(project.image, "heroimage") == ""
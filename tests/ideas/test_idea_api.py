@@ -1,6 +1,8 @@
 import tempfile
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from PIL import Image
 from rest_framework import status
@@ -283,3 +285,39 @@ def test_user_can_add_and_delete_idea_image_during_phase(
         assert response.status_code == 200
         idea.refresh_from_db()
         assert not idea.image
+
+
+@pytest.mark.django_db
+def test_idea_list_api_num_queries(
+    apiclient, user, phase_factory, idea_factory, label_factory, rating_factory
+):
+    phase, module, project, idea = setup_phase(
+        phase_factory, idea_factory, phases.CollectPhase
+    )
+    idea.labels.add(label_factory(module=module))
+    rating_factory(content_object=idea, creator=user)
+    own_idea = idea_factory(module=module, creator=user)
+    url = reverse("ideas-list", kwargs={"module_pk": module.pk})
+    apiclient.force_authenticate(user=user)
+
+    with freeze_phase(phase):
+        with CaptureQueriesContext(connection) as few_ideas_queries:
+            response = apiclient.get(url, format="json")
+    assert len(response.data) == 2
+    data = {entry["pk"]: entry for entry in response.data}
+    assert data[idea.pk]["user_rating"]["value"] == 1
+    assert data[idea.pk]["has_changing_permission"] is False
+    assert data[own_idea.pk]["user_rating"] is None
+    assert data[own_idea.pk]["has_changing_permission"] is True
+    assert data[own_idea.pk]["has_deleting_permission"] is True
+
+    for _ in range(20):
+        other_idea = idea_factory(module=module)
+        other_idea.labels.add(label_factory(module=module))
+        idea_factory(module=module, creator=user)
+
+    with freeze_phase(phase):
+        with CaptureQueriesContext(connection) as many_ideas_queries:
+            response = apiclient.get(url, format="json")
+    assert len(response.data) == 42
+    assert len(many_ideas_queries) == len(few_ideas_queries)
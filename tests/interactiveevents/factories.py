@@ -2,6 +2,7 @@ import factory
 
 from adhocracy4.test import factories as a4_factories
 from apps.interactiveevents import models
+from apps.interactiveevents.helpers import toggle_like
 from tests.factories import CategoryFactory
 
 
@@ -19,6 +20,12 @@ class LikeFactory(factory.django.DjangoModelFactory):
         model = models.Like
 
     livequestion = factory.SubFactory(LiveQuestionFactory)
+    session = factory.Sequence(lambda n: "session-{}".format(n))
+
+    @classmethod
+    def _create(cls, model_class, livequestion, session):
+        # likes are only added by toggle_like, which updates the counters
+        return toggle_like(livequestion, session, True)
 
 
 class InteractiveExtraFieldsFactory(factory.django.DjangoModelFactory):
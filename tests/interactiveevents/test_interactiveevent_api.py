@@ -1,12 +1,20 @@
 import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache as django_cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from rest_framework.test import APIClient
 
 from adhocracy4.test.helpers import freeze_phase
 from adhocracy4.test.helpers import freeze_post_phase
 from adhocracy4.test.helpers import freeze_pre_phase
 from adhocracy4.test.helpers import setup_phase
+from apps.interactiveevents import api
+from apps.interactiveevents import cache
 from apps.interactiveevents import models
 from apps.interactiveevents import phases
+from apps.interactiveevents.helpers import toggle_like
 
 
 @pytest.mark.django_db
@@ -166,3 +174,178 @@ def test_user_cannot_add_like_during_non_active_phase(
 
     assert response.status_code == 403
     assert models.Like.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_question_list_is_cached(
+    apiclient, phase_factory, live_question_factory, like_factory
+):
+    phase, module, project, livequestion = setup_phase(
+        phase_factory, live_question_factory, phases.IssuePhase
+    )
+    url = reverse("interactiveevents-list", kwargs={"module_pk": module.pk})
+
+    response = apiclient.get(url)
+    assert response.status_code == 200
+    assert response.data[0]["likes"] == {"count": 0, "session_like": False}
+    etag = response["ETag"]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = apiclient.get(url)
+    assert response.status_code == 200
+    assert not any("livequestion" in query["sql"] for query in queries)
+
+    response = apiclient.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    like_factory(livequestion=livequestion, session="other")
+    response = apiclient.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data[0]["likes"] == {"count": 1, "session_like": False}
+
+
+@pytest.mark.django_db
+def test_question_list_session_like(apiclient, phase_factory, live_question_factory):
+    phase, module, project, livequestion = setup_phase(
+        phase_factory, live_question_factory, phases.IssuePhase
+    )
+    url = reverse("interactiveevents-list", kwargs={"module_pk": module.pk})
+    like_url = reverse("likes-list", kwargs={"livequestion_pk": livequestion.pk})
+
+    with freeze_phase(phase):
+        apiclient.post(like_url, {"value": True})
+        response = apiclient.get(url)
+    assert response.data[0]["likes"] == {"count": 1, "session_like": True}
+
+    response = APIClient().get(url)
+    assert response.data[0]["likes"] == {"count": 1, "session_like": False}
+
+
+def test_previous_questions_served_while_rebuilding():
+    calls = []
+
+    def get_data():
+        calls.append(True)
+        return [len(calls)]
+
+    version, questions = cache.get_questions(1, False, "query", get_data)
+    assert questions == [1]
+    assert cache.get_questions(1, False, "query", get_data) == (version, [1])
+
+    cache.invalidate_questions(1)
+    new_version = cache.get_questions_version(1)
+    # another request is rebuilding the list
+    django_cache.add(
+        cache.QUESTIONS_LOCK_KEY.format(
+            module_id=1, version=new_version, moderator=0, query="query"
+        ),
+        True,
+    )
+    assert cache.get_questions(1, False, "query", get_data) == (version, [1])
+    assert len(calls) == 1
+
+    assert cache.get_questions(1, True, "query", get_data) == (new_version, [2])
+
+
+def test_stream_versions(monkeypatch):
+    monkeypatch.setattr(api, "EVENTS_POLL_INTERVAL", 0)
+    monkeypatch.setattr(api, "EVENTS_DURATION", 0.1)
+    version = cache.get_questions_version(1)
+
+    async def read_events():
+        events = []
+        async for event in api.stream_versions(1, version):
+            events.append(event)
+            if len(events) == 1:
+                cache.invalidate_questions(1)
+        return events
+
+    events = async_to_sync(read_events)()
+    new_version = cache.get_questions_version(1)
+    assert new_version != version
+    assert events == [
+        "retry: {}\n\n".format(api.EVENTS_RETRY),
+        "id: {0}\ndata: {0}\n\n".format(new_version),
+    ]
+
+
+@pytest.mark.django_db
+def test_question_events(client, settings, module):
+    url = reverse("interactiveevents-events", kwargs={"module_pk": module.pk})
+    settings.INTERACTIVE_EVENTS_PUSH = False
+    assert client.get(url).status_code == 404
+
+    settings.INTERACTIVE_EVENTS_PUSH = True
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
+    assert response.streaming
+
+    url = reverse("interactiveevents-events", kwargs={"module_pk": module.pk + 1})
+    assert client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+def test_like_toggle_is_idempotent(apiclient, phase_factory, live_question_factory):
+    phase, module, project, livequestion = setup_phase(
+        phase_factory, live_question_factory, phases.IssuePhase
+    )
+    url = reverse("likes-list", kwargs={"livequestion_pk": livequestion.pk})
+
+    with freeze_phase(phase):
+        for value in (True, True):
+            response = apiclient.post(url, {"value": value}, format="json")
+            assert response.status_code == 201
+        session_key = apiclient.session.session_key
+        like = models.Like.objects.get()
+        assert like.session == session_key
+        livequestion.refresh_from_db()
+        assert livequestion.cached_like_count == 1
+
+        for value in (False, False):
+            response = apiclient.post(url, {"value": value}, format="json")
+            assert response.status_code == 201
+        assert models.Like.objects.count() == 0
+        livequestion.refresh_from_db()
+        assert livequestion.cached_like_count == 0
+
+
+@pytest.mark.django_db
+def test_like_toggle_num_queries(live_question_factory):
+    livequestion = models.LiveQuestion.objects.select_related("module").get(
+        pk=live_question_factory().pk
+    )
+
+    # savepoint, insert, release, the like counter and the insight
+    with CaptureQueriesContext(connection) as queries:
+        assert toggle_like(livequestion, "session", True)
+    assert len(queries) == 5
+    # savepoint, the rejected insert and the rollback
+    with CaptureQueriesContext(connection) as queries:
+        assert toggle_like(livequestion, "session", True) is None
+    assert len(queries) == 3
+
+    # the delete and the like counter
+    with CaptureQueriesContext(connection) as queries:
+        toggle_like(livequestion, "session", False)
+    assert len(queries) == 2
+    with CaptureQueriesContext(connection) as queries:
+        toggle_like(livequestion, "session", False)
+    assert len(queries) == 1
+
+    livequestion.refresh_from_db()
+    assert livequestion.cached_like_count == 0
+    assert livequestion.module.project.insight.ratings == 1
+
+
+@pytest.mark.django_db
+def test_save_keeps_concurrent_likes(live_question_factory):
+    livequestion = live_question_factory()
+    loaded = models.LiveQuestion.objects.get(pk=livequestion.pk)
+    toggle_like(livequestion, "session", True)
+
+    loaded.is_on_shortlist = True
+    loaded.save()
+    livequestion.refresh_from_db()
+    assert livequestion.cached_like_count == 1
+    assert livequestion.is_on_shortlist
@@ -0,0 +1,77 @@
+import pytest
+from django.urls import reverse
+
+from apps.mapideas.api import cluster_features
+
+
+def _point(lng, lat):
+    return {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {"type": "Point", "coordinates": [lng, lat]},
+    }
+
+
+@pytest.mark.django_db
+def test_mapidea_geojson(apiclient, map_idea_factory, category_factory):
+    mapidea = map_idea_factory(point=_point(13.4, 52.5))
+    module = mapidea.module
+    category = category_factory(module=module)
+    other = map_idea_factory(module=module, point=_point(9.9, 53.5), category=category)
+    map_idea_factory(point=_point(13.4, 52.5))
+
+    url = reverse("mapideas-geojson-list", kwargs={"module_pk": module.pk})
+    response = apiclient.get(url)
+    assert response.status_code == 200
+    assert response.data["type"] == "FeatureCollection"
+    features = {
+        feature["properties"]["pk"]: feature for feature in response.data["features"]
+    }
+    assert set(features) == {mapidea.pk, other.pk}
+    assert features[mapidea.pk]["geometry"]["coordinates"] == [13.4, 52.5]
+    assert features[other.pk]["properties"] == {
+        "pk": other.pk,
+        "name": other.name,
+        "url": other.get_absolute_url(),
+        "category": category.pk,
+        "comment_count": 0,
+        "positive_rating_count": 0,
+        "negative_rating_count": 0,
+    }
+
+    response = apiclient.get(url, {"bbox": "13,52,14,53"})
+    assert [f["properties"]["pk"] for f in response.data["features"]] == [mapidea.pk]
+
+    # the bounding box crosses the antimeridian
+    response = apiclient.get(url, {"bbox": "170,52,10,54"})
+    assert [f["properties"]["pk"] for f in response.data["features"]] == [other.pk]
+
+    response = apiclient.get(url, {"category": category.pk})
+    assert [f["properties"]["pk"] for f in response.data["features"]] == [other.pk]
+
+    response = apiclient.get(url, {"zoom": 0})
+    assert len(response.data["features"]) == 1
+    assert response.data["features"][0]["properties"]["count"] == 2
+
+    response = apiclient.get(url, {"zoom": 10})
+    assert len(response.data["features"]) == 2
+
+    assert apiclient.get(url, {"bbox": "13,52"}).status_code == 400
+    assert apiclient.get(url, {"zoom": "near"}).status_code == 400
+
+
+def test_cluster_features():
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": coordinates},
+            "properties": {"pk": pk},
+        }
+        for pk, coordinates in enumerate([[13.40, 52.50], [13.41, 52.51], [9.9, 53.5]])
+    ]
+    clustered = cluster_features(features, 6, 4)
+    assert len(clustered) == 2
+    cluster = next(f for f in clustered if f["properties"].get("cluster"))
+    assert cluster["properties"]["count"] == 2
+    assert cluster["properties"]["bbox"] == [13.40, 52.50, 13.41, 52.51]
+    assert cluster["geometry"]["coordinates"] == pytest.approx([13.405, 52.505])
@@ -1,4 +1,5 @@
 import pytest
+from django.urls import reverse
 
 from adhocracy4.test.helpers import assert_template_response
 from adhocracy4.test.helpers import freeze_phase
@@ -36,3 +37,30 @@ def test_list_view(client, phase_factory, map_idea_factory, organisation):
         assert response.context_data["mapidea_list"][0].comment_count == 0
         assert response.context_data["mapidea_list"][0].positive_rating_count == 0
         assert response.context_data["mapidea_list"][0].negative_rating_count == 0
+
+
+@pytest.mark.django_db
+def test_list_view_paginated(client, phase_factory, map_idea_factory, organisation):
+    phase, module, project, mapidea = setup_phase(
+        phase_factory, map_idea_factory, phases.FeedbackPhase
+    )
+    for _ in range(9):
+        map_idea_factory(module=module)
+    url = project.get_absolute_url()
+
+    with freeze_phase(phase):
+        response = client.get(url)
+        assert len(response.context_data["paginated_list"]) == 8
+        assert response.context_data["geojson_url"] == reverse(
+            "mapideas-geojson-list", kwargs={"module_pk": module.pk}
+        )
+        assert response.context_data["is_paginated"]
+
+        response = client.get(url, {"page": 5})
+        assert response.status_code == 200
+        assert response.context_data["page_obj"].number == 2
+        assert len(response.context_data["paginated_list"]) == 2
+
+        response = client.get(url, {"page_size": 0})
+        assert len(response.context_data["paginated_list"]) == 10
+        assert not response.context_data["is_paginated"]
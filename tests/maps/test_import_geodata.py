@@ -0,0 +1,143 @@
+import io
+import json
+
+import pytest
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.maps.management.commands.import_geodata import iter_features
+from apps.maps.models import MapPreset
+from apps.maps.models import MapPresetCategory
+
+
+def _feature(**properties):
+    return {
+        "type": "Feature",
+        "properties": properties,
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[13.3, 52.5], [13.4, 52.5], [13.4, 52.6], [13.3, 52.5]]],
+        },
+    }
+
+
+def _write_collection(path, features):
+    path.write_text(
+        json.dumps(
+            {"type": "FeatureCollection", "name": "layer", "features": features},
+            indent=2,
+        )
+    )
+    return str(path)
+
+
+def test_iter_features():
+    features = [_feature(name="a], {b", index=index) for index in range(20)]
+    text = json.dumps({"type": "FeatureCollection", "features": features})
+    for read_size in [1, 7, 100, 10000]:
+        assert list(iter_features(io.StringIO(text), read_size)) == features
+    text = json.dumps({"type": "FeatureCollection", "features": []})
+    assert list(iter_features(io.StringIO(text))) == []
+
+
+def test_iter_features_spanning_reads():
+    coordinates = [[[13 + index / 1000, 52.5] for index in range(1000)]]
+    features = [_feature(index=index) for index in range(3)]
+    features[1]["geometry"]["coordinates"] = coordinates
+    text = json.dumps({"type": "FeatureCollection", "features": features})
+    # the large feature is split over many reads
+    assert len(json.dumps(features[1])) > 10 * 1024
+    assert list(iter_features(io.StringIO(text), 1024)) == features
+
+
+def test_iter_features_key_found_earlier():
+    features = [_feature(name="features")]
+    text = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "name": "features",
+            "description": '"features": [{"type": "Feature"}]',
+            "crs": {"features": [{"type": "name"}]},
+            "features": features,
+            "bbox": [{"features": []}],
+        }
+    )
+    for read_size in [1, 7, 10000]:
+        assert list(iter_features(io.StringIO(text), read_size)) == features
+
+
+def _import(tmp_path, regions_per_district, *args):
+    districts = _write_collection(
+        tmp_path / "districts.json",
+        [_feature(spatial_alias="Mitte"), _feature(spatial_alias="Pankow")],
+    )
+    regions = _write_collection(
+        tmp_path / "regions.json",
+        [
+            _feature(BEZNAME=district, BZR_NAME="{} {}".format(district, index))
+            for district in ["Mitte", "Pankow"]
+            for index in range(regions_per_district)
+        ],
+    )
+    out = io.StringIO()
+    call_command(
+        "import_geodata",
+        "--districts-file",
+        districts,
+        "--regions-file",
+        regions,
+        *args,
+        stdout=out,
+    )
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_geodata(tmp_path):
+    with CaptureQueriesContext(connection) as few_queries:
+        output = _import(tmp_path, 2, "--batch-size", "1000")
+    assert "Imported districts: 2 new, 0 updated, 0 skipped" in output
+    assert "Imported regions: 4 new, 0 updated, 0 skipped" in output
+    assert MapPreset.objects.count() == 6
+    assert set(MapPresetCategory.objects.values_list("name", flat=True)) == {
+        "Bezirke - Berlin",
+        "Mitte",
+        "Pankow",
+    }
+    preset = MapPreset.objects.get(name="Pankow 1")
+    assert preset.category.name == "Pankow"
+    assert preset.polygon["features"][0]["properties"]["BZR_NAME"] == "Pankow 1"
+
+    MapPreset.objects.all().delete()
+    MapPresetCategory.objects.all().delete()
+    with CaptureQueriesContext(connection) as many_queries:
+        _import(tmp_path, 50, "--batch-size", "1000")
+    assert MapPreset.objects.count() == 102
+    assert len(many_queries) == len(few_queries)
+
+
+@pytest.mark.django_db
+def test_import_geodata_existing_presets(tmp_path):
+    _import(tmp_path, 2)
+    MapPreset.objects.filter(name="Mitte 0").update(polygon={})
+
+    output = _import(tmp_path, 3)
+    assert "Imported regions: 2 new, 0 updated, 4 skipped" in output
+    assert MapPreset.objects.count() == 8
+    assert MapPreset.objects.get(name="Mitte 0").polygon == {}
+
+    output = _import(tmp_path, 3, "--update")
+    assert "Imported regions: 0 new, 6 updated, 0 skipped" in output
+    assert MapPreset.objects.count() == 8
+    assert MapPreset.objects.get(name="Mitte 0").polygon["type"] == "FeatureCollection"
+
+
+@pytest.mark.django_db
+def test_import_geodata_requires_both_files(tmp_path):
+    districts = _write_collection(tmp_path / "districts.json", [])
+    for option in ["--districts-file", "--regions-file"]:
+        with pytest.raises(CommandError, match="must be given together"):
+            call_command("import_geodata", option, districts)
+    assert MapPreset.objects.count() == 0
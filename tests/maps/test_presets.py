@@ -0,0 +1,102 @@
+import json
+import math
+
+import pytest
+from django.urls import reverse
+
+from apps.maps import cache
+from apps.maps.geometry import simplify_geojson
+from apps.maps.geometry import simplify_line
+from apps.maps.models import MapPreset
+from apps.maps.models import MapPresetCategory
+from apps.maps.widgets import MapChoosePolygonWithPresetWidget
+
+
+def _circle(points):
+    ring = [
+        [
+            13.4 + 0.01 * math.cos(2 * math.pi * i / points),
+            52.5 + 0.01 * math.sin(2 * math.pi * i / points),
+        ]
+        for i in range(points)
+    ]
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {"type": "Polygon", "coordinates": [ring + [ring[0]]]},
+            }
+        ],
+    }
+
+
+def _ring(polygon):
+    return polygon["features"][0]["geometry"]["coordinates"][0]
+
+
+def test_simplify_line():
+    line = [[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7]]
+    assert simplify_line(line, 0.5) == [[0, 0], [2, -0.1], [3, 5], [5, 7]]
+    assert simplify_line(line, 0) == line
+
+
+def test_simplify_geojson():
+    polygon = _circle(1000)
+    simplified = simplify_geojson(polygon, 0.0001)
+    ring = _ring(simplified)
+    assert 4 <= len(ring) < 100
+    assert ring[0] == ring[-1]
+    # the original is not changed
+    assert len(_ring(polygon)) == 1001
+    assert len(_ring(simplify_geojson(polygon, 1))) == 4
+
+
+@pytest.mark.django_db
+def test_preset_catalogue(django_assert_num_queries):
+    category = MapPresetCategory.objects.create(name="Bezirke")
+    MapPreset.objects.create(name="Mitte", polygon=_circle(10), category=category)
+    uncategorized = MapPreset.objects.create(name="Berlin", polygon=_circle(10))
+
+    with django_assert_num_queries(1):
+        catalogue = cache.get_preset_catalogue()
+    with django_assert_num_queries(0):
+        assert cache.get_preset_catalogue() == catalogue
+    assert catalogue[0] == [{"pk": uncategorized.pk, "name": "Berlin"}]
+    assert [
+        (name, [preset["name"] for preset in presets]) for name, presets in catalogue[1]
+    ] == [("Bezirke", ["Mitte"])]
+
+    MapPreset.objects.create(name="Pankow", polygon=_circle(10), category=category)
+    html = MapChoosePolygonWithPresetWidget().render("polygon", "", {})
+    assert "Pankow" in html
+    assert "coordinates" not in html
+
+
+@pytest.mark.django_db
+def test_preset_geometry_view(client):
+    preset = MapPreset.objects.create(name="Mitte", polygon=_circle(1000))
+    url = reverse("a4_candy_maps:preset-geometry", kwargs={"pk": preset.pk})
+
+    response = client.get(url, {"level": 0})
+    assert response.status_code == 200
+    assert json.loads(response.content) == preset.polygon
+
+    response = client.get(url, {"level": 3})
+    assert len(_ring(json.loads(response.content))) < 1001
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    preset.name = "Mitte-Tiergarten"
+    preset.save()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+    assert client.get(url, {"level": 9}).status_code == 404
+    missing = reverse("a4_candy_maps:preset-geometry", kwargs={"pk": preset.pk + 1})
+    assert client.get(missing).status_code == 404
@@ -1,4 +1,5 @@
 import pytest
+from django.core import mail
 from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 
@@ -61,3 +62,32 @@ def test_newsletter_email_uses_organisation_logo_as_inline_logo(tmp_path):
         content_ids = [attachment["Content-Id"] for attachment in attachments]
 
         assert content_ids.count("<logo>") == 1
+
+
+@pytest.mark.django_db
+def test_newsletter_email_logo_is_loaded_once(small_image, monkeypatch):
+    """
+    Ensure that the organisation logo is read only once when the same email
+    is dispatched to the receivers of a chunk one by one.
+    """
+    organisation = OrganisationFactory(logo=small_image)
+    newsletter = NewsletterFactory(organisation=organisation)
+    users = [UserFactory(get_newsletters=True) for i in range(2)]
+    loaded = []
+    load_logo = NewsletterEmail._load_organisation_logo
+
+    def count_loads(self):
+        loaded.append(self)
+        return load_logo(self)
+
+    monkeypatch.setattr(NewsletterEmail, "_load_organisation_logo", count_loads)
+    email = NewsletterEmail()
+    for user in users:
+        email.dispatch(
+            newsletter, participant_ids=[user.pk], organisation_pk=organisation.pk
+        )
+
+    assert len(loaded) == 1
+    assert len(mail.outbox) == 2
+    for message in mail.outbox:
+        assert "image/jpeg" in str(message.attachments[0])
@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from adhocracy4.follows import models as follow_models
+from apps.newsletters import emails
+from apps.newsletters import models as newsletter_models
+from apps.newsletters import tasks
+
+
+def _add_followers(project, user_factory, follow_factory, count):
+    follow_models.Follow.objects.filter(project=project).delete()
+    users = [user_factory(get_newsletters=True) for i in range(count)]
+    for user in users:
+        follow_factory(creator=user, project=project)
+    return sorted(users, key=lambda user: user.pk)
+
+
+@pytest.mark.django_db
+def test_send_newsletter_in_chunks(
+    newsletter_factory, user_factory, follow_factory, monkeypatch
+):
+    monkeypatch.setattr(tasks, "NEWSLETTER_CHUNK_SIZE", 2)
+    newsletter = newsletter_factory(receivers=newsletter_models.PROJECT)
+    users = _add_followers(newsletter.project, user_factory, follow_factory, 5)
+    user_factory(get_newsletters=True)
+
+    # tasks run eagerly in the tests
+    tasks.send_newsletter(newsletter.pk)
+
+    newsletter.refresh_from_db()
+    assert newsletter.receiver_count == 5
+    assert newsletter.sent_count == 5
+    assert newsletter.last_receiver_id == users[-1].pk
+    assert newsletter.finished is not None
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(
+        user.email for user in users
+    )
+
+
+@pytest.mark.django_db
+def test_send_newsletter_resumes_from_checkpoint(
+    newsletter_factory, user_factory, follow_factory
+):
+    newsletter = newsletter_factory(receivers=newsletter_models.PROJECT)
+    users = _add_followers(newsletter.project, user_factory, follow_factory, 4)
+    newsletter_models.Newsletter.objects.filter(pk=newsletter.pk).update(
+        receiver_count=4, sent_count=2, last_receiver_id=users[1].pk
+    )
+
+    tasks.send_newsletter(newsletter.pk)
+
+    newsletter.refresh_from_db()
+    assert newsletter.sent_count == 4
+    assert newsletter.finished is not None
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(
+        user.email for user in users[2:]
+    )
+
+    # finished newsletters are not sent again
+    tasks.send_newsletter(newsletter.pk)
+    assert len(mail.outbox) == 2
+
+
+@pytest.mark.django_db
+def test_send_newsletter_chunk_sent_twice(newsletter_factory, user_factory):
+    newsletter = newsletter_factory(receivers=newsletter_models.PLATFORM)
+    user_factory()
+    assert tasks.send_newsletter_chunk(newsletter.pk, 1) == 0
+    assert len(mail.outbox) == 0
+
+
+@pytest.mark.django_db
+def test_platform_newsletter_only_sent_to_subscribers(
+    newsletter_factory, user_factory, admin
+):
+    newsletter = newsletter_factory(receivers=newsletter_models.PLATFORM, creator=admin)
+    subscriber = user_factory(get_newsletters=True)
+    user_factory(get_newsletters=False)
+    user_factory(get_newsletters=True, is_active=False)
+
+    tasks.send_newsletter(newsletter.pk)
+
+    newsletter.refresh_from_db()
+    assert newsletter.receiver_count == 1
+    assert newsletter.sent_count == 1
+    assert [message.to[0] for message in mail.outbox] == [subscriber.email]
+
+
+@pytest.mark.django_db
+def test_failed_chunk_is_retried_with_the_unsent_receivers(
+    newsletter_factory, user_factory, follow_factory, monkeypatch
+):
+    newsletter = newsletter_factory(receivers=newsletter_models.PROJECT)
+    users = _add_followers(newsletter.project, user_factory, follow_factory, 3)
+    dispatch = emails.NewsletterEmail.dispatch
+    failed = []
+
+    def fail_once(self, object, *args, **kwargs):
+        if kwargs["participant_ids"] == [users[1].pk] and not failed:
+            failed.append(users[1].pk)
+            raise ConnectionError()
+        return dispatch(self, object, *args, **kwargs)
+
+    monkeypatch.setattr(emails.NewsletterEmail, "dispatch", fail_once)
+    tasks.send_newsletter(newsletter.pk)
+
+    newsletter.refresh_from_db()
+    assert failed == [users[1].pk]
+    assert newsletter.sent_count == 3
+    assert newsletter.finished is not None
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(
+        user.email for user in users
+    )
+
+
+@pytest.mark.django_db
+def test_platform_newsletter_requires_superuser(
+    newsletter_factory, user_factory, monkeypatch
+):
+    stalled = timezone.now() - tasks.NEWSLETTER_RESUME_AFTER - timedelta(minutes=1)
+    newsletter = newsletter_factory(receivers=newsletter_models.PLATFORM, sent=stalled)
+    user_factory(get_newsletters=True)
+
+    tasks.send_newsletter(newsletter.pk)
+
+    newsletter.refresh_from_db()
+    assert newsletter.sent_count == 0
+    assert newsletter.finished is not None
+    assert len(mail.outbox) == 0
+
+    # the rejected newsletter is not resumed
+    resumed = []
+    monkeypatch.setattr(
+        tasks.send_newsletter, "delay", lambda *args: resumed.append(args)
+    )
+    tasks.resume_newsletters()
+    assert resumed == []
+
+
+@pytest.mark.django_db
+def test_stalled_newsletters_are_resumed(
+    newsletter_factory, user_factory, follow_factory
+):
+    stalled = timezone.now() - tasks.NEWSLETTER_RESUME_AFTER - timedelta(minutes=1)
+    newsletter = newsletter_factory(receivers=newsletter_models.PROJECT, sent=stalled)
+    users = _add_followers(newsletter.project, user_factory, follow_factory, 2)
+    running = newsletter_factory(receivers=newsletter_models.PROJECT, sent=stalled)
+    _add_followers(running.project, user_factory, follow_factory, 1)
+    newsletter_models.Newsletter.objects.filter(pk=newsletter.pk).update(
+        receiver_count=2,
+        sent_count=1,
+        last_receiver_id=users[0].pk,
+        progressed=stalled,
+    )
+    newsletter_models.Newsletter.objects.filter(pk=running.pk).update(
+        receiver_count=1, progressed=timezone.now()
+    )
+
+    tasks.resume_newsletters()
+
+    newsletter.refresh_from_db()
+    assert newsletter.sent_count == 2
+    assert newsletter.finished is not None
+    assert [message.to[0] for message in mail.outbox] == [users[1].email]
+    running.refresh_from_db()
+    assert running.sent_count == 0
+    assert running.finished is None
@@ -1,5 +1,6 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.core import mail
 from django.urls import reverse
 
 from adhocracy4.follows import models as follow_models
@@ -262,6 +263,33 @@ def test_limit_initiators_organisation_projects(client, project_factory):
     assert newsletter_models.Newsletter.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_initiator_cannot_send_to_platform(client, project, user_factory):
+    organisation = project.organisation
+    initiator = organisation.initiators.first()
+    user_factory(get_newsletters=True)
+
+    url = reverse(
+        "a4dashboard:newsletter-create", kwargs={"organisation_slug": organisation.slug}
+    )
+    client.login(username=initiator.email, password="password")
+
+    data = {
+        "sender_name": "Tester",
+        "sender": "test@test.de",
+        "subject": "Testsubject",
+        "body": "Testbody",
+        "receivers": newsletter_models.PLATFORM,
+        "organisation": organisation.pk,
+        "project": project.pk,
+        "send": "Send",
+    }
+    response = client.post(url, data)
+    assert response.status_code == 403
+    assert newsletter_models.Newsletter.objects.count() == 0
+    assert len(mail.outbox) == 0
+
+
 @pytest.mark.django_db
 def test_send_organisation_missing_alt_text(admin, client, project):
     organisation = project.organisation
@@ -6,9 +6,12 @@ from django.utils import timezone
 from adhocracy4.follows.models import Follow
 from apps.notifications.models import Notification
 from apps.notifications.models import NotificationType
+from apps.notifications.tasks import send_invite_notifications
 from apps.notifications.tasks import send_recently_completed_project_notifications
 from apps.notifications.tasks import send_recently_started_project_notifications
 from apps.notifications.tasks import send_upcoming_event_notifications
+from apps.projects import helpers
+from apps.projects.models import ModeratorInvite
 from tests.helpers import get_emails_for_address
 
 
@@ -183,3 +186,28 @@ def test_send_upcoming_event_notifications(
     assert len(follower_emails) == 1
     assert "event in project" in follower_emails[0].subject.lower()
     assert project.name.lower() in follower_emails[0].subject.lower()
+
+
+@pytest.mark.django_db
+def test_send_invite_notifications(project_factory, user_factory, user):
+    """Check if notifications are sent for bulk created invites."""
+    project = project_factory()
+    invited_user = user_factory()
+    emails = [invited_user.email, "unregistered@foo.bar"]
+    ModeratorInvite.objects.bulk_invite(
+        creator=user, project=project, emails=emails, site="example.com"
+    )
+    assert Notification.objects.count() == 0
+
+    assert helpers.get_invite_progress(ModeratorInvite, project.pk) == (0, 2)
+    sent = send_invite_notifications(
+        "a4_candy_projects.moderatorinvite", project.pk, emails
+    )
+    assert sent == 2
+
+    notification = Notification.objects.get(recipient=invited_user)
+    assert (
+        notification.notification_type == NotificationType.PROJECT_MODERATION_INVITATION
+    )
+    assert len(get_emails_for_address(invited_user.email)) == 1
+    assert helpers.get_invite_progress(ModeratorInvite, project.pk) is None
@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.organisations import cache
+from apps.organisations.models import Organisation
+
+
+def _organisation_queries(queries):
+    table = Organisation._meta.db_table
+    return [
+        query
+        for query in queries
+        if 'FROM "{}"'.format(table) in query["sql"]
+        and '"{}"."slug"'.format(table) in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_current_organisation_resolved_once(client, organisation):
+    url = reverse("organisation", kwargs={"organisation_slug": organisation.slug})
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.wsgi_request.organisation == organisation
+    assert response.context["ORGANISATION"] == organisation
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.wsgi_request.organisation == organisation
+    assert not _organisation_queries(queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_current_organisation_invalidated_on_save(client, organisation):
+    url = reverse("organisation", kwargs={"organisation_slug": organisation.slug})
+    client.get(url)
+
+    organisation.name = "renamed organisation"
+    organisation.save()
+    response = client.get(url)
+    assert response.wsgi_request.organisation.name == "renamed organisation"
+
+
+@pytest.mark.django_db
+def test_no_current_organisation(client):
+    response = client.get(reverse("wagtail_serve", args=[""]))
+    assert response.wsgi_request.organisation is None
+
+
+@pytest.mark.django_db
+def test_cached_organisations_are_not_shared(organisation):
+    first = cache.get_organisation_by_slug(organisation.slug)
+    first.name = "changed"
+    second = cache.get_organisation_by_slug(organisation.slug)
+    assert second == organisation
+    assert second is not first
+    assert second.name == organisation.name
+
+
+@pytest.mark.django_db
+def test_get_organisation(organisation):
+    with CaptureQueriesContext(connection) as queries:
+        assert cache.get_organisation(organisation.pk).name == organisation.name
+        assert cache.get_organisation(organisation.pk) == organisation
+    assert len(queries) == 1
+    assert cache.get_organisation(organisation.pk + 1) is None
+
+    organisation.name = "renamed organisation"
+    organisation.save()
+    assert cache.get_organisation(organisation.pk).name == "renamed organisation"
@@ -4,6 +4,8 @@ from django.urls import reverse
 from freezegun import freeze_time
 
 from adhocracy4.projects.enums import Access
+from adhocracy4.projects.models import Project
+from adhocracy4.test.helpers import freeze_phase
 
 
 @pytest.mark.django_db
@@ -194,3 +196,54 @@ def test_show_private_projects_members(
         assert semipublic in past_projects
         assert private not in past_projects
         assert project_headline == "Participate now!"
+
+
+@pytest.mark.django_db
+def test_anonymous_projects_fragment_cached(
+    client, project_factory, phase_factory, organisation
+):
+    public = project_factory(organisation=organisation, name="public project")
+    private = project_factory(
+        access=Access.PRIVATE, organisation=organisation, name="private project"
+    )
+    phase_factory(module__project=public)
+    phase_factory(module__project=private)
+
+    url = reverse("organisation", kwargs={"organisation_slug": organisation.slug})
+    response = client.get(url)
+    assert response.status_code == 200
+    assert "public project" in response.content.decode()
+    assert "private project" not in response.content.decode()
+
+    # changes without signals are not seen, the list is served from the cache
+    Project.objects.filter(pk=public.pk).update(name="renamed project")
+    response = client.get(url)
+    assert "public project" in response.content.decode()
+
+    public.refresh_from_db()
+    public.save()
+    response = client.get(url)
+    assert "public project" not in response.content.decode()
+    assert "renamed project" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_private_projects_invalidated_on_membership(
+    client, user, project_factory, phase_factory, organisation
+):
+    private = project_factory(access=Access.PRIVATE, organisation=organisation)
+    phase = phase_factory(module__project=private)
+
+    client.login(username=user, password="password")
+    url = reverse("organisation", kwargs={"organisation_slug": organisation.slug})
+    with freeze_phase(phase):
+        response = client.get(url)
+        assert private not in response.context["active_projects"]
+
+        private.participants.add(user)
+        response = client.get(url)
+        assert private in response.context["active_projects"]
+
+        private.participants.remove(user)
+        response = client.get(url)
+        assert private not in response.context["active_projects"]
@@ -3,13 +3,16 @@ import os
 import pytest
 from django.contrib.messages import get_messages
 from django.core import mail
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from adhocracy4.dashboard import components
 from adhocracy4.test.helpers import assert_template_response
 from adhocracy4.test.helpers import redirect_target
 from adhocracy4.test.helpers import setup_phase
 from apps.ideas.phases import CollectFeedbackPhase
+from apps.projects import views
 from apps.projects.models import ParticipantInvite
 
 component = components.projects.get("participants")
@@ -199,3 +202,36 @@ def test_anonymous_cannot_edit(client, phase_factory):
     response = client.get(url)
     assert response.status_code == 302
     assert redirect_target(response) == "account_login"
+
+
+@pytest.mark.django_db
+def test_invites_are_created_in_bulk(
+    client, monkeypatch, phase_factory, django_capture_on_commit_callbacks
+):
+    phase, module, project, idea = setup_phase(
+        phase_factory, None, CollectFeedbackPhase
+    )
+    queued = []
+    monkeypatch.setattr(
+        views.send_invite_notifications,
+        "delay",
+        lambda *args: queued.append(args),
+    )
+    url = component.get_base_url(project)
+    initiator = module.project.organisation.initiators.first()
+    client.login(username=initiator.email, password="password")
+
+    num_queries = []
+    for count in (2, 20):
+        emails = ["test{}-{}@foo.bar".format(count, i) for i in range(count)]
+        with django_capture_on_commit_callbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                client.post(url, {"add_users": ",".join(emails)})
+        num_queries.append(len(queries))
+    assert num_queries[0] == num_queries[1]
+    assert ParticipantInvite.objects.count() == 22
+    assert [len(args[2]) for args in queued] == [2, 20]
+    assert queued[0][:2] == ("a4_candy_projects.participantinvite", project.pk)
+
+    response = client.get(url)
+    assert response.context["invite_progress"] == (0, 22)
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from adhocracy4.api.dates import get_date_display
@@ -387,3 +389,77 @@ def test_retrieve_project_with_jwt_auth(
         apiclient.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
         response = apiclient.get(url)
     assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_app_project_api_num_queries(
+    user,
+    module_factory,
+    organisation_factory,
+    phase_factory,
+    project_factory,
+    apiclient,
+):
+    organisation = organisation_factory(enable_geolocation=True)
+    url = reverse("app-projects-list")
+    apiclient.force_authenticate(user=user)
+
+    project = project_factory(organisation=organisation)
+    phase = phase_factory(module__project=project)
+    with helpers.freeze_phase(phase):
+        with CaptureQueriesContext(connection) as single_project_queries:
+            response = apiclient.get(url, format="json")
+    assert len(response.data) == 1
+
+    for _ in range(199):
+        project = project_factory(organisation=organisation)
+        module = module_factory(project=project)
+        phase_factory(module=module)
+        phase_factory(
+            module=module,
+            start_date=phase.start_date,
+            end_date=phase.end_date,
+        )
+
+    with helpers.freeze_phase(phase):
+        with CaptureQueriesContext(connection) as many_projects_queries:
+            response = apiclient.get(url, format="json")
+    assert len(response.data) == 200
+    assert len(many_projects_queries) == len(single_project_queries)
+
+
+@pytest.mark.django_db
+def test_app_project_api_conditional_get(
+    user,
+    organisation_factory,
+    phase_factory,
+    project_factory,
+    apiclient,
+):
+    organisation = organisation_factory(enable_geolocation=True)
+    project = project_factory(organisation=organisation)
+    phase = phase_factory(module__project=project)
+    phase_factory(module__project=project)
+
+    url = reverse("app-projects-list")
+    apiclient.force_authenticate(user=user)
+    with helpers.freeze_phase(phase):
+        response = apiclient.get(url, format="json")
+        assert response.status_code == 200
+        assert len(response.data) == 1
+        etag = response["ETag"]
+        last_modified = response["Last-Modified"]
+
+        response = apiclient.get(url, format="json", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        response = apiclient.get(
+            url, format="json", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        assert response.status_code == 304
+
+        project.is_archived = True
+        project.save()
+        response = apiclient.get(url, format="json", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data == []
+        assert response["ETag"] != etag
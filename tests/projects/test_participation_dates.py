@@ -0,0 +1,43 @@
+import pytest
+from dateutil.parser import parse
+
+from apps.projects.models import ProjectParticipationDates
+
+
+@pytest.mark.django_db
+def test_participation_dates_follow_phases(project, module_factory, phase_factory):
+    dates = ProjectParticipationDates.objects.get(project=project)
+    assert dates.participation_start is None
+    assert dates.participation_end is None
+
+    module = module_factory(project=project)
+    phase = phase_factory(
+        module=module,
+        start_date=parse("2013-01-01 17:00:00 UTC"),
+        end_date=parse("2013-01-01 18:00:00 UTC"),
+    )
+    phase_factory(
+        module=module,
+        start_date=parse("2013-01-01 18:00:00 UTC"),
+        end_date=parse("2013-01-01 19:00:00 UTC"),
+    )
+    dates.refresh_from_db()
+    assert dates.participation_start == parse("2013-01-01 17:00:00 UTC")
+    assert dates.participation_end == parse("2013-01-01 19:00:00 UTC")
+
+    phase.delete()
+    dates.refresh_from_db()
+    assert dates.participation_start == parse("2013-01-01 18:00:00 UTC")
+
+    module.is_draft = True
+    module.save()
+    dates.refresh_from_db()
+    assert dates.participation_start is None
+    assert dates.participation_end is None
+
+
+@pytest.mark.django_db
+def test_participation_dates_deleted_with_project(project, phase_factory):
+    phase_factory(module__project=project)
+    project.delete()
+    assert not ProjectParticipationDates.objects.exists()
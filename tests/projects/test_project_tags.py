@@ -0,0 +1,66 @@
+import pytest
+
+from apps.projects.templatetags.a4_candy_project_tags import get_num_entries
+from apps.projects.templatetags.a4_candy_project_tags import get_project_stats
+
+
+@pytest.mark.django_db
+def test_get_project_stats(
+    user, module, idea_factory, topic_factory, poll_factory, vote_factory
+):
+    project = module.project
+    idea_factory(module=module, creator=user)
+    idea_factory(module=module, creator=user)
+    topic_factory(module=module)
+    poll = poll_factory(module=module)
+
+    assert get_project_stats(project) == {
+        "participants": 2,
+        "contributions": 4,
+        "modules": 1,
+    }
+
+    # the cached stats are invalidated when contributions are added
+    vote = vote_factory(choice__question__poll=poll, creator=user)
+    assert get_project_stats(project)["participants"] == 2
+    vote_factory(choice=vote.choice)
+    assert get_project_stats(project)["participants"] == 3
+
+    idea_factory(module=module)
+    assert get_project_stats(project) == {
+        "participants": 4,
+        "contributions": 5,
+        "modules": 1,
+    }
+
+
+@pytest.mark.django_db
+def test_get_num_entries(
+    django_assert_num_queries,
+    project,
+    module_factory,
+    idea_factory,
+    comment_factory,
+    live_question_factory,
+    like_factory,
+):
+    module_ideas = module_factory(project=project)
+    module_event = module_factory(project=project)
+    idea = idea_factory(module=module_ideas)
+    comment_factory(content_object=idea)
+    live_question = live_question_factory(module=module_event)
+    like_factory(livequestion=live_question, session="session-1")
+    like_factory(livequestion=live_question, session="session-2")
+
+    # the entries of all modules of the project are counted in one query
+    with django_assert_num_queries(1):
+        assert get_num_entries(module_ideas) == 2
+        assert get_num_entries(module_event) == 3
+
+    # new entries increase the cached counts
+    idea_factory(module=module_ideas)
+    with django_assert_num_queries(0):
+        assert get_num_entries(module_ideas) == 3
+
+    idea.delete()
+    assert get_num_entries(module_ideas) == 1
@@ -0,0 +1,52 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+
+from adhocracy4.projects.enums import Access
+from adhocracy4.projects.models import Project
+from apps.projects.query import filter_viewable
+
+
+@pytest.mark.django_db
+def test_filter_viewable(user, admin, member, project_factory, organisation_factory):
+    organisation = member.organisation
+    public = project_factory(organisation=organisation)
+    semipublic = project_factory(access=Access.SEMIPUBLIC, organisation=organisation)
+    private = project_factory(access=Access.PRIVATE, organisation=organisation)
+    other_organisation = organisation_factory()
+    other_private = project_factory(
+        access=Access.PRIVATE, organisation=other_organisation
+    )
+    projects = Project.objects.filter(
+        pk__in=[public.pk, semipublic.pk, private.pk, other_private.pk]
+    )
+
+    assert set(filter_viewable(projects, AnonymousUser())) == {public, semipublic}
+    assert set(filter_viewable(projects, user)) == {public, semipublic}
+    assert set(filter_viewable(projects, admin)) == {
+        public,
+        semipublic,
+        private,
+        other_private,
+    }
+    assert set(filter_viewable(projects, member.member)) == {
+        public,
+        semipublic,
+        private,
+    }
+
+    other_private.participants.add(user)
+    private.moderators.add(user)
+    assert set(filter_viewable(projects, user)) == {
+        public,
+        semipublic,
+        private,
+        other_private,
+    }
+
+    private.moderators.remove(user)
+    other_private.participants.remove(user)
+    other_organisation.initiators.add(user)
+    private.participants.add(user)
+    viewable = list(filter_viewable(projects, user))
+    # projects visible for several reasons are only returned once
+    assert len(viewable) == 4
@@ -1,8 +1,12 @@
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from apps.userdashboard.models import CommentReportCount
+
 
 @pytest.mark.django_db
 def test_anonymous_cannot_view_moderation_comments(apiclient, project):
@@ -244,3 +248,58 @@ def test_comment_not_modified_when_marked_read_or_unread(
     comment.refresh_from_db()
     assert not comment.is_reviewed
     assert not comment.modified
+
+
+@pytest.mark.django_db
+def test_moderation_comments_cursor_pagination(
+    apiclient, report_factory, comment_factory, idea
+):
+    comments = [comment_factory(content_object=idea) for i in range(5)]
+    report_factory(content_object=comments[3])
+    report_factory(content_object=comments[3])
+    report_factory(content_object=comments[1])
+    project = idea.project
+    moderator = project.moderators.first()
+    apiclient.login(username=moderator.email, password="password")
+    url = reverse("moderationcomments-list", kwargs={"project_pk": project.pk})
+
+    comment_pks = []
+    next_url = url + "?num_of_comments=2"
+    num_queries = []
+    while next_url:
+        with CaptureQueriesContext(connection) as queries:
+            response = apiclient.get(next_url)
+        num_queries.append(len(queries))
+        assert response.status_code == 200
+        assert len(response.data["results"]) <= 2
+        comment_pks += [comment["pk"] for comment in response.data["results"]]
+        next_url = response.data["next"]
+
+    assert comment_pks == [
+        comments[3].pk,
+        comments[1].pk,
+        comments[4].pk,
+        comments[2].pk,
+        comments[0].pk,
+    ]
+    assert len(set(num_queries)) == 1
+
+    response = apiclient.get(url + "?num_of_comments=2&cursor=invalid")
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_report_count_is_maintained(report_factory, comment_factory, idea):
+    comment = comment_factory(content_object=idea)
+    report = report_factory(content_object=comment)
+    report_factory(content_object=comment)
+    assert CommentReportCount.objects.get(comment=comment).report_count == 2
+
+    report.delete()
+    assert CommentReportCount.objects.get(comment=comment).report_count == 1
+
+
+@pytest.mark.django_db
+def test_report_count_is_created_with_comment(comment_factory, idea):
+    comment = comment_factory(content_object=idea)
+    assert CommentReportCount.objects.get(comment=comment).report_count == 0
@@ -2,6 +2,8 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 
+from apps.users import cache
+
 
 @pytest.mark.django_db
 def test_allowed_methods(apiclient, user):
@@ -66,3 +68,19 @@ def test_is_self(apiclient, admin, user):
     assert response.status_code == status.HTTP_200_OK
     assert "is_self" in response.data
     assert response.data["is_self"]
+
+
+@pytest.mark.django_db
+def test_user_image_thumbnail_is_cached(
+    apiclient, user_factory, image_png, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        user = user_factory(_avatar=image_png)
+    url = reverse("users-detail", kwargs={"pk": user.pk})
+    apiclient.login(username=user.email, password="password")
+
+    response = apiclient.get(url, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    # the original image is still served as user_image
+    assert response.data["user_image"].endswith(user._avatar.url)
+    assert response.data["user_image_thumbnail"].endswith(cache.get_avatar_url(user))
@@ -0,0 +1,35 @@
+import pytest
+from django.core.cache import cache as django_cache
+from easy_thumbnails.files import get_thumbnailer
+
+from apps.users import cache
+
+
+@pytest.mark.django_db
+def test_avatar_url_is_generated_on_upload(
+    user_factory, image_png, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        user = user_factory(_avatar=image_png)
+    # tasks run eagerly in the tests
+    assert cache.has_avatar_url(user)
+    thumbnail_url = get_thumbnailer(user._avatar)["avatar"].url
+    assert cache.get_avatar_url(user) == thumbnail_url
+
+
+@pytest.mark.django_db
+def test_avatar_url_without_avatar(user):
+    assert cache.get_avatar_url(user) is None
+
+
+@pytest.mark.django_db
+def test_avatar_url_falls_back_to_image(user_factory, image_png, monkeypatch):
+    user = user_factory(_avatar=image_png)
+    django_cache.clear()
+    scheduled = []
+    monkeypatch.setattr(
+        "apps.users.tasks.generate_avatar_thumbnail.delay", scheduled.append
+    )
+    assert cache.get_avatar_url(user) == user._avatar.url
+    assert cache.get_avatar_url(user) == user._avatar.url
+    assert scheduled == [user.pk]
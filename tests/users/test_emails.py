@@ -0,0 +1,62 @@
+import pytest
+from django.core import mail
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.users.emails import EmailAplus
+from apps.users.models import User
+
+
+class ReceiversEmail(EmailAplus):
+    def get_organisation(self):
+        return None
+
+
+@pytest.mark.django_db
+def test_receiver_languages_are_loaded_once(user_factory, settings):
+    settings.DEFAULT_USER_LANGUAGE_CODE = "en"
+    users = [user_factory(language=language) for language in ["de", "en", "de"]]
+    receivers = [user.email for user in users] + ["unknown@example.com"]
+    email = ReceiversEmail()
+
+    with CaptureQueriesContext(connection) as queries:
+        email._receiver_languages = email._load_receiver_languages(receivers)
+        languages = [email.get_receiver_language(receiver) for receiver in receivers]
+        assert email.get_receiver_language(receivers[0]) == "de"
+    assert languages == ["de", "en", "de", "en"]
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db
+def test_receiver_language_outside_dispatch(user_factory):
+    user = user_factory(language="de")
+    email = ReceiversEmail()
+    assert email.get_receiver_language(user.email) == "de"
+
+
+@pytest.mark.django_db
+def test_user_receivers_are_not_looked_up(user_factory):
+    user_factory()
+    email = ReceiversEmail()
+    with CaptureQueriesContext(connection) as queries:
+        assert email._load_receiver_languages(User.objects.all()) == {}
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_receivers_are_loaded_once_per_dispatch(user_factory):
+    class CountingEmail(ReceiversEmail):
+        template_name = "a4_candy_account/emails/account_deleted"
+        calls = 0
+
+        def get_receivers(self):
+            self.calls += 1
+            return [self.object.email]
+
+    user = user_factory(language="de")
+    email = CountingEmail()
+    email.dispatch(user)
+    email.dispatch(user)
+    assert email.calls == 2
+    assert len(mail.outbox) == 2
+    assert mail.outbox[0].to == [user.email]
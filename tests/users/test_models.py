@@ -1,8 +1,12 @@
 import os
 
 import pytest
+from dateutil.parser import parse
 from django.conf import settings
+from freezegun import freeze_time
 
+from adhocracy4.projects.enums import Access
+from adhocracy4.test.factories.follows import FollowFactory
 from adhocracy4.test.helpers import create_thumbnail
 
 
@@ -49,3 +53,45 @@ def test_short_name(user):
 @pytest.mark.django_db
 def test_full_name(user):
     assert user.get_full_name() == ("%s <%s>" % (user.username, user.email)).strip()
+
+
+@pytest.mark.django_db
+def test_get_projects_follow_list(user, phase_factory, project_factory):
+    project_active = project_factory()
+    project_future = project_factory(access=Access.PRIVATE)
+    project_past = project_factory()
+    project_not_followed = project_factory()
+
+    phase_factory(
+        module__project=project_active,
+        start_date=parse("2013-01-01 17:10:00 UTC"),
+        end_date=parse("2013-01-01 19:05:00 UTC"),
+    )
+    phase_factory(
+        module__project=project_future,
+        start_date=parse("2013-01-01 19:05:00 UTC"),
+        end_date=parse("2013-01-01 20:00:00 UTC"),
+    )
+    phase_factory(
+        module__project=project_past,
+        start_date=parse("2013-01-01 14:50:00 UTC"),
+        end_date=parse("2013-01-01 17:00:00 UTC"),
+    )
+    phase_factory(
+        module__project=project_not_followed,
+        start_date=parse("2013-01-01 17:10:00 UTC"),
+        end_date=parse("2013-01-01 19:05:00 UTC"),
+    )
+    for project in [project_past, project_future, project_active]:
+        FollowFactory(creator=user, project=project)
+
+    with freeze_time(parse("2013-01-01 18:00:00 UTC")):
+        assert list(user.get_projects_follow_list()) == [
+            project_active,
+            project_future,
+            project_past,
+        ]
+        assert list(user.get_projects_follow_list(exclude_private_projects=True)) == [
+            project_active,
+            project_past,
+        ]
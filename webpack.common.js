@@ -99,6 +99,16 @@ module.exports = {
       ],
       dependOn: 'adhocracy4'
     },
+    a4maps_display_geojson: {
+      import: [
+        'leaflet/dist/leaflet.css',
+        'maplibre-gl/dist/maplibre-gl.css',
+        'leaflet.markercluster/dist/MarkerCluster.css',
+        'leaflet.markercluster/dist/MarkerCluster.Default.css',
+        './apps/maps/assets/map_display_geojson.js'
+      ],
+      dependOn: 'adhocracy4'
+    },
     a4maps_choose_point: {
       import: [
         'leaflet/dist/leaflet.css',